@@ -0,0 +1,45 @@
+"""add jobs notify trigger for worker wake-up
+
+Revision ID: 20261016_0900
+Revises: 20251225_2130, 20251226_0800
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_0900"
+down_revision: Union[str, Sequence[str], None] = ("20251225_2130", "20251226_0800")
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Notify the jobs_pending channel whenever a job becomes pending."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_job_pending() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('jobs_pending', NEW.id::text);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER jobs_notify_pending
+        AFTER INSERT OR UPDATE OF status ON jobs
+        FOR EACH ROW WHEN (NEW.status = 'PENDING')
+        EXECUTE FUNCTION notify_job_pending()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the jobs notify trigger and its function."""
+    op.execute("DROP TRIGGER IF EXISTS jobs_notify_pending ON jobs")
+    op.execute("DROP FUNCTION IF EXISTS notify_job_pending()")
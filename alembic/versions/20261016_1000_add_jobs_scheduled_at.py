@@ -0,0 +1,28 @@
+"""add scheduled_at to jobs for delayed retries
+
+Revision ID: 20261016_1000
+Revises: 20261016_0900
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_1000"
+down_revision: Union[str, None] = "20261016_0900"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add jobs.scheduled_at."""
+    op.add_column("jobs", sa.Column("scheduled_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop jobs.scheduled_at."""
+    op.drop_column("jobs", "scheduled_at")
@@ -0,0 +1,31 @@
+"""add result_in_file to jobs for offloaded results
+
+Revision ID: 20261016_1030
+Revises: 20261016_1000
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_1030"
+down_revision: Union[str, None] = "20261016_1000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add jobs.result_in_file."""
+    op.add_column(
+        "jobs",
+        sa.Column("result_in_file", sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+
+
+def downgrade() -> None:
+    """Drop jobs.result_in_file."""
+    op.drop_column("jobs", "result_in_file")
@@ -0,0 +1,33 @@
+"""add (status, due time) index on jobs for the worker claim query
+
+Revision ID: 20261016_1100
+Revises: 20261016_1030
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_1100"
+down_revision: Union[str, None] = "20261016_1030"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ix_jobs_status_due_at."""
+    op.create_index(
+        "ix_jobs_status_due_at",
+        "jobs",
+        ["status", sa.text("coalesce(scheduled_at, created_at)")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop ix_jobs_status_due_at."""
+    op.drop_index("ix_jobs_status_due_at", table_name="jobs")
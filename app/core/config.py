@@ -83,6 +83,7 @@ class Settings(BaseSettings):
 
     Application Settings:
         app_name: Display name for the application
+        app_url: Public base URL of the application (used in email links)
         environment: Current environment (development, staging, production)
         debug: Enable debug mode (more verbose logging, error details)
         api_prefix: URL prefix for all API routes (e.g., "/api")
@@ -110,6 +111,9 @@ class Settings(BaseSettings):
         smtp_port: Email server port
         smtp_user: Email authentication username
         smtp_password: Email authentication password
+        smtp_max_concurrency: Maximum concurrent SMTP connections (and parallel sends)
+        smtp_rate_per_sec: Sustained email send rate
+        smtp_burst: Emails that may be sent back-to-back before the rate applies
 
     File Upload Settings:
         max_upload_size_mb: Maximum allowed file upload size in MB
@@ -148,6 +152,12 @@ class Settings(BaseSettings):
     )
     """Application name shown in logs, API docs, and responses."""
 
+    app_url: str = Field(
+        default="http://localhost:8123",
+        description="Public base URL of the application",
+    )
+    """Base URL that links in notification emails point to."""
+
     environment: str = Field(
         default="development",
         description="Current environment: development, staging, or production",
@@ -377,6 +387,30 @@ class Settings(BaseSettings):
     )
     """Password for SMTP authentication. Keep this secret!"""
 
+    smtp_max_concurrency: int = Field(
+        default=4,
+        description="Maximum concurrent SMTP connections",
+    )
+    """
+    Size of the SMTP connection pool, and how many emails are sent in parallel.
+    Keep at or below the server's per-client connection limit.
+    """
+
+    smtp_rate_per_sec: float = Field(
+        default=1.0,
+        description="Sustained email send rate (emails per second)",
+    )
+    """
+    Long-run cap on outgoing email, to stay under the SMTP provider's sending
+    limits (bursts above it get 421 responses or the sender blocklisted).
+    """
+
+    smtp_burst: int = Field(
+        default=30,
+        description="Emails that may be sent at once before smtp_rate_per_sec applies",
+    )
+    """Burst allowance: idle capacity accumulates up to this many emails."""
+
     @property
     def unstract_api_key(self) -> str:
         """Alias for llmwhisperer_api_key for compatibility."""
@@ -97,7 +97,7 @@ class DetectionResultSchema(BaseModel):
 class DocumentWithResults(DocumentSchema):
     """Schema for document with detection results."""
 
-    detection_results: list[DetectionResultSchema] = []
+    detection_results: list[DetectionResultSchema] = Field(default_factory=list)
 
     model_config = {"from_attributes": True}
 
@@ -17,13 +17,16 @@ client = TestClient(app)
 class TestUploadEndpoint:
     """Tests for document upload endpoint."""
 
-    def test_upload_pdf_success(self):
+    def test_upload_pdf_success(self, tmp_path):
         """Test successful PDF upload."""
         # Create a mock PDF file
         pdf_content = b"%PDF-1.4 mock content"
         files = {"file": ("test.pdf", BytesIO(pdf_content), "application/pdf")}
 
-        with patch("app.detection.routes.DetectionService") as mock_service:
+        with (
+            patch("app.detection.routes.UPLOAD_DIR", tmp_path),
+            patch("app.detection.routes.DetectionService") as mock_service,
+        ):
             now = datetime.now(UTC)
             mock_doc = Document(
                 id=1,
@@ -46,6 +49,7 @@ class TestUploadEndpoint:
             data = response.json()
             assert data["success"] is True
             assert "test.pdf" in data["message"]
+            assert [p.read_bytes() for p in tmp_path.glob("*_test.pdf")] == [pdf_content]
 
     def test_upload_invalid_file_type(self):
         """Test upload with invalid file type."""
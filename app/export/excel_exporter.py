@@ -16,6 +16,9 @@ from app.schemas.base_schema import BaseFinancialSchema, ExcelLayoutConfig
 
 logger = logging.getLogger(__name__)
 
+# 4-digit year in a period label, e.g. "Year Ended January 30, 2022"
+_YEAR_RE = re.compile(r"(\d{4})")
+
 
 class SchemaBasedExcelExporter:
     """Generic Excel exporter that uses schema layout configuration."""
@@ -177,6 +180,16 @@ class SchemaBasedExcelExporter:
         """Add data rows based on the schema type."""
         current_row = start_row
 
+        # Year of each period column, e.g. ("B", "2022") for "Year Ended 2022";
+        # computed once per sheet rather than per cell
+        column_years = [
+            (
+                get_column_letter(mapping.excel_column_index),
+                self._extract_year_from_period(mapping.main_header),
+            )
+            for mapping in layout_config.column_mappings
+        ]
+
         # Handle different schema types
         if hasattr(schema_instance, "equity_rows"):
             # Shareholders equity schema
@@ -228,24 +241,7 @@ class SchemaBasedExcelExporter:
 
                 # Add values for each period - match by year instead of sequential order
                 if hasattr(item, "values") and item.values:
-                    # Match each value to the correct column by extracting year from period keys
-                    for mapping in layout_config.column_mappings:
-                        col_letter = get_column_letter(mapping.excel_column_index)
-
-                        # Extract year from column header (e.g., "Year Ended 2022" -> "2022")
-                        header_year = self._extract_year_from_period(mapping.main_header)
-
-                        # Find matching value by year
-                        matched_value = None
-                        for period_key, value in item.values.items():
-                            period_year = self._extract_year_from_period(period_key)
-                            if period_year == header_year:
-                                matched_value = value
-                                break
-
-                        # Set the value in the correct column
-                        if matched_value is not None and matched_value != "":
-                            self.worksheet[col_letter + str(current_row)].value = matched_value
+                    self._add_period_values(item.values, column_years, current_row)
 
                 current_row += 1
 
@@ -265,24 +261,7 @@ class SchemaBasedExcelExporter:
 
                 # Add values for each period - match by year instead of sequential order
                 if hasattr(item, "values") and item.values:
-                    # Match each value to the correct column by extracting year from period keys
-                    for mapping in layout_config.column_mappings:
-                        col_letter = get_column_letter(mapping.excel_column_index)
-
-                        # Extract year from column header (e.g., "Year Ended 2022" -> "2022")
-                        header_year = self._extract_year_from_period(mapping.main_header)
-
-                        # Find matching value by year
-                        matched_value = None
-                        for period_key, value in item.values.items():
-                            period_year = self._extract_year_from_period(period_key)
-                            if period_year == header_year:
-                                matched_value = value
-                                break
-
-                        # Set the value in the correct column
-                        if matched_value is not None and matched_value != "":
-                            self.worksheet[col_letter + str(current_row)].value = matched_value
+                    self._add_period_values(item.values, column_years, current_row)
 
                 current_row += 1
 
@@ -393,12 +372,30 @@ class SchemaBasedExcelExporter:
 
         return current_row
 
+    def _add_period_values(
+        self, values: dict[str, str], column_years: list[tuple[str, str]], row: int
+    ) -> None:
+        """Write a line item's values into the period columns whose year matches.
+
+        Args:
+            values: Line item values keyed by period label
+            column_years: (column letter, year) of each period column
+            row: Worksheet row to write to
+        """
+        # Index the values by year once per row (the first period with a year wins)
+        values_by_year: dict[str, str] = {}
+        for period_key, value in values.items():
+            values_by_year.setdefault(self._extract_year_from_period(period_key), value)
+
+        for col_letter, header_year in column_years:
+            matched_value = values_by_year.get(header_year)
+            if matched_value is not None and matched_value != "":
+                self.worksheet[col_letter + str(row)].value = matched_value
+
     def _extract_year_from_period(self, period_string: str) -> str:
         """Extract year from period string like 'Year Ended 2022' or 'Year Ended January 30, 2022'."""
-        import re
-
         # Look for 4-digit year in the string
-        year_match = re.search(r"(\d{4})", period_string)
+        year_match = _YEAR_RE.search(period_string)
         return year_match.group(1) if year_match else ""
 
     def _apply_formatting(self, layout_config: ExcelLayoutConfig) -> None:
@@ -0,0 +1 @@
+"""Tests for export module."""
@@ -0,0 +1,30 @@
+"""Tests for the schema-based Excel exporter."""
+
+from openpyxl import load_workbook
+
+from app.export import SchemaBasedExcelExporter
+from app.schemas import IncomeStatementLineItem, IncomeStatementSchema
+
+
+def test_values_matched_to_columns_by_year(tmp_path):
+    """Test line item values land in the column whose period has the same year."""
+    statement = IncomeStatementSchema(
+        company_name="Acme Corp",
+        document_title="Statements of Income",
+        reporting_periods=["Year Ended Jan 30, 2024", "Year Ended Jan 31, 2023"],
+        line_items=[
+            # Value keys differ from the headers and are not in column order
+            IncomeStatementLineItem(
+                account_name="Revenue", values={"2023": "900", "2024": "1,000"}
+            ),
+            IncomeStatementLineItem(account_name="Other income", values={"FY2024": "5"}),
+        ],
+    )
+    path = tmp_path / "statement.xlsx"
+
+    SchemaBasedExcelExporter().export_to_excel(statement, str(path))
+
+    sheet = load_workbook(path).active
+    rows = {row[0]: row[1:3] for row in sheet.iter_rows(min_col=1, max_col=3, values_only=True)}
+    assert rows["Revenue"] == ("1,000", "900")
+    assert rows["Other income"] == ("5", None)
@@ -15,6 +15,39 @@ from app.schemas.income_statement_schema import IncomeStatementLineItem, IncomeS
 logger = logging.getLogger(__name__)
 
 
+def _keyword_pattern(*keywords: str) -> re.Pattern[str]:
+    """Compile keywords into one case-insensitive substring alternation."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+# Account name keyword sets, each matched in a single regex scan
+_REVENUE_KEYWORDS = _keyword_pattern("revenue", "sales")
+_EXPENSE_KEYWORDS = _keyword_pattern(
+    "cost",
+    "expense",
+    "research and development",
+    "sales, general",
+    "operating expenses",
+    "interest expense",
+    "tax expense",
+)
+_OPEX_SUB_ITEM_KEYWORDS = _keyword_pattern("research and development", "sales, general")
+_SHARE_CLASS_KEYWORDS = _keyword_pattern("basic", "diluted")
+_SECTION_HEADER_KEYWORDS = _keyword_pattern(
+    "operating expenses",
+    "net income per share:",
+    "weighted average shares used in per share computation:",
+)
+_TOTAL_KEYWORDS = _keyword_pattern("total operating expenses", "total other income", "total")
+_CALCULATED_KEYWORDS = _keyword_pattern(
+    "total",
+    "gross profit",
+    "income from operations",
+    "income before",
+    "net income",
+)
+
+
 def parse_income_statement_directly(raw_text_file_path: str) -> IncomeStatementSchema:
     """
     Parse income statement directly from raw LLMWhisperer text.
@@ -39,10 +72,17 @@ def parse_income_statement_directly(raw_text_file_path: str) -> IncomeStatementS
     # Parse the table data
     line_items = parse_table_data(raw_text, reporting_periods)
 
-    # Categorize line items
-    revenue_items = [item for item in line_items if item.account_category == "revenue"]
-    expense_items = [item for item in line_items if item.account_category == "expense"]
-    net_income_items = [item for item in line_items if "net income" in item.account_name.lower()]
+    # Categorize line items in one pass
+    revenue_items = []
+    expense_items = []
+    net_income_items = []
+    for item in line_items:
+        if item.account_category == "revenue":
+            revenue_items.append(item)
+        elif item.account_category == "expense":
+            expense_items.append(item)
+        if "net income" in item.account_name_lower:
+            net_income_items.append(item)
 
     logger.debug(f"Extracted {len(line_items)} line items")
     logger.debug(f"Found {len(revenue_items)} revenue items")
@@ -244,25 +284,12 @@ def clean_value(value: str) -> str:
 
 def categorize_account(account_name: str) -> str:
     """Categorize account into revenue, expense, or income."""
-    name_lower = account_name.lower()
-
     # Revenue items
-    if any(keyword in name_lower for keyword in ["revenue", "sales"]):
+    if _REVENUE_KEYWORDS.search(account_name):
         return "revenue"
 
     # Expense items
-    if any(
-        keyword in name_lower
-        for keyword in [
-            "cost",
-            "expense",
-            "research and development",
-            "sales, general",
-            "operating expenses",
-            "interest expense",
-            "tax expense",
-        ]
-    ):
+    if _EXPENSE_KEYWORDS.search(account_name):
         return "expense"
 
     # Income items (everything else)
@@ -295,10 +322,8 @@ def determine_indent_level_with_context(account_name: str, current_section: str)
 
 def determine_indent_level(account_name: str, _raw_text: str) -> int:
     """Legacy function - determine indentation level based on context."""
-    name_lower = account_name.lower()
-
     # Sub-items under operating expenses
-    if any(keyword in name_lower for keyword in ["research and development", "sales, general"]):
+    if _OPEX_SUB_ITEM_KEYWORDS.search(account_name):
         return 1
 
     # Main level items
@@ -307,15 +332,7 @@ def determine_indent_level(account_name: str, _raw_text: str) -> int:
 
 def is_section_header_account(account_name: str) -> bool:
     """Check if account is a section header (items that group other items but have no values)."""
-    name_lower = account_name.lower()
-    return any(
-        keyword in name_lower
-        for keyword in [
-            "operating expenses",
-            "net income per share:",
-            "weighted average shares used in per share computation:",
-        ]
-    )
+    return _SECTION_HEADER_KEYWORDS.search(account_name) is not None
 
 
 def get_parent_section_with_context(_account_name: str, current_section: str) -> str:
@@ -342,10 +359,10 @@ def get_parent_section(account_name: str) -> str:
     """Legacy function - Get parent section for categorization."""
     name_lower = account_name.lower()
 
-    if any(keyword in name_lower for keyword in ["research and development", "sales, general"]):
+    if _OPEX_SUB_ITEM_KEYWORDS.search(name_lower):
         return "Operating expenses"
 
-    if any(keyword in name_lower for keyword in ["basic", "diluted"]) and "share" in name_lower:
+    if _SHARE_CLASS_KEYWORDS.search(name_lower) and "share" in name_lower:
         if "per share" in name_lower:
             return "Net income per share"
         else:
@@ -356,26 +373,12 @@ def get_parent_section(account_name: str) -> str:
 
 def is_total_line_that_resets_context(account_name: str) -> bool:
     """Check if this is a total line that should reset section context."""
-    name_lower = account_name.lower()
-    return any(
-        keyword in name_lower
-        for keyword in ["total operating expenses", "total other income", "total"]
-    )
+    return _TOTAL_KEYWORDS.search(account_name) is not None
 
 
 def is_calculated_field(account_name: str) -> bool:
     """Check if field is calculated (totals, etc.)."""
-    name_lower = account_name.lower()
-    return any(
-        keyword in name_lower
-        for keyword in [
-            "total",
-            "gross profit",
-            "income from operations",
-            "income before",
-            "net income",
-        ]
-    )
+    return _CALCULATED_KEYWORDS.search(account_name) is not None
 
 
 if __name__ == "__main__":
@@ -206,7 +206,7 @@ class ExtractedStatementSchema(BaseModel):
 class ExtractedStatementWithLineItems(ExtractedStatementSchema):
     """Schema for extracted statement with line items."""
 
-    line_items: list[ExtractedLineItemSchema] = []
+    line_items: list[ExtractedLineItemSchema] = Field(default_factory=list)
 
     model_config = {"from_attributes": True}
 
@@ -277,6 +277,6 @@ class ExtractionJobSchema(BaseModel):
 class ExtractionJobWithStatements(ExtractionJobSchema):
     """Schema for extraction job with extracted statements."""
 
-    extracted_statements: list[ExtractedStatementSchema] = []
+    extracted_statements: list[ExtractedStatementSchema] = Field(default_factory=list)
 
     model_config = {"from_attributes": True}
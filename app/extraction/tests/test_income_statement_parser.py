@@ -0,0 +1,71 @@
+"""Tests for the direct income statement parser."""
+
+import pytest
+
+from app.extraction.parsers.income_statement_parser import (
+    categorize_account,
+    is_calculated_field,
+    is_section_header_account,
+    is_total_line_that_resets_context,
+    parse_income_statement_directly,
+)
+
+RAW_TEXT = """
+| | January 28, 2024 | January 29, 2023 |
+| Revenue | $ 60,922 | $ 26,974 |
+| Cost of revenue | 16,621 | 11,618 |
+| Gross profit | 44,301 | 15,356 |
+| Operating expenses | | |
+| Research and development | 8,675 | 7,339 |
+| Sales, general and administrative | 2,654 | 2,440 |
+| Total operating expenses | 11,329 | 9,779 |
+| Net income | $ 29,760 | $ 4,368 |
+"""
+
+
+@pytest.mark.parametrize(
+    ("account_name", "category"),
+    [
+        ("Revenue", "revenue"),
+        ("Net SALES", "revenue"),
+        ("Sales, general and administrative", "revenue"),
+        ("Cost of revenue", "revenue"),
+        ("Research and Development", "expense"),
+        ("Income tax expense", "expense"),
+        ("Net income", "income"),
+    ],
+)
+def test_categorize_account(account_name, category):
+    """Test keyword categorization is case-insensitive and checks revenue first."""
+    assert categorize_account(account_name) == category
+
+
+def test_keyword_checks():
+    """Test section header, total line, and calculated field detection."""
+    assert is_section_header_account("Operating Expenses")
+    assert not is_section_header_account("Net income per share")
+    assert is_total_line_that_resets_context("TOTAL other income")
+    assert is_calculated_field("Income before income tax")
+    assert not is_calculated_field("Research and development")
+
+
+def test_parse_categorizes_items(tmp_path):
+    """Test parsed line items are split into revenue, expense, and net income lists."""
+    raw_path = tmp_path / "income_statement_raw.txt"
+    raw_path.write_text(RAW_TEXT, encoding="utf-8")
+
+    statement = parse_income_statement_directly(str(raw_path))
+
+    assert statement.reporting_periods == [
+        "Year Ended January 28, 2024",
+        "Year Ended January 29, 2023",
+    ]
+    assert [i.account_name for i in statement.revenue_items] == [
+        "Revenue",
+        "Cost of revenue",
+        "Sales, general and administrative",
+    ]
+    # "Total operating expenses" matches the section header keywords, not an expense
+    assert [i.account_name for i in statement.expense_items] == ["Research and development"]
+    assert [i.account_name for i in statement.net_income_items] == ["Net income"]
+    assert statement.get_net_income("Year Ended January 28, 2024") == "$ 29,760"
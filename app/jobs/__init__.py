@@ -3,7 +3,7 @@
 from app.jobs.models import Job, JobStatus, JobType
 from app.jobs.routes import router
 from app.jobs.service import JobService, JobServiceError
-from app.jobs.tasks import TASK_REGISTRY, register_task
+from app.jobs.tasks import TASK_REGISTRY, get_task, register_task
 from app.jobs.worker import BackgroundWorker, WorkerError, get_worker
 
 __all__ = [
@@ -16,6 +16,7 @@ __all__ = [
     "WorkerError",
     "get_worker",
     "TASK_REGISTRY",
+    "get_task",
     "register_task",
     "router",
 ]
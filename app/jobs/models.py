@@ -3,12 +3,27 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    false,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
 from app.shared.models import TimestampMixin
 
+# Channel the jobs trigger notifies on whenever a job becomes pending
+JOBS_PENDING_CHANNEL = "jobs_pending"
+
 
 class JobStatus(enum.Enum):
     """Job status enum."""
@@ -45,9 +60,15 @@ class Job(Base, TimestampMixin):
     task_name: Mapped[str] = mapped_column(String(255), nullable=False)
     task_args: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON string
     result: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON string
+    # Set when an oversize result was written to the job's result file instead of `result`
+    result_in_file: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default=false()
+    )
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Earliest time a pending job may be claimed (set when backing off a retry)
+    scheduled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     progress: Mapped[int] = mapped_column(Integer, default=0)  # 0-100
     retries: Mapped[int] = mapped_column(Integer, default=0)
     max_retries: Mapped[int] = mapped_column(Integer, default=3)
@@ -55,3 +76,37 @@ class Job(Base, TimestampMixin):
     def __repr__(self) -> str:
         """String representation."""
         return f"<Job(id={self.id}, type={self.job_type.value}, status={self.status.value})>"
+
+
+# Serves the worker's claim query: equality on status, then ordered by due time, so
+# PENDING jobs come off the index in order and LIMIT stops the scan without a sort.
+Index("ix_jobs_status_due_at", Job.status, func.coalesce(Job.scheduled_at, Job.created_at))
+
+# Wake idle workers via LISTEN/NOTIFY when a job is queued or re-queued for retry.
+# Mirrors the alembic migration so tables built with create_all get the trigger too.
+event.listen(
+    Job.__table__,
+    "after_create",
+    DDL(  # type: ignore[no-untyped-call]  # SQLAlchemy leaves DDL.__init__ unannotated
+        f"""
+        CREATE OR REPLACE FUNCTION notify_job_pending() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{JOBS_PENDING_CHANNEL}', NEW.id::text);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Job.__table__,
+    "after_create",
+    DDL(  # type: ignore[no-untyped-call]  # SQLAlchemy leaves DDL.__init__ unannotated
+        """
+        CREATE TRIGGER jobs_notify_pending
+        AFTER INSERT OR UPDATE OF status ON jobs
+        FOR EACH ROW WHEN (NEW.status = 'PENDING')
+        EXECUTE FUNCTION notify_job_pending()
+        """
+    ).execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,95 @@
+"""Storage for job results, offloading oversize results to files."""
+
+import contextlib
+from pathlib import Path
+from typing import Any
+
+import aiofiles
+import aiofiles.os
+from pydantic_core import to_json
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Results larger than this are written to a file instead of jobs.result
+RESULT_INLINE_LIMIT = 64 * 1024
+
+
+class ResultFileMissingError(Exception):
+    """An offloaded job result's file no longer exists."""
+
+    pass
+
+
+def _result_path(job_id: int) -> Path:
+    """Get the file an offloaded job result is written to."""
+    return Path(settings.cache_dir) / "job_results" / f"{job_id}.json"
+
+
+async def store_result(job_id: int, result: Any) -> tuple[str | None, bool]:
+    """Serialize a task result for the jobs.result column.
+
+    Small results are stored inline. Results over RESULT_INLINE_LIMIT bytes are
+    written to ``{cache_dir}/job_results/{job_id}.json``; the column is then left
+    empty and jobs.result_in_file records where the result lives.
+
+    Args:
+        job_id: ID of the job that produced the result
+        result: JSON-serializable task result
+
+    Returns:
+        Tuple of (value to store in jobs.result, value for jobs.result_in_file)
+    """
+    if not result:
+        return None, False
+
+    serialized = to_json(result)
+    if len(serialized) <= RESULT_INLINE_LIMIT:
+        return serialized.decode(), False
+
+    path = _result_path(job_id)
+    await aiofiles.os.makedirs(path.parent, exist_ok=True)
+    async with aiofiles.open(path, "wb") as f:
+        await f.write(serialized)
+
+    return None, True
+
+
+async def load_result(job_id: int, stored: str | None, in_file: bool) -> str | None:
+    """Resolve a job's stored result to the result JSON.
+
+    Args:
+        job_id: ID of the job
+        stored: Value of jobs.result
+        in_file: Value of jobs.result_in_file
+
+    Returns:
+        Result JSON string, or None if the job has no result
+
+    Raises:
+        ResultFileMissingError: If the result was offloaded and its file is gone
+    """
+    if not in_file:
+        return stored
+
+    try:
+        async with aiofiles.open(_result_path(job_id), encoding="utf-8") as f:
+            content: str = await f.read()
+    except FileNotFoundError as e:
+        raise ResultFileMissingError(f"Result file for job {job_id} is missing") from e
+    return content
+
+
+async def discard_result(job_id: int, in_file: bool) -> None:
+    """Remove a job's offloaded result file, if any.
+
+    Args:
+        job_id: ID of the job
+        in_file: Value of jobs.result_in_file
+    """
+    if not in_file:
+        return
+
+    with contextlib.suppress(FileNotFoundError):
+        await aiofiles.os.remove(_result_path(job_id))
@@ -5,18 +5,26 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.jobs.models import JobStatus, JobType
+from app.jobs.results import ResultFileMissingError, load_result
 from app.jobs.schemas import JobCreate, JobSchema, JobSummary, JobUpdate
 from app.jobs.service import JobService, JobServiceError
-from app.shared.schemas import BaseResponse
+from app.jobs.worker import get_worker
+from app.shared.responses import EnvelopeResponse
+from app.shared.schemas import DataResponse
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
-@router.post("/", response_model=BaseResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/",
+    response_model=DataResponse,
+    response_class=EnvelopeResponse,
+    status_code=status.HTTP_201_CREATED,
+)
 async def create_job(
     job_data: JobCreate,
     db: AsyncSession = Depends(get_db),
-) -> dict:
+) -> EnvelopeResponse:
     """Create a new background job.
 
     Args:
@@ -33,13 +41,14 @@ async def create_job(
 
     try:
         job = await service.create_job(job_data)
-        job_schema = JobSchema.model_validate(job)
-
-        return {
-            "success": True,
-            "message": "Job created successfully",
-            "data": job_schema.model_dump(),
-        }
+        get_worker().notify_new_job()  # Committed; wake the in-process worker now
+        return EnvelopeResponse(
+            DataResponse(
+                message="Job created successfully",
+                data=JobSchema.model_validate(job),
+            ),
+            status_code=status.HTTP_201_CREATED,
+        )
     except JobServiceError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -47,11 +56,11 @@ async def create_job(
         ) from e
 
 
-@router.get("/{job_id}", response_model=BaseResponse)
+@router.get("/{job_id}", response_model=DataResponse, response_class=EnvelopeResponse)
 async def get_job(
     job_id: int,
     db: AsyncSession = Depends(get_db),
-) -> dict:
+) -> EnvelopeResponse:
     """Get job by ID.
 
     Args:
@@ -62,7 +71,7 @@ async def get_job(
         Job details
 
     Raises:
-        HTTPException: If job not found
+        HTTPException: If job not found, or its offloaded result file is missing
     """
     service = JobService(db)
     job = await service.get_job(job_id)
@@ -74,21 +83,22 @@ async def get_job(
         )
 
     job_schema = JobSchema.model_validate(job)
+    try:
+        job_schema.result = await load_result(job.id, job.result, job.result_in_file)
+    except ResultFileMissingError as e:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(e)) from e
 
-    return {
-        "success": True,
-        "data": job_schema.model_dump(),
-    }
+    return EnvelopeResponse(DataResponse(data=job_schema))
 
 
-@router.get("/", response_model=BaseResponse)
+@router.get("/", response_model=DataResponse, response_class=EnvelopeResponse)
 async def list_jobs(
     status_filter: JobStatus | None = Query(None, description="Filter by status"),
     type_filter: JobType | None = Query(None, description="Filter by job type"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records"),
     db: AsyncSession = Depends(get_db),
-) -> dict:
+) -> EnvelopeResponse:
     """List jobs with optional filtering.
 
     Args:
@@ -109,20 +119,15 @@ async def list_jobs(
         limit=limit,
     )
 
-    job_schemas = [JobSummary.model_validate(job) for job in jobs]
+    return EnvelopeResponse(DataResponse(data=[JobSummary.model_validate(job) for job in jobs]))
 
-    return {
-        "success": True,
-        "data": [job.model_dump() for job in job_schemas],
-    }
 
-
-@router.patch("/{job_id}", response_model=BaseResponse)
+@router.patch("/{job_id}", response_model=DataResponse, response_class=EnvelopeResponse)
 async def update_job(
     job_id: int,
     job_update: JobUpdate,
     db: AsyncSession = Depends(get_db),
-) -> dict:
+) -> EnvelopeResponse:
     """Update job status and progress.
 
     Args:
@@ -134,7 +139,8 @@ async def update_job(
         Updated job
 
     Raises:
-        HTTPException: If job not found or update fails
+        HTTPException: If job not found, update fails, or its offloaded result file
+            is missing
     """
     service = JobService(db)
 
@@ -148,12 +154,17 @@ async def update_job(
             )
 
         job_schema = JobSchema.model_validate(job)
-
-        return {
-            "success": True,
-            "message": "Job updated successfully",
-            "data": job_schema.model_dump(),
-        }
+        try:
+            job_schema.result = await load_result(job.id, job.result, job.result_in_file)
+        except ResultFileMissingError as e:
+            raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(e)) from e
+
+        return EnvelopeResponse(
+            DataResponse(
+                message="Job updated successfully",
+                data=job_schema,
+            )
+        )
     except JobServiceError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -161,11 +172,11 @@ async def update_job(
         ) from e
 
 
-@router.post("/{job_id}/cancel", response_model=BaseResponse)
+@router.post("/{job_id}/cancel", response_model=DataResponse, response_class=EnvelopeResponse)
 async def cancel_job(
     job_id: int,
     db: AsyncSession = Depends(get_db),
-) -> dict:
+) -> EnvelopeResponse:
     """Cancel a pending or running job.
 
     Args:
@@ -187,17 +198,14 @@ async def cancel_job(
             detail=f"Job {job_id} cannot be cancelled (not found or already completed)",
         )
 
-    return {
-        "success": True,
-        "message": f"Job {job_id} cancelled successfully",
-    }
+    return EnvelopeResponse(DataResponse(message=f"Job {job_id} cancelled successfully"))
 
 
-@router.delete("/{job_id}", response_model=BaseResponse)
+@router.delete("/{job_id}", response_model=DataResponse, response_class=EnvelopeResponse)
 async def delete_job(
     job_id: int,
     db: AsyncSession = Depends(get_db),
-) -> dict:
+) -> EnvelopeResponse:
     """Delete a job.
 
     Args:
@@ -219,16 +227,13 @@ async def delete_job(
             detail=f"Job {job_id} not found",
         )
 
-    return {
-        "success": True,
-        "message": f"Job {job_id} deleted successfully",
-    }
+    return EnvelopeResponse(DataResponse(message=f"Job {job_id} deleted successfully"))
 
 
-@router.get("/stats/summary", response_model=BaseResponse)
+@router.get("/stats/summary", response_model=DataResponse, response_class=EnvelopeResponse)
 async def get_job_stats(
     db: AsyncSession = Depends(get_db),
-) -> dict:
+) -> EnvelopeResponse:
     """Get job statistics.
 
     Args:
@@ -240,7 +245,4 @@ async def get_job_stats(
     service = JobService(db)
     stats = await service.get_job_stats()
 
-    return {
-        "success": True,
-        "data": stats,
-    }
+    return EnvelopeResponse(DataResponse(data=stats))
@@ -37,6 +37,7 @@ class JobSchema(BaseModel):
     error: str | None
     started_at: datetime | None
     completed_at: datetime | None
+    scheduled_at: datetime | None = None
     progress: int
     retries: int
     max_retries: int
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
 from app.jobs.models import Job, JobStatus, JobType
+from app.jobs.results import discard_result
 from app.jobs.schemas import JobCreate, JobUpdate
 
 logger = get_logger(__name__)
@@ -128,11 +129,17 @@ class JobService:
 
             # Update fields
             update_data = job_update.model_dump(exclude_unset=True)
+            result_in_file = job.result_in_file
             for field, value in update_data.items():
                 setattr(job, field, value)
+            if "result" in update_data:
+                # A written result replaces an offloaded one; its file goes once committed
+                job.result_in_file = False
 
             await self.db.commit()
             await self.db.refresh(job)
+            if "result" in update_data:
+                await discard_result(job.id, result_in_file)
 
             logger.info(
                 "Updated job",
@@ -203,8 +210,10 @@ class JobService:
         if not job:
             return False
 
+        result_in_file = job.result_in_file
         await self.db.delete(job)
         await self.db.commit()
+        await discard_result(job_id, result_in_file)
 
         logger.info("Deleted job", extra={"job_id": job_id})
         return True
@@ -37,6 +37,9 @@ logger = get_logger(__name__)
 # Task registry: task_name -> async function
 TASK_REGISTRY: dict[str, Callable[..., Awaitable[Any]]] = {}
 
+# Bound lookup for dispatch; the registry is only mutated in place, so this stays valid
+get_task = TASK_REGISTRY.get
+
 
 def register_task(name: str):
     """Decorator to register a task.
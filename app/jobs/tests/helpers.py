@@ -0,0 +1,21 @@
+"""Shared helpers for job tests."""
+
+from types import SimpleNamespace
+from typing import Any
+
+
+def wire_scalar(mock_db: Any, value: Any) -> None:
+    """Make ``mock_db.execute()`` return a result that yields ``value``.
+
+    The result supports ``scalar_one_or_none()`` and, when ``value`` is a list,
+    ``scalars().all()``.
+
+    Args:
+        mock_db: Mock session whose ``execute`` is an AsyncMock
+        value: Row (or list of rows) the query should return
+    """
+    items = value if isinstance(value, list) else []
+    mock_db.execute.return_value = SimpleNamespace(
+        scalar_one_or_none=lambda: value,
+        scalars=lambda: SimpleNamespace(all=lambda: items),
+    )
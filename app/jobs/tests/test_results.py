@@ -0,0 +1,74 @@
+"""Tests for job result storage."""
+
+import json
+
+import pytest
+
+from app.jobs import results as results_mod
+from app.jobs.results import (
+    RESULT_INLINE_LIMIT,
+    ResultFileMissingError,
+    discard_result,
+    load_result,
+    store_result,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point offloaded results at a temporary cache directory."""
+    monkeypatch.setattr(results_mod.settings, "cache_dir", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_small_result_stored_inline(cache_dir):
+    """Test results under the limit are stored as JSON in the column."""
+    stored, in_file = await store_result(1, {"status": "ok"})
+
+    assert json.loads(stored) == {"status": "ok"}
+    assert in_file is False
+    assert await load_result(1, stored, in_file) == stored
+    assert not (cache_dir / "job_results").exists()
+
+
+@pytest.mark.asyncio
+async def test_empty_result_stored_as_none():
+    """Test empty results store nothing."""
+    assert await store_result(1, {}) == (None, False)
+    assert await load_result(1, None, False) is None
+
+
+@pytest.mark.asyncio
+async def test_large_result_offloaded_to_file(cache_dir):
+    """Test oversize results are written to the job's result file."""
+    result = {"text": "x" * RESULT_INLINE_LIMIT}
+
+    stored, in_file = await store_result(7, result)
+
+    assert (stored, in_file) == (None, True)
+    assert (cache_dir / "job_results" / "7.json").exists()
+    assert json.loads(await load_result(7, stored, in_file)) == result
+
+    await discard_result(7, in_file)
+    assert not (cache_dir / "job_results" / "7.json").exists()
+    await discard_result(7, in_file)  # Already gone is fine
+
+
+@pytest.mark.asyncio
+async def test_reference_shaped_result_not_followed(tmp_path):
+    """Test an inline result that looks like a file reference is returned as-is."""
+    secret = tmp_path / "secret.txt"
+    secret.write_text("secret")
+    stored = json.dumps({"kind": "file", "path": str(secret)})
+
+    assert await load_result(1, stored, False) == stored
+    await discard_result(1, False)
+    assert secret.exists()
+
+
+@pytest.mark.asyncio
+async def test_missing_result_file():
+    """Test a missing offloaded result file raises a clear error."""
+    with pytest.raises(ResultFileMissingError, match="job 3"):
+        await load_result(3, None, True)
@@ -1,13 +1,67 @@
 """Tests for job service."""
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.jobs.models import Job, JobStatus, JobType
+from app.jobs.models import JobStatus, JobType
 from app.jobs.schemas import JobCreate, JobUpdate
 from app.jobs.service import JobService
+from app.jobs.tests.helpers import wire_scalar
+
+# Immutable inputs built once at import instead of per test. Payloads use
+# model_construct(): these tests exercise the service, not schema validation.
+SAMPLE_JOB_FIELDS = {
+    "id": 1,
+    "job_type": JobType.EXTRACTION,
+    "status": JobStatus.PENDING,
+    "task_name": "example_task",
+    "task_args": '{"message": "test"}',
+    "result": None,
+    "result_in_file": False,
+    "error": None,
+    "progress": 0,
+    "retries": 0,
+    "max_retries": 3,
+}
+
+EXTRACTION_JOB_CREATE = JobCreate.model_construct(
+    job_type=JobType.EXTRACTION,
+    task_name="example_task",
+    task_args='{"message": "test"}',
+)
+
+CONSOLIDATION_JOB_CREATE = JobCreate.model_construct(
+    job_type=JobType.CONSOLIDATION,
+    task_name="generate_consolidation",
+    max_retries=5,
+)
+
+
+# (status, count) rows as returned by the GROUP BY status query
+JOB_STATS_ROWS = [
+    (JobStatus.PENDING, 1),
+    (JobStatus.RUNNING, 1),
+    (JobStatus.COMPLETED, 1),
+    (JobStatus.FAILED, 1),
+]
+
+
+class _FakeDB:
+    """Stand-in for AsyncSession exposing only what JobService uses.
+
+    Avoids AsyncMock(spec=AsyncSession), which introspects the full session
+    interface on every fixture construction.
+    """
+
+    def __init__(self):
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+        self.refresh = AsyncMock()
+        self.execute = AsyncMock()
+        self.delete = AsyncMock()
+        self.add = MagicMock()
 
 
 class TestJobService:
@@ -16,14 +70,7 @@ class TestJobService:
     @pytest.fixture
     def mock_db(self):
         """Create mock database session."""
-        db = AsyncMock(spec=AsyncSession)
-        db.commit = AsyncMock()
-        db.rollback = AsyncMock()
-        db.refresh = AsyncMock()
-        db.add = MagicMock()
-        db.execute = AsyncMock()
-        db.delete = AsyncMock()
-        return db
+        return _FakeDB()
 
     @pytest.fixture
     def service(self, mock_db):
@@ -32,30 +79,16 @@ class TestJobService:
 
     @pytest.fixture
     def sample_job(self):
-        """Create sample job."""
-        job = MagicMock(spec=Job)
-        job.id = 1
-        job.job_type = JobType.EXTRACTION
-        job.status = JobStatus.PENDING
-        job.task_name = "example_task"
-        job.task_args = '{"message": "test"}'
-        job.result = None
-        job.error = None
-        job.progress = 0
-        job.retries = 0
-        job.max_retries = 3
-        return job
+        """Create sample job.
+
+        A fresh namespace per test, since update/cancel mutate the job in place.
+        """
+        return SimpleNamespace(**SAMPLE_JOB_FIELDS)
 
     @pytest.mark.asyncio
     async def test_create_job(self, service, mock_db):
         """Test creating a job."""
-        job_data = JobCreate(
-            job_type=JobType.EXTRACTION,
-            task_name="example_task",
-            task_args='{"message": "test"}',
-        )
-
-        await service.create_job(job_data)
+        await service.create_job(EXTRACTION_JOB_CREATE)
 
         assert mock_db.add.called
         assert mock_db.commit.called
@@ -64,13 +97,7 @@ class TestJobService:
     @pytest.mark.asyncio
     async def test_create_job_with_max_retries(self, service, mock_db):
         """Test creating job with custom max retries."""
-        job_data = JobCreate(
-            job_type=JobType.CONSOLIDATION,
-            task_name="generate_consolidation",
-            max_retries=5,
-        )
-
-        await service.create_job(job_data)
+        await service.create_job(CONSOLIDATION_JOB_CREATE)
 
         assert mock_db.add.called
         assert mock_db.commit.called
@@ -78,9 +105,7 @@ class TestJobService:
     @pytest.mark.asyncio
     async def test_get_job(self, service, sample_job, mock_db):
         """Test getting job by ID."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_job
-        mock_db.execute.return_value = mock_result
+        wire_scalar(mock_db, sample_job)
 
         job = await service.get_job(1)
 
@@ -91,9 +116,7 @@ class TestJobService:
     @pytest.mark.asyncio
     async def test_get_job_not_found(self, service, mock_db):
         """Test getting non-existent job."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        wire_scalar(mock_db, None)
 
         job = await service.get_job(99999)
 
@@ -103,13 +126,11 @@ class TestJobService:
     async def test_get_jobs(self, service, mock_db):
         """Test listing jobs."""
         mock_jobs = [
-            MagicMock(id=1, status=JobStatus.PENDING),
-            MagicMock(id=2, status=JobStatus.RUNNING),
+            SimpleNamespace(id=1, status=JobStatus.PENDING),
+            SimpleNamespace(id=2, status=JobStatus.RUNNING),
         ]
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_jobs
-        mock_db.execute.return_value = mock_result
+        wire_scalar(mock_db, mock_jobs)
 
         jobs = await service.get_jobs()
 
@@ -119,11 +140,9 @@ class TestJobService:
     @pytest.mark.asyncio
     async def test_get_jobs_filtered_by_status(self, service, mock_db):
         """Test filtering jobs by status."""
-        mock_jobs = [MagicMock(id=1, status=JobStatus.COMPLETED)]
+        mock_jobs = [SimpleNamespace(id=1, status=JobStatus.COMPLETED)]
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_jobs
-        mock_db.execute.return_value = mock_result
+        wire_scalar(mock_db, mock_jobs)
 
         jobs = await service.get_jobs(status=JobStatus.COMPLETED)
 
@@ -133,11 +152,9 @@ class TestJobService:
     @pytest.mark.asyncio
     async def test_get_jobs_filtered_by_type(self, service, mock_db):
         """Test filtering jobs by type."""
-        mock_jobs = [MagicMock(id=1, job_type=JobType.EXTRACTION)]
+        mock_jobs = [SimpleNamespace(id=1, job_type=JobType.EXTRACTION)]
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_jobs
-        mock_db.execute.return_value = mock_result
+        wire_scalar(mock_db, mock_jobs)
 
         jobs = await service.get_jobs(job_type=JobType.EXTRACTION)
 
@@ -146,9 +163,7 @@ class TestJobService:
     @pytest.mark.asyncio
     async def test_get_jobs_pagination(self, service, mock_db):
         """Test job pagination."""
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
-        mock_db.execute.return_value = mock_result
+        wire_scalar(mock_db, [])
 
         await service.get_jobs(skip=10, limit=20)
 
@@ -157,25 +172,36 @@ class TestJobService:
     @pytest.mark.asyncio
     async def test_update_job(self, service, sample_job, mock_db):
         """Test updating job."""
-        mock_get_result = MagicMock()
-        mock_get_result.scalar_one_or_none.return_value = sample_job
-        mock_db.execute.return_value = mock_get_result
+        wire_scalar(mock_db, sample_job)
 
-        job_update = JobUpdate(status=JobStatus.RUNNING, progress=50)
+        job_update = JobUpdate.model_construct(status=JobStatus.RUNNING, progress=50)
         updated_job = await service.update_job(1, job_update)
 
         assert updated_job is not None
+        assert updated_job.status == JobStatus.RUNNING
+        assert updated_job.progress == 50
         assert mock_db.commit.called
         assert mock_db.refresh.called
 
+    @pytest.mark.asyncio
+    async def test_update_job_result_replaces_offloaded(self, service, sample_job, mock_db):
+        """Test writing a result clears the offload flag and discards the result file."""
+        sample_job.result_in_file = True
+        wire_scalar(mock_db, sample_job)
+
+        with patch("app.jobs.service.discard_result", new_callable=AsyncMock) as discard:
+            updated_job = await service.update_job(1, JobUpdate.model_construct(result="{}"))
+
+        assert updated_job.result == "{}"
+        assert updated_job.result_in_file is False
+        discard.assert_awaited_once_with(1, True)
+
     @pytest.mark.asyncio
     async def test_update_job_not_found(self, service, mock_db):
         """Test updating non-existent job."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        wire_scalar(mock_db, None)
 
-        job_update = JobUpdate(status=JobStatus.RUNNING)
+        job_update = JobUpdate.model_construct(status=JobStatus.RUNNING)
         updated_job = await service.update_job(99999, job_update)
 
         assert updated_job is None
@@ -184,9 +210,7 @@ class TestJobService:
     async def test_cancel_job(self, service, sample_job, mock_db):
         """Test cancelling a job."""
         sample_job.status = JobStatus.PENDING
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_job
-        mock_db.execute.return_value = mock_result
+        wire_scalar(mock_db, sample_job)
 
         cancelled = await service.cancel_job(1)
 
@@ -197,9 +221,7 @@ class TestJobService:
     async def test_cancel_job_already_completed(self, service, sample_job, mock_db):
         """Test cancelling completed job fails."""
         sample_job.status = JobStatus.COMPLETED
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_job
-        mock_db.execute.return_value = mock_result
+        wire_scalar(mock_db, sample_job)
 
         cancelled = await service.cancel_job(1)
 
@@ -208,9 +230,7 @@ class TestJobService:
     @pytest.mark.asyncio
     async def test_cancel_job_not_found(self, service, mock_db):
         """Test cancelling non-existent job."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        wire_scalar(mock_db, None)
 
         cancelled = await service.cancel_job(99999)
 
@@ -219,9 +239,7 @@ class TestJobService:
     @pytest.mark.asyncio
     async def test_delete_job(self, service, sample_job, mock_db):
         """Test deleting a job."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_job
-        mock_db.execute.return_value = mock_result
+        wire_scalar(mock_db, sample_job)
 
         deleted = await service.delete_job(1)
 
@@ -232,9 +250,7 @@ class TestJobService:
     @pytest.mark.asyncio
     async def test_delete_job_not_found(self, service, mock_db):
         """Test deleting non-existent job."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        wire_scalar(mock_db, None)
 
         deleted = await service.delete_job(99999)
 
@@ -243,22 +259,16 @@ class TestJobService:
     @pytest.mark.asyncio
     async def test_get_job_stats(self, service, mock_db):
         """Test getting job statistics."""
-        # Mock the query result to return tuples of (status, count)
-        mock_result = MagicMock()
-        mock_result.__iter__.return_value = iter(
-            [
-                (JobStatus.PENDING, 1),
-                (JobStatus.RUNNING, 1),
-                (JobStatus.COMPLETED, 1),
-                (JobStatus.FAILED, 1),
-            ]
-        )
-        mock_db.execute.return_value = mock_result
+        # get_job_stats iterates the result directly, so a plain list suffices
+        mock_db.execute.return_value = JOB_STATS_ROWS
 
         stats = await service.get_job_stats()
 
-        assert stats["total"] == 4
-        assert stats["pending"] == 1
-        assert stats["running"] == 1
-        assert stats["completed"] == 1
-        assert stats["failed"] == 1
+        assert stats == {
+            "total": 4,
+            "pending": 1,
+            "running": 1,
+            "completed": 1,
+            "failed": 1,
+            "cancelled": 0,
+        }
@@ -1,5 +1,8 @@
 """Tests for background tasks."""
 
+import asyncio
+from unittest.mock import AsyncMock
+
 import pytest
 
 from app.jobs.tasks import (
@@ -8,23 +11,44 @@ from app.jobs.tasks import (
     example_task,
     failing_task,
     generate_consolidation,
+    get_task,
     long_running_task,
     process_extraction,
     register_task,
 )
 
+BUILTIN_TASKS = frozenset({"example_task", "long_running_task", "failing_task"})
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Replace asyncio.sleep so placeholder tasks don't simulate work in real time.
+
+    Returns:
+        AsyncMock standing in for asyncio.sleep
+    """
+    fake_sleep = AsyncMock()
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return fake_sleep
+
+
+@pytest.fixture
+def clean_registry():
+    """Restore TASK_REGISTRY after tests that register throwaway tasks."""
+    before = TASK_REGISTRY.copy()
+    yield
+    TASK_REGISTRY.clear()
+    TASK_REGISTRY.update(before)
+
 
 class TestTaskRegistry:
     """Test task registration system."""
 
     def test_task_registry_populated(self):
         """Test that task registry has registered tasks."""
-        assert len(TASK_REGISTRY) > 0
-        assert "example_task" in TASK_REGISTRY
-        assert "long_running_task" in TASK_REGISTRY
-        assert "failing_task" in TASK_REGISTRY
+        assert TASK_REGISTRY.keys() >= BUILTIN_TASKS
 
-    def test_register_task_decorator(self):
+    def test_register_task_decorator(self, clean_registry):
         """Test task registration decorator."""
 
         @register_task("test_custom_task")
@@ -34,65 +58,63 @@ class TestTaskRegistry:
         assert "test_custom_task" in TASK_REGISTRY
         assert TASK_REGISTRY["test_custom_task"] == custom_task
 
+    def test_get_task_sees_later_registrations(self, clean_registry):
+        """Test bound lookup reflects tasks registered after import."""
 
-class TestExampleTask:
-    """Test example task."""
+        @register_task("test_late_task")
+        async def late_task():
+            return {"result": "success"}
 
-    @pytest.mark.asyncio
-    async def test_example_task_default(self):
-        """Test example task with default message."""
-        result = await example_task()
+        assert get_task("test_late_task") is late_task
+        assert get_task("nonexistent_task") is None
 
-        assert result["status"] == "success"
-        assert result["message"] == "Hello"
+
+class TestExampleTask:
+    """Test example task."""
 
     @pytest.mark.asyncio
-    async def test_example_task_custom_message(self):
-        """Test example task with custom message."""
-        result = await example_task(message="Custom")
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_message"),
+        [({}, "Hello"), ({"message": "Custom"}, "Custom")],
+        ids=["default", "custom_message"],
+    )
+    async def test_example_task(self, kwargs, expected_message):
+        """Test example task echoes its message (default "Hello")."""
+        result = await example_task(**kwargs)
 
         assert result["status"] == "success"
-        assert result["message"] == "Custom"
+        assert result["message"] == expected_message
 
 
 class TestLongRunningTask:
     """Test long running task."""
 
     @pytest.mark.asyncio
-    async def test_long_running_task_default(self):
-        """Test long running task with default duration."""
-        result = await long_running_task(duration=0)  # 0 seconds for testing
+    @pytest.mark.parametrize("duration", [0, 1], ids=["zero", "custom_duration"])
+    async def test_long_running_task(self, duration, no_sleep):
+        """Test long running task reports its duration."""
+        result = await long_running_task(duration=duration)
 
         assert result["status"] == "completed"
-        assert result["duration"] == 0
-
-    @pytest.mark.asyncio
-    async def test_long_running_task_custom_duration(self):
-        """Test long running task with custom duration."""
-        result = await long_running_task(duration=1)
-
-        assert result["status"] == "completed"
-        assert result["duration"] == 1
+        assert result["duration"] == duration
+        no_sleep.assert_awaited_once_with(duration)
 
 
 class TestFailingTask:
     """Test failing task."""
 
     @pytest.mark.asyncio
-    async def test_failing_task_raises_error(self):
-        """Test that failing task raises RuntimeError."""
-        with pytest.raises(RuntimeError) as exc_info:
-            await failing_task()
-
-        assert "Task failed" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_failing_task_custom_message(self):
-        """Test failing task with custom error message."""
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_error"),
+        [({}, "Task failed"), ({"error_message": "Custom error"}, "Custom error")],
+        ids=["default", "custom_message"],
+    )
+    async def test_failing_task_raises_error(self, kwargs, expected_error):
+        """Test that failing task raises RuntimeError with its message."""
         with pytest.raises(RuntimeError) as exc_info:
-            await failing_task(error_message="Custom error")
+            await failing_task(**kwargs)
 
-        assert "Custom error" in str(exc_info.value)
+        assert expected_error in str(exc_info.value)
 
 
 class TestProcessExtraction:
@@ -145,30 +167,16 @@ class TestBatchProcess:
     """Test batch processing task."""
 
     @pytest.mark.asyncio
-    async def test_batch_process_empty_list(self):
-        """Test batch processing with empty list."""
-        result = await batch_process(file_ids=[])
-
-        assert result["status"] == "completed"
-        assert result["processed"] == 0
-        assert len(result["results"]) == 0
-
-    @pytest.mark.asyncio
-    async def test_batch_process_single_file(self):
-        """Test batch processing with single file."""
-        result = await batch_process(file_ids=[1])
-
-        assert result["status"] == "completed"
-        assert result["processed"] == 1
-        assert len(result["results"]) == 1
-        assert result["results"][0]["file_id"] == 1
-
-    @pytest.mark.asyncio
-    async def test_batch_process_multiple_files(self):
-        """Test batch processing with multiple files."""
-        result = await batch_process(file_ids=[1, 2, 3])
+    @pytest.mark.parametrize(
+        "file_ids",
+        [[], [1], [1, 2, 3]],
+        ids=["empty_list", "single_file", "multiple_files"],
+    )
+    async def test_batch_process(self, file_ids):
+        """Test batch processing reports one result per file, in order."""
+        result = await batch_process(file_ids=file_ids)
 
         assert result["status"] == "completed"
-        assert result["processed"] == 3
-        assert len(result["results"]) == 3
+        assert result["processed"] == len(file_ids)
+        assert [r["file_id"] for r in result["results"]] == file_ids
         assert all(r["status"] == "processed" for r in result["results"])
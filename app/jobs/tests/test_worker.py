@@ -1,12 +1,81 @@
 """Tests for background worker."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import functools
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
-from app.jobs.models import Job, JobStatus
-from app.jobs.worker import BackgroundWorker, WorkerError, get_worker
+from app.jobs import worker as worker_mod
+from app.jobs.models import JobStatus, JobType
+from app.jobs.tests.helpers import wire_scalar
+from app.jobs.worker import BackgroundWorker, JobSnapshot, WorkerError, get_worker
+
+# Keep get_worker() singleton tests on one xdist worker under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group("worker_singleton")
+
+
+def _make_job(**overrides):
+    """Build a job-shaped namespace (cheaper than MagicMock(spec=Job)).
+
+    Args:
+        **overrides: Field values to override on the default job
+
+    Returns:
+        SimpleNamespace with the attributes the worker reads and writes
+    """
+    fields = {
+        "id": 1,
+        "job_type": JobType.EXTRACTION,
+        "status": JobStatus.RUNNING,
+        "task_name": "example_task",
+        "task_args": None,
+        "retries": 0,
+        "max_retries": 3,
+        "scheduled_at": None,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class _SessionContext:
+    """Minimal async context manager standing in for AsyncSessionLocal()."""
+
+    def __init__(self, db):
+        self.db = db
+
+    async def __aenter__(self):
+        return self.db
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def patched_session(monkeypatch):
+    """Patch the worker's session factory with a mock session.
+
+    Returns:
+        Mock session; wire query results with wire_scalar()
+    """
+    mock_db = AsyncMock()
+    monkeypatch.setattr(worker_mod, "AsyncSessionLocal", lambda: _SessionContext(mock_db))
+    return mock_db
+
+
+@pytest.fixture
+def listener(monkeypatch):
+    """Patch asyncpg.connect so the worker's LISTEN connection is a mock.
+
+    Returns:
+        Mock asyncpg connection handed to the worker
+    """
+    conn = AsyncMock()
+    monkeypatch.setattr(worker_mod.asyncpg, "connect", AsyncMock(return_value=conn))
+    return conn
 
 
 class TestBackgroundWorker:
@@ -15,24 +84,26 @@ class TestBackgroundWorker:
     @pytest.fixture
     def worker(self):
         """Create worker instance."""
-        return BackgroundWorker(concurrency=2, poll_interval=0.1)
+        return BackgroundWorker(concurrency=2, poll_interval=0.01)
 
     @pytest.mark.asyncio
     async def test_worker_initialization(self, worker):
         """Test worker initialization."""
         assert worker.concurrency == 2
-        assert worker.poll_interval == 0.1
+        assert worker.poll_interval == 0.01
         assert worker.running is False
         assert len(worker._tasks) == 0
 
     @pytest.mark.asyncio
-    async def test_worker_start_stop(self, worker):
+    async def test_worker_start_stop(self, worker, patched_session, listener):
         """Test worker start and stop."""
+        wire_scalar(patched_session, None)  # No pending jobs
+
         # Start worker in background
         worker_task = asyncio.create_task(worker.start())
 
-        # Give it time to start
-        await asyncio.sleep(0.2)
+        # Wait for the polling loop to come up
+        await asyncio.wait_for(worker._started.wait(), timeout=1.0)
 
         assert worker.running is True
 
@@ -46,6 +117,54 @@ class TestBackgroundWorker:
             worker_task.cancel()
 
         assert worker.running is False
+        listener.add_listener.assert_awaited_once_with("jobs_pending", worker._on_job_pending)
+        listener.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_listener_failure_falls_back_to_polling(self, worker, monkeypatch):
+        """Test a failed LISTEN connection leaves the worker polling."""
+        monkeypatch.setattr(
+            worker_mod.asyncpg, "connect", AsyncMock(side_effect=OSError("refused"))
+        )
+
+        await worker._start_listener()
+
+        assert worker._listener is None
+
+    @pytest.mark.asyncio
+    async def test_notification_wakes_idle_worker(self, worker):
+        """Test a jobs_pending notification ends the idle wait early."""
+        worker.poll_interval = 10.0
+        waiter = asyncio.create_task(worker._wait_for_work())
+        await asyncio.sleep(0)
+
+        worker._on_job_pending(None, 0, "jobs_pending", "42")
+
+        await asyncio.wait_for(waiter, timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_notify_new_job_wakes_idle_worker(self, worker):
+        """Test in-process enqueues wake the worker, even if sent before it waits."""
+        worker.poll_interval = 10.0
+        worker.notify_new_job()
+
+        await asyncio.wait_for(worker._wait_for_work(), timeout=1.0)
+
+        assert not worker._new_job.is_set()
+
+    @pytest.mark.asyncio
+    async def test_finished_tasks_evict_themselves(self, worker):
+        """Test done callbacks drop finished jobs from the worker's tracking."""
+        task = asyncio.create_task(asyncio.sleep(0))
+        worker._tasks.add(task)
+        worker._running_jobs[1] = task
+        task.add_done_callback(functools.partial(worker._forget_job, 1))
+
+        await task
+        await asyncio.sleep(0)  # Let the done callback run
+
+        assert worker._tasks == set()
+        assert worker._running_jobs == {}
 
     def test_get_worker_singleton(self):
         """Test get_worker returns singleton."""
@@ -55,159 +174,115 @@ class TestBackgroundWorker:
         assert worker1 is worker2
 
     @pytest.mark.asyncio
-    async def test_worker_process_job_success(self, worker):
-        """Test worker processing job successfully."""
-        # Mock database and job
-        mock_job = MagicMock(spec=Job)
-        mock_job.id = 1
-        mock_job.task_name = "example_task"
-        mock_job.task_args = '{"message": "test"}'
-        mock_job.status = JobStatus.RUNNING
-        mock_job.retries = 0
-        mock_job.max_retries = 3
-
-        with patch("app.jobs.worker.AsyncSessionLocal") as mock_session_local:
-            mock_db = AsyncMock()
-            mock_session_local.return_value.__aenter__.return_value = mock_db
-
-            # Mock get job
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = mock_job
-            mock_db.execute.return_value = mock_result
-
-            # Process job
-            await worker._process_job(1)
-
-            # Verify commit was called
-            assert mock_db.commit.called
+    async def test_worker_process_job_success(self, worker, patched_session):
+        """Test a successful job is completed in one guarded UPDATE."""
+        mock_db = patched_session
+        job = JobSnapshot.from_job(_make_job(task_args='{"message": "test"}'))
+        wire_scalar(mock_db, job.id)
 
-    @pytest.mark.asyncio
-    async def test_worker_process_job_not_found(self, worker):
-        """Test worker handling job not found."""
-        with patch("app.jobs.worker.AsyncSessionLocal") as mock_session_local:
-            mock_db = AsyncMock()
-            mock_session_local.return_value.__aenter__.return_value = mock_db
+        await worker._process_job(job)
 
-            # Mock job not found
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = None
-            mock_db.execute.return_value = mock_result
-
-            # Should not raise error
-            await worker._process_job(99999)
+        mock_db.execute.assert_awaited_once()
+        params = mock_db.execute.await_args.args[0].compile().params
+        assert params["status"] == JobStatus.COMPLETED
+        assert params["status_1"] == JobStatus.RUNNING  # Only a running job completes
+        assert params["result_in_file"] is False
+        assert mock_db.commit.called
 
     @pytest.mark.asyncio
-    async def test_worker_process_job_task_not_found(self, worker):
-        """Test worker handling task not found."""
-        mock_job = MagicMock(spec=Job)
-        mock_job.id = 1
-        mock_job.task_name = "nonexistent_task"
-        mock_job.task_args = None
-        mock_job.retries = 0
-        mock_job.max_retries = 3
-
-        with patch("app.jobs.worker.AsyncSessionLocal") as mock_session_local:
-            mock_db = AsyncMock()
-            mock_session_local.return_value.__aenter__.return_value = mock_db
-
-            # Mock get job (return twice for retry logic)
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = mock_job
-            mock_db.execute.return_value = mock_result
-
-            # Process job - should handle error
-            await worker._process_job(1)
-
-            # Verify job was updated with error
-            assert mock_db.commit.called
+    async def test_worker_process_job_cancelled_while_running(self, worker, patched_session):
+        """Test a job cancelled mid-run keeps its state when the task finishes."""
+        mock_db = patched_session
+        job = JobSnapshot.from_job(_make_job(task_args='{"message": "test"}'))
+        wire_scalar(mock_db, None)  # Guard matched no row
 
-    @pytest.mark.asyncio
-    async def test_worker_process_job_with_retry(self, worker):
-        """Test worker retrying failed job."""
-        mock_job = MagicMock(spec=Job)
-        mock_job.id = 1
-        mock_job.task_name = "failing_task"
-        mock_job.task_args = None
-        mock_job.retries = 0
-        mock_job.max_retries = 3
-
-        with patch("app.jobs.worker.AsyncSessionLocal") as mock_session_local:
-            mock_db = AsyncMock()
-            mock_session_local.return_value.__aenter__.return_value = mock_db
-
-            # Mock get job
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = mock_job
-            mock_db.execute.return_value = mock_result
-
-            # Process job
-            await worker._process_job(1)
-
-            # Verify job was set to pending for retry
-            assert mock_db.commit.called
+        await worker._process_job(job)
 
-    @pytest.mark.asyncio
-    async def test_worker_process_job_max_retries(self, worker):
-        """Test worker failing job after max retries."""
-        mock_job = MagicMock(spec=Job)
-        mock_job.id = 1
-        mock_job.task_name = "failing_task"
-        mock_job.task_args = None
-        mock_job.retries = 3  # At max retries
-        mock_job.max_retries = 3
-
-        with patch("app.jobs.worker.AsyncSessionLocal") as mock_session_local:
-            mock_db = AsyncMock()
-            mock_session_local.return_value.__aenter__.return_value = mock_db
-
-            # Mock get job
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = mock_job
-            mock_db.execute.return_value = mock_result
-
-            # Process job
-            await worker._process_job(1)
-
-            # Verify job was marked as failed
-            assert mock_db.commit.called
+        mock_db.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_get_next_job(self, worker):
-        """Test getting next pending job."""
-        mock_job = MagicMock(spec=Job)
-        mock_job.id = 1
-        mock_job.status = JobStatus.PENDING
-
-        with patch("app.jobs.worker.AsyncSessionLocal") as mock_session_local:
-            mock_db = AsyncMock()
-            mock_session_local.return_value.__aenter__.return_value = mock_db
+    @pytest.mark.parametrize(
+        ("job_fields", "new_status", "updated"),
+        [
+            ({"task_name": "nonexistent_task"}, JobStatus.PENDING, True),
+            ({"task_name": "failing_task"}, JobStatus.PENDING, True),
+            ({"task_name": "failing_task", "retries": 3}, JobStatus.FAILED, True),
+            ({"task_name": "failing_task"}, JobStatus.PENDING, False),
+            ({"task_args": "{not json"}, JobStatus.PENDING, True),
+            (
+                {"task_name": "long_running_task", "task_args": '{"duration": 10}'},
+                JobStatus.PENDING,
+                True,
+            ),
+        ],
+        ids=["task_not_found", "retry", "max_retries", "job_gone", "invalid_args", "timeout"],
+    )
+    async def test_worker_process_job_failure(
+        self, worker, patched_session, job_fields, new_status, updated
+    ):
+        """Test failed jobs are retried or failed with a single guarded UPDATE."""
+        worker.task_timeout = 0.01
+        mock_db = patched_session
+        job = JobSnapshot.from_job(_make_job(**job_fields))
+        wire_scalar(mock_db, new_status if updated else None)
+
+        # Should not raise, whatever the outcome
+        await worker._process_job(job)
+
+        mock_db.execute.assert_awaited_once()
+        stmt = mock_db.execute.await_args.args[0]
+        params = stmt.compile().params
+        assert params["status"] == new_status
+        assert params["status_1"] == JobStatus.RUNNING
+        if new_status is JobStatus.PENDING:
+            # Backoff is deferred to the claim query, timed by the database clock
+            assert params["retries"] == job.retries + 1
+            assert "scheduled_at=(now() + " in str(stmt)
+            assert timedelta(seconds=2) in params.values()
+        else:
+            assert "completed_at=now()" in str(stmt)
 
-            # Mock get next job
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = mock_job
-            mock_db.execute.return_value = mock_result
+    @pytest.mark.asyncio
+    async def test_claim_jobs(self, worker, patched_session):
+        """Test claiming a batch of pending jobs in one statement."""
+        mock_db = patched_session
+        now = datetime.now(UTC)
+        newer = _make_job(id=2, created_at=now)
+        older = _make_job(id=1, created_at=now - timedelta(seconds=1))
+        wire_scalar(mock_db, [newer, older])
 
-            job = await worker._get_next_job(mock_db)
+        jobs = await worker._claim_jobs(mock_db, 2)
 
-            assert job is not None
-            assert job.id == 1
-            assert mock_db.commit.called
+        assert [job.id for job in jobs] == [1, 2]
+        mock_db.execute.assert_awaited_once()
+        assert mock_db.commit.called
 
     @pytest.mark.asyncio
-    async def test_get_next_job_none_available(self, worker):
-        """Test getting next job when none available."""
-        with patch("app.jobs.worker.AsyncSessionLocal") as mock_session_local:
-            mock_db = AsyncMock()
-            mock_session_local.return_value.__aenter__.return_value = mock_db
+    async def test_claim_jobs_none_available(self, worker, patched_session):
+        """Test claiming when no jobs are pending."""
+        mock_db = patched_session
 
-            # Mock no jobs available
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = None
-            mock_db.execute.return_value = mock_result
+        # Mock no jobs available
+        wire_scalar(mock_db, [])
 
-            job = await worker._get_next_job(mock_db)
+        jobs = await worker._claim_jobs(mock_db, 2)
 
-            assert job is None
+        assert jobs == []
+
+    @pytest.mark.asyncio
+    async def test_claim_jobs_statement(self, worker, patched_session):
+        """Test the claim query skips locked rows and returns the claimed ones."""
+        mock_db = patched_session
+        wire_scalar(mock_db, [])
+
+        await worker._claim_jobs(mock_db, 3)
+
+        stmt = mock_db.execute.await_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "jobs.scheduled_at <= now()" in sql
+        assert "= ANY (array((SELECT" in sql
+        assert "RETURNING" in sql
 
 
 class TestWorkerError:
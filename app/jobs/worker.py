@@ -1,16 +1,21 @@
 """Background worker for processing jobs."""
 
 import asyncio
-import json
-from datetime import UTC, datetime
-
-from sqlalchemy import select
+import contextlib
+import functools
+from dataclasses import dataclass
+from datetime import timedelta
+
+import asyncpg
+from pydantic_core import from_json
+from sqlalchemy import any_, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import AsyncSessionLocal
+from app.core.database import AsyncSessionLocal, engine
 from app.core.logging import get_logger
-from app.jobs.models import Job, JobStatus
-from app.jobs.tasks import TASK_REGISTRY
+from app.jobs.models import JOBS_PENDING_CHANNEL, Job, JobStatus, JobType
+from app.jobs.results import discard_result, store_result
+from app.jobs.tasks import get_task
 
 logger = get_logger(__name__)
 
@@ -21,6 +26,30 @@ class WorkerError(Exception):
     pass
 
 
+@dataclass(frozen=True, slots=True)
+class JobSnapshot:
+    """Detached copy of the job fields a worker needs to run a claimed job."""
+
+    id: int
+    task_name: str
+    task_args: str | None
+    job_type: JobType
+    retries: int
+    max_retries: int
+
+    @classmethod
+    def from_job(cls, job: Job) -> "JobSnapshot":
+        """Snapshot a claimed job row."""
+        return cls(
+            id=job.id,
+            task_name=job.task_name,
+            task_args=job.task_args,
+            job_type=job.job_type,
+            retries=job.retries,
+            max_retries=job.max_retries,
+        )
+
+
 class BackgroundWorker:
     """Background worker for processing jobs."""
 
@@ -43,6 +72,10 @@ class BackgroundWorker:
         self.running = False
         self._tasks: set[asyncio.Task] = set()
         self._running_jobs: dict[int, asyncio.Task] = {}  # job_id -> task
+        self._get_task = get_task  # Registry lookup bound once per worker
+        self._started = asyncio.Event()  # Set once the polling loop is running
+        self._new_job = asyncio.Event()  # Set by notify_new_job() and jobs_pending notifications
+        self._listener: asyncpg.Connection | None = None
 
     async def start(self) -> None:
         """Start the worker."""
@@ -51,29 +84,35 @@ class BackgroundWorker:
             extra={"concurrency": self.concurrency, "poll_interval": self.poll_interval},
         )
         self.running = True
+        await self._start_listener()
+        self._started.set()
+
+        try:
+            await self._run_loop()
+        finally:
+            await self._stop_listener()
 
+    async def _run_loop(self) -> None:
+        """Poll for jobs until stopped, idling on notifications between polls."""
         while self.running:
             try:
-                # Clean up completed tasks
-                self._tasks = {t for t in self._tasks if not t.done()}
-                # Clean up completed job tracking
-                self._running_jobs = {
-                    job_id: task for job_id, task in self._running_jobs.items() if not task.done()
-                }
-
-                # Check if we can start more jobs
-                if len(self._tasks) < self.concurrency:
+                # Claim as many jobs as there are free slots in one statement
+                free_slots = self.concurrency - len(self._tasks)
+                if free_slots > 0:
                     async with AsyncSessionLocal() as db:
-                        job = await self._get_next_job(db)
-
-                        if job:
-                            # Start processing job in background
-                            task = asyncio.create_task(self._process_job(job.id))
-                            self._tasks.add(task)
-                            self._running_jobs[job.id] = task  # Track for cancellation
-                        else:
-                            # No jobs available, wait
-                            await asyncio.sleep(self.poll_interval)
+                        jobs = await self._claim_jobs(db, free_slots)
+
+                    for job in jobs:
+                        # Start processing job in background
+                        task = asyncio.create_task(self._process_job(JobSnapshot.from_job(job)))
+                        self._tasks.add(task)
+                        self._running_jobs[job.id] = task  # Track for cancellation
+                        # Finished tasks evict themselves; no per-poll sweep needed
+                        task.add_done_callback(functools.partial(self._forget_job, job.id))
+
+                    if not jobs:
+                        # No jobs available, wait for a notification (or poll timeout)
+                        await self._wait_for_work()
                 else:
                     # At max concurrency, wait
                     await asyncio.sleep(self.poll_interval)
@@ -86,10 +125,65 @@ class BackgroundWorker:
                 )
                 await asyncio.sleep(self.poll_interval)
 
+    def _forget_job(self, job_id: int, task: asyncio.Task[None]) -> None:
+        """Done callback dropping a finished task from the worker's tracking.
+
+        Args:
+            job_id: ID of the job the task ran
+            task: The finished task
+        """
+        self._tasks.discard(task)
+        if self._running_jobs.get(job_id) is task:
+            del self._running_jobs[job_id]
+
+    async def _start_listener(self) -> None:
+        """LISTEN for new-job notifications on a dedicated connection.
+
+        Falls back to plain polling if the connection or LISTEN fails.
+        """
+        dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        try:
+            self._listener = await asyncpg.connect(dsn)
+            await self._listener.add_listener(JOBS_PENDING_CHANNEL, self._on_job_pending)
+        except Exception as e:
+            logger.warning(
+                "Job notifications unavailable, falling back to polling",
+                extra={"error": str(e)},
+            )
+            await self._stop_listener()
+
+    async def _stop_listener(self) -> None:
+        """Close the notification connection, if any."""
+        if self._listener is None:
+            return
+        listener, self._listener = self._listener, None
+        try:
+            await listener.close()
+        except Exception as e:
+            logger.warning("Failed to close job listener", extra={"error": str(e)})
+
+    def _on_job_pending(
+        self, _connection: asyncpg.Connection, _pid: int, _channel: str, _payload: str
+    ) -> None:
+        """asyncpg notification callback; wakes the polling loop."""
+        self._new_job.set()
+
+    def notify_new_job(self) -> None:
+        """Wake the polling loop for a job enqueued by this process."""
+        self._new_job.set()
+
+    async def _wait_for_work(self) -> None:
+        """Wait until a job is announced or the poll interval elapses."""
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._new_job.wait(), timeout=self.poll_interval)
+        # Cleared after waking, so a signal sent before we started waiting isn't lost
+        self._new_job.clear()
+
     async def stop(self) -> None:
         """Stop the worker gracefully."""
         logger.info("Stopping background worker")
         self.running = False
+        self._started.clear()
 
         # Wait for running tasks to complete
         if self._tasks:
@@ -127,151 +221,224 @@ class BackgroundWorker:
             return True
         return False
 
-    async def _get_next_job(self, db: AsyncSession) -> Job | None:
-        """Get next pending job.
+    async def _claim_jobs(self, db: AsyncSession, limit: int) -> list[Job]:
+        """Claim up to ``limit`` due pending jobs and mark them running.
+
+        Uses a single ``UPDATE ... RETURNING`` over a ``FOR UPDATE SKIP LOCKED``
+        subquery, so concurrent workers never claim the same job. The subquery
+        is wrapped in ``ANY(ARRAY(...))`` so Postgres evaluates it exactly once.
 
         Args:
             db: Database session
+            limit: Maximum number of jobs to claim
 
         Returns:
-            Next job to process or None
+            Claimed jobs, oldest first (empty if none are due)
         """
-        stmt = select(Job).where(Job.status == JobStatus.PENDING).order_by(Job.created_at).limit(1)
+        pending = (
+            select(Job.id)
+            .where(
+                Job.status == JobStatus.PENDING,
+                or_(Job.scheduled_at.is_(None), Job.scheduled_at <= func.now()),
+            )
+            .order_by(func.coalesce(Job.scheduled_at, Job.created_at))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(Job)
+            .where(Job.id == any_(func.array(pending.scalar_subquery())))
+            .values(status=JobStatus.RUNNING, started_at=func.now())
+            .returning(Job)
+            .execution_options(synchronize_session=False)
+        )
 
         result = await db.execute(stmt)
-        job = result.scalar_one_or_none()
+        jobs = sorted(result.scalars().all(), key=lambda job: job.scheduled_at or job.created_at)
+        await db.commit()
 
-        if job:
-            # Mark as running
-            job.status = JobStatus.RUNNING
-            job.started_at = datetime.now(UTC)
-            await db.commit()
-            await db.refresh(job)
+        return jobs
 
-        return job
-
-    async def _process_job(self, job_id: int) -> None:
+    async def _process_job(self, job: JobSnapshot) -> None:
         """Process a single job.
 
+        The claim step already loaded the row, so the task runs without a
+        session; one is opened only to record the outcome.
+
         Args:
-            job_id: Job ID to process
+            job: Snapshot of the claimed job
         """
-        async with AsyncSessionLocal() as db:
-            try:
-                # Get job
-                stmt = select(Job).where(Job.id == job_id)
-                result = await db.execute(stmt)
-                job = result.scalar_one_or_none()
+        try:
+            logger.info(
+                "Processing job",
+                extra={
+                    "job_id": job.id,
+                    "task_name": job.task_name,
+                    "job_type": job.job_type.value,
+                },
+            )
 
-                if not job:
-                    logger.error("Job not found", extra={"job_id": job_id})
-                    return
+            # Get task function
+            task_func = self._get_task(job.task_name)
+            if not task_func:
+                raise WorkerError(f"Task not found: {job.task_name}")
 
-                logger.info(
-                    "Processing job",
+            # Parse task args
+            try:
+                task_args = from_json(job.task_args) if job.task_args else {}
+            except ValueError as e:
+                logger.error(
+                    "Invalid JSON in task args",
                     extra={
                         "job_id": job.id,
                         "task_name": job.task_name,
-                        "job_type": job.job_type.value,
+                        "error": str(e),
                     },
                 )
+                raise WorkerError(f"Invalid JSON in task arguments: {e}") from e
 
-                # Get task function
-                task_func = TASK_REGISTRY.get(job.task_name)
-                if not task_func:
-                    raise WorkerError(f"Task not found: {job.task_name}")
-
-                # Parse task args
-                try:
-                    task_args = json.loads(job.task_args) if job.task_args else {}
-                except json.JSONDecodeError as e:
-                    logger.error(
-                        "Invalid JSON in task args",
-                        extra={
-                            "job_id": job.id,
-                            "task_name": job.task_name,
-                            "error": str(e),
-                        },
-                    )
-                    raise WorkerError(f"Invalid JSON in task arguments: {e}") from e
-
-                # Execute task with timeout
-                try:
-                    result = await asyncio.wait_for(
-                        task_func(**task_args), timeout=self.task_timeout
-                    )
-                except TimeoutError:
-                    logger.error(
-                        "Task timed out",
-                        extra={
-                            "job_id": job.id,
-                            "task_name": job.task_name,
-                            "timeout": self.task_timeout,
-                        },
-                    )
-                    raise WorkerError(f"Task timed out after {self.task_timeout} seconds") from None
-
-                # Mark as completed
-                job.status = JobStatus.COMPLETED
-                job.completed_at = datetime.now(UTC)
-                job.progress = 100
-                job.result = json.dumps(result) if result else None
-                await db.commit()
-
-                logger.info(
-                    "Job completed successfully",
+            # Execute task with timeout (runs in this task, so cancel_job() reaches it directly)
+            try:
+                async with asyncio.timeout(self.task_timeout):
+                    result = await task_func(**task_args)
+            except TimeoutError:
+                logger.error(
+                    "Task timed out",
+                    extra={
+                        "job_id": job.id,
+                        "task_name": job.task_name,
+                        "timeout": self.task_timeout,
+                    },
+                )
+                raise WorkerError(f"Task timed out after {self.task_timeout} seconds") from None
+
+            # Mark as completed
+            stored_result, in_file = await store_result(job.id, result)
+            async with AsyncSessionLocal() as db:
+                completed = await self._complete_job(db, job.id, stored_result, in_file)
+
+            if not completed:
+                # Cancelled (or deleted) while running; keep its current state
+                await discard_result(job.id, in_file)
+                logger.warning(
+                    "Job no longer running, result discarded",
                     extra={"job_id": job.id, "task_name": job.task_name},
                 )
+                return
 
-            except Exception as e:
-                logger.error(
-                    "Job failed",
-                    extra={"job_id": job_id, "error": str(e)},
-                    exc_info=True,
-                )
+            logger.info(
+                "Job completed successfully",
+                extra={"job_id": job.id, "task_name": job.task_name},
+            )
+
+        except Exception as e:
+            logger.error(
+                "Job failed",
+                extra={"job_id": job.id, "error": str(e)},
+                exc_info=True,
+            )
+            await self._record_failure(job, e)
+
+    async def _complete_job(
+        self, db: AsyncSession, job_id: int, result: str | None, result_in_file: bool
+    ) -> bool:
+        """Move a running job to COMPLETED in one guarded UPDATE.
+
+        Args:
+            db: Database session
+            job_id: ID of the job
+            result: Serialized result for jobs.result
+            result_in_file: Whether the result was offloaded to the job's result file
+
+        Returns:
+            True if the job was still running and is now completed
+        """
+        stmt = (
+            update(Job)
+            .where(Job.id == job_id, Job.status == JobStatus.RUNNING)
+            .values(
+                status=JobStatus.COMPLETED,
+                completed_at=func.now(),
+                progress=100,
+                result=result,
+                result_in_file=result_in_file,
+            )
+            .returning(Job.id)
+        )
+        updated = (await db.execute(stmt)).scalar_one_or_none()
+        await db.commit()
+        return updated is not None
 
-                # Update job with error
-                try:
-                    stmt = select(Job).where(Job.id == job_id)
-                    result = await db.execute(stmt)
-                    job = result.scalar_one_or_none()
-
-                    if job:
-                        # Check if we should retry
-                        if job.retries < job.max_retries:
-                            # Calculate exponential backoff delay (capped at 5 minutes)
-                            delay_seconds = min(300, 2 ** (job.retries + 1))
-
-                            logger.info(
-                                "Job will retry after delay",
-                                extra={
-                                    "job_id": job.id,
-                                    "retry": job.retries + 1,
-                                    "max_retries": job.max_retries,
-                                    "delay_seconds": delay_seconds,
-                                },
-                            )
-
-                            # Wait before retrying (exponential backoff)
-                            await asyncio.sleep(delay_seconds)
-
-                            # Now set back to pending for retry
-                            job.status = JobStatus.PENDING
-                            job.retries += 1
-                            job.started_at = None
-                        else:
-                            job.status = JobStatus.FAILED
-                            job.completed_at = datetime.now(UTC)
-                            job.error = str(e)
-
-                        await db.commit()
-
-                except Exception as update_error:
-                    logger.error(
-                        "Failed to update job status",
-                        extra={"job_id": job_id, "error": str(update_error)},
-                        exc_info=True,
-                    )
+    async def _fail_job(
+        self, db: AsyncSession, job: JobSnapshot, error: Exception
+    ) -> JobStatus | None:
+        """Re-queue a running job for retry, or mark it FAILED, in one guarded UPDATE.
+
+        The claim snapshot carries the retry count; the status guard makes the
+        update a no-op if the job was cancelled or deleted in the meantime.
+
+        Args:
+            db: Database session
+            job: Snapshot of the failed job
+            error: Exception the job failed with
+
+        Returns:
+            The job's new status, or None if it was no longer running
+        """
+        if job.retries < job.max_retries:
+            # Calculate exponential backoff delay (capped at 5 minutes)
+            delay_seconds = min(300, 2 ** (job.retries + 1))
+            # Re-queue with a backoff instead of holding this slot while waiting
+            values = {
+                "status": JobStatus.PENDING,
+                "retries": job.retries + 1,
+                "started_at": None,
+                "scheduled_at": func.now() + timedelta(seconds=delay_seconds),
+            }
+        else:
+            values = {
+                "status": JobStatus.FAILED,
+                "completed_at": func.now(),
+                "error": str(error),
+            }
+
+        stmt = (
+            update(Job)
+            .where(Job.id == job.id, Job.status == JobStatus.RUNNING)
+            .values(**values)
+            .returning(Job.status)
+        )
+        status = (await db.execute(stmt)).scalar_one_or_none()
+        await db.commit()
+        return status
+
+    async def _record_failure(self, job: JobSnapshot, error: Exception) -> None:
+        """Re-queue a failed job for retry, or mark it failed once retries run out.
+
+        Args:
+            job: Snapshot of the failed job
+            error: Exception the job failed with
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                status = await self._fail_job(db, job, error)
+        except Exception as update_error:
+            logger.error(
+                "Failed to update job status",
+                extra={"job_id": job.id, "error": str(update_error)},
+                exc_info=True,
+            )
+            return
+
+        if status == JobStatus.PENDING:
+            logger.info(
+                "Job scheduled for retry",
+                extra={
+                    "job_id": job.id,
+                    "retry": job.retries + 1,
+                    "max_retries": job.max_retries,
+                },
+            )
 
 
 # Global worker instance
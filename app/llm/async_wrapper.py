@@ -1,7 +1,11 @@
-"""Async wrapper for LLMWhisperer sync SDK using asyncio.to_thread()."""
+"""Async wrapper for LLMWhisperer sync SDK using a dedicated thread pool."""
 
 import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 from unstract.llmwhisperer import LLMWhispererClientV2
 
@@ -11,19 +15,49 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Whisper calls block for seconds to minutes; keep them off the default executor
+# so they can't starve asyncio.to_thread users (file I/O, DNS) elsewhere in the app.
+MAX_WHISPER_THREADS = 16
+_executor = ThreadPoolExecutor(max_workers=MAX_WHISPER_THREADS, thread_name_prefix="llmwhisperer")
+
+# whisper() defaults, pre-bound onto the SDK method once per client
+_WHISPER_DEFAULTS = {
+    "mode": "form",
+    "output_mode": "layout_preserving",
+    "wait_for_completion": True,
+    "wait_timeout": 200,
+}
+_WHISPER_DEFAULT_VALUES = tuple(_WHISPER_DEFAULTS.values())
+
 
 class AsyncLLMWhispererClient:
     """Async wrapper for LLMWhisperer sync SDK.
 
-    Uses asyncio.to_thread() to run blocking SDK calls in a thread pool,
-    enabling true concurrent async/await without blocking the event loop.
+    Runs blocking SDK calls on a module-level thread pool shared by all
+    instances, enabling true concurrent async/await without blocking the event loop.
     """
 
     def __init__(self):
         """Initialize the async wrapper with sync SDK client."""
         self.client = LLMWhispererClientV2()
+        self._executor = _executor
+        self._whisper_bound = functools.partial(self.client.whisper, **_WHISPER_DEFAULTS)
         logger.info("AsyncLLMWhispererClient initialized (wrapper around sync SDK)")
 
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking SDK call on the whisper thread pool.
+
+        Args:
+            func: Sync SDK method to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Whatever func returns
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
     async def whisper(
         self,
         file_path: str | Path,
@@ -56,15 +90,22 @@ class AsyncLLMWhispererClient:
             extra={"file_path": str(file_path), "mode": mode, "pages": pages_to_extract},
         )
 
-        # Run blocking SDK call in thread pool
-        result = await asyncio.to_thread(
-            self.client.whisper,
+        # Only rebind the defaults when the caller overrides one of them
+        whisper = self._whisper_bound
+        if (mode, output_mode, wait_for_completion, wait_timeout) != _WHISPER_DEFAULT_VALUES:
+            whisper = functools.partial(
+                whisper,
+                mode=mode,
+                output_mode=output_mode,
+                wait_for_completion=wait_for_completion,
+                wait_timeout=wait_timeout,
+            )
+
+        # Run blocking SDK call on the whisper thread pool
+        result = await self._run(
+            whisper,
             file_path=str(file_path),
-            mode=mode,
-            output_mode=output_mode,
             pages_to_extract=pages_to_extract or "",
-            wait_for_completion=wait_for_completion,
-            wait_timeout=wait_timeout,
             **kwargs,
         )
 
@@ -80,7 +121,7 @@ class AsyncLLMWhispererClient:
         Returns:
             Dict with status information
         """
-        return await asyncio.to_thread(self.client.whisper_status, whisper_hash)
+        return await self._run(self.client.whisper_status, whisper_hash)
 
     async def whisper_retrieve(self, whisper_hash: str) -> dict:
         """Retrieve results of a completed whisper job asynchronously.
@@ -91,4 +132,4 @@ class AsyncLLMWhispererClient:
         Returns:
             Dict with extraction results
         """
-        return await asyncio.to_thread(self.client.whisper_retrieve, whisper_hash)
+        return await self._run(self.client.whisper_retrieve, whisper_hash)
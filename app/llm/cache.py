@@ -1,11 +1,19 @@
 """Async file caching for LLMWhisperer API responses."""
 
+import asyncio
 import hashlib
-import json
+import os
+import zlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, TypeVar
 
 import aiofiles
+import aiofiles.os
+from pydantic import TypeAdapter
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
@@ -14,32 +22,120 @@ from app.llm.schemas import CachedWhisperResult, ProcessingMode
 logger = get_logger(__name__)
 settings = get_settings()
 
+T = TypeVar("T")
+
+
+# Cache keys are lookup keys, not security boundaries: a 128-bit BLAKE2b digest is
+# ample for collision resistance and cheaper than SHA-256 on short inputs.
+CACHE_KEY_DIGEST_SIZE = 16
+
+# Built once: validates and dumps cache files straight from/to bytes
+_result_adapter = TypeAdapter(CachedWhisperResult)
+
+# Entries at least this large are zlib-compressed on disk; extracted text shrinks
+# several-fold, cutting cache file I/O. Smaller entries stay plain JSON.
+COMPRESS_MIN_SIZE = 16 * 1024
+_COMPRESS_LEVEL = 1
+
+# zlib streams start with 0x78 ("x"); JSON entries start with "{" or whitespace
+_ZLIB_MAGIC = b"x"
+
+# (file_path, size, mtime_ns) -> fingerprint, most recently used last
+_fingerprints: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+_FINGERPRINT_MEMO_SIZE = 1024
+
+
+class _OwnerCancelledError(Exception):
+    """Set on an in-flight future when the caller running its factory is cancelled."""
+
+
+def _decode_entry(content: bytes) -> CachedWhisperResult:
+    """Parse a cache file's bytes, decompressing them first if needed."""
+    if content.startswith(_ZLIB_MAGIC):
+        content = zlib.decompress(content)
+    return _result_adapter.validate_json(content)
+
+
+@lru_cache(maxsize=1024)
+def _compute_key(source: str, mode_value: str) -> str:
+    """Hash a file path (or fingerprint) and processing mode into a cache key (memoized per pair)."""
+    return hashlib.blake2b(
+        f"{source}:{mode_value}".encode(), digest_size=CACHE_KEY_DIGEST_SIZE
+    ).hexdigest()
+
+
+def _content_digest(file_path: str, size: int) -> str:
+    """Hash a file's bytes into a size-prefixed fingerprint."""
+    with open(file_path, "rb") as f:
+        digest = hashlib.file_digest(
+            f, lambda: hashlib.blake2b(digest_size=CACHE_KEY_DIGEST_SIZE)
+        ).hexdigest()
+    return f"{size}-{digest}"
+
+
+async def file_fingerprint(file_path: str, stat: os.stat_result | None = None) -> str:
+    """Fingerprint a file by its content, so renamed or copied files share cache entries.
+
+    The content hash is only recomputed when the file's size or mtime changes.
+
+    Args:
+        file_path: Path to the file
+        stat: The file's stat result, if the caller already has it
+
+    Returns:
+        File size and BLAKE2b content digest, e.g. ``"1024-9f86d0..."``
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    if stat is None:
+        stat = await aiofiles.os.stat(file_path)
+    memo_key = (file_path, stat.st_size, stat.st_mtime_ns)
+
+    # Hot files skip the worker thread entirely: a dict lookup instead of re-hashing
+    fingerprint = _fingerprints.get(memo_key)
+    if fingerprint is not None:
+        _fingerprints.move_to_end(memo_key)
+        return fingerprint
+
+    fingerprint = await asyncio.to_thread(_content_digest, file_path, stat.st_size)
+    _fingerprints[memo_key] = fingerprint
+    if len(_fingerprints) > _FINGERPRINT_MEMO_SIZE:
+        _fingerprints.popitem(last=False)
+    return fingerprint
+
 
 class WhisperCache:
     """Async file-based cache for LLMWhisperer API responses."""
 
-    def __init__(self, cache_dir: Path | None = None) -> None:
+    def __init__(self, cache_dir: Path | None = None, memory_entries: int = 128) -> None:
         """Initialize the cache.
 
         Args:
             cache_dir: Directory to store cache files. Defaults to settings.cache_dir
+            memory_entries: Number of recent results kept in memory in front of the files
         """
         self.cache_dir = cache_dir or Path(settings.cache_dir) / "llmwhisperer"
+        self._mem: OrderedDict[str, CachedWhisperResult] = OrderedDict()
+        self._mem_max = memory_entries
+        self._inflight: dict[str, asyncio.Future[Any]] = {}  # cache_key -> pending computation
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         logger.info("WhisperCache initialized", extra={"cache_dir": str(self.cache_dir)})
 
-    def _get_cache_key(self, file_path: str, processing_mode: ProcessingMode) -> str:
+    def _get_cache_key(
+        self, file_path: str, processing_mode: ProcessingMode, fingerprint: str | None = None
+    ) -> str:
         """Generate a unique cache key for a file and processing mode.
 
         Args:
             file_path: Path to the PDF file
             processing_mode: Processing mode used
+            fingerprint: Content fingerprint; keys by it instead of the path when given
 
         Returns:
-            SHA256 hash as cache key
+            BLAKE2b hex digest as cache key
         """
-        key_str = f"{file_path}:{processing_mode.value}"
-        return hashlib.sha256(key_str.encode()).hexdigest()
+        return _compute_key(fingerprint or file_path, processing_mode.value)
 
     def _get_cache_file_path(self, cache_key: str) -> Path:
         """Get the file path for a cache key.
@@ -52,30 +148,53 @@ class WhisperCache:
         """
         return self.cache_dir / f"{cache_key}.json"
 
+    def _remember(self, cache_key: str, result: CachedWhisperResult) -> None:
+        """Add a result to the in-memory LRU, evicting the least recently used entry.
+
+        Args:
+            cache_key: Cache key hash
+            result: Result to keep in memory
+        """
+        self._mem[cache_key] = result
+        self._mem.move_to_end(cache_key)
+        if len(self._mem) > self._mem_max:
+            self._mem.popitem(last=False)
+
     async def get(
-        self, file_path: str, processing_mode: ProcessingMode
+        self, file_path: str, processing_mode: ProcessingMode, fingerprint: str | None = None
     ) -> CachedWhisperResult | None:
         """Retrieve cached result if available.
 
         Args:
             file_path: Path to the PDF file
             processing_mode: Processing mode used
+            fingerprint: Content fingerprint from file_fingerprint()
 
         Returns:
             Cached result or None if not found
         """
-        cache_key = self._get_cache_key(file_path, processing_mode)
-        cache_file = self._get_cache_file_path(cache_key)
+        cache_key = self._get_cache_key(file_path, processing_mode, fingerprint)
 
-        if not cache_file.exists():
-            logger.debug("Cache miss", extra={"file_path": file_path, "cache_key": cache_key})
-            return None
+        # Hot keys are served from memory without touching disk or re-parsing
+        result = self._mem.get(cache_key)
+        if result is not None:
+            self._mem.move_to_end(cache_key)
+            logger.debug(
+                "Cache hit (memory)", extra={"file_path": file_path, "cache_key": cache_key}
+            )
+            return result
+
+        cache_file = self._get_cache_file_path(cache_key)
 
         try:
-            async with aiofiles.open(cache_file, encoding="utf-8") as f:
+            async with aiofiles.open(cache_file, "rb") as f:
                 content = await f.read()
-                data = json.loads(content)
-                result = CachedWhisperResult(**data)
+                if content.startswith(_ZLIB_MAGIC):
+                    # Large entry: decompress off the event loop
+                    result = await asyncio.to_thread(_decode_entry, content)
+                else:
+                    result = _decode_entry(content)
+                self._remember(cache_key, result)
                 logger.info(
                     "Cache hit",
                     extra={
@@ -85,6 +204,10 @@ class WhisperCache:
                     },
                 )
                 return result
+        except FileNotFoundError:
+            # Let the open fail rather than stat first: one syscall, no blocking exists()
+            logger.debug("Cache miss", extra={"file_path": file_path, "cache_key": cache_key})
+            return None
         except Exception as e:
             logger.error(
                 "Cache read error",
@@ -93,6 +216,62 @@ class WhisperCache:
             )
             return None
 
+    async def get_or_compute(
+        self,
+        file_path: str,
+        processing_mode: ProcessingMode,
+        factory: Callable[[], Awaitable[T]],
+        fingerprint: str | None = None,
+    ) -> T:
+        """Run ``factory`` once per key, sharing its outcome with concurrent callers.
+
+        The first caller for a file and mode runs the factory; callers arriving
+        while it is in flight await the same result (or exception) instead of
+        repeating the work. If the first caller is cancelled, waiters retry
+        rather than being cancelled with it.
+
+        Args:
+            file_path: Path to the PDF file
+            processing_mode: Processing mode used
+            factory: Coroutine function producing the value on a miss
+            fingerprint: Content fingerprint from file_fingerprint()
+
+        Returns:
+            Value produced by the (single) factory call
+        """
+        cache_key = self._get_cache_key(file_path, processing_mode, fingerprint)
+
+        while (inflight := self._inflight.get(cache_key)) is not None:
+            logger.debug(
+                "Joining in-flight request", extra={"file_path": file_path, "cache_key": cache_key}
+            )
+            try:
+                # Shield so a cancelled waiter doesn't cancel the owner's future
+                return await asyncio.shield(inflight)
+            except _OwnerCancelledError:
+                # The owner was cancelled, the work itself didn't fail: retry,
+                # running the factory here unless another waiter already is
+                continue
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            # Not future.cancel(): that would cancel every waiter along with us
+            future.set_exception(_OwnerCancelledError())
+            future.exception()  # Mark retrieved; there may be no waiters
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved; the owner re-raises it below
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(cache_key, None)
+
     async def set(
         self,
         file_path: str,
@@ -100,6 +279,7 @@ class WhisperCache:
         whisper_hash: str,
         extracted_text: str,
         page_count: int | None = None,
+        fingerprint: str | None = None,
     ) -> None:
         """Store result in cache.
 
@@ -109,23 +289,29 @@ class WhisperCache:
             whisper_hash: Whisper hash from API
             extracted_text: Extracted text content
             page_count: Number of pages processed
+            fingerprint: Content fingerprint from file_fingerprint()
         """
-        cache_key = self._get_cache_key(file_path, processing_mode)
+        cache_key = self._get_cache_key(file_path, processing_mode, fingerprint)
         cache_file = self._get_cache_file_path(cache_key)
 
         result = CachedWhisperResult(
             whisper_hash=whisper_hash,
             extracted_text=extracted_text,
             file_path=file_path,
+            fingerprint=fingerprint,
             cached_at=datetime.now(UTC),
             processing_mode=processing_mode,
             page_count=page_count,
         )
 
         try:
-            async with aiofiles.open(cache_file, "w", encoding="utf-8") as f:
-                content = result.model_dump_json(indent=2)
-                await f.write(content)
+            # Compact bytes straight from the adapter: no indent, no str round-trip
+            payload = _result_adapter.dump_json(result)
+            if len(payload) >= COMPRESS_MIN_SIZE:
+                payload = await asyncio.to_thread(zlib.compress, payload, _COMPRESS_LEVEL)
+            async with aiofiles.open(cache_file, "wb") as f:
+                await f.write(payload)
+                self._remember(cache_key, result)
                 logger.info(
                     "Cache write successful",
                     extra={
@@ -142,34 +328,69 @@ class WhisperCache:
             )
 
     async def clear(
-        self, file_path: str | None = None, processing_mode: ProcessingMode | None = None
+        self,
+        file_path: str | None = None,
+        processing_mode: ProcessingMode | None = None,
+        fingerprint: str | None = None,
     ) -> int:
         """Clear cache entries.
 
         Args:
             file_path: If provided, clear only this file's cache
             processing_mode: If provided (with file_path), clear only this mode
+            fingerprint: Content fingerprint the entry was stored under, if any
 
         Returns:
             Number of cache entries cleared
         """
         if file_path and processing_mode:
             # Clear specific cache entry
-            cache_key = self._get_cache_key(file_path, processing_mode)
+            cache_key = self._get_cache_key(file_path, processing_mode, fingerprint)
             cache_file = self._get_cache_file_path(cache_key)
-            if cache_file.exists():
+            self._mem.pop(cache_key, None)
+            try:
                 cache_file.unlink()
-                logger.info(
-                    "Cache entry cleared", extra={"file_path": file_path, "cache_key": cache_key}
-                )
-                return 1
-            return 0
+            except FileNotFoundError:
+                return 0
+            logger.info(
+                "Cache entry cleared", extra={"file_path": file_path, "cache_key": cache_key}
+            )
+            return 1
 
         # Clear all cache
-        count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink()
-            count += 1
+        self._mem.clear()
+
+        def _sweep() -> int:
+            # scandir yields names without a stat per entry; no glob pattern matching
+            count = 0
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json"):
+                        os.unlink(entry.path)
+                        count += 1
+            return count
+
+        # Off the event loop: large cache directories can take a while to sweep
+        count = await asyncio.to_thread(_sweep)
 
         logger.info("Cache cleared", extra={"entries_cleared": count})
         return count
+
+
+_whisper_cache: WhisperCache | None = None
+
+
+def get_whisper_cache() -> WhisperCache:
+    """Get the process-wide WhisperCache.
+
+    Clients are created per request, so the cache is shared: its in-flight
+    registry is what lets concurrent requests for the same PDF share one API call,
+    and its in-memory LRU keeps hot files warm across requests.
+
+    Returns:
+        Shared WhisperCache instance
+    """
+    global _whisper_cache
+    if _whisper_cache is None:
+        _whisper_cache = WhisperCache()
+    return _whisper_cache
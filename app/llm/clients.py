@@ -1,26 +1,69 @@
 """LLMWhisperer API client implementation."""
 
 import asyncio
+import contextlib
+import functools
+import os
+import random
 import time
 from pathlib import Path
 
+import aiofiles.os
 import httpx
+from pydantic_core import from_json
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
-from app.llm.cache import WhisperCache
+from app.llm.cache import file_fingerprint, get_whisper_cache
 from app.llm.schemas import ProcessingMode, WhisperRequest, WhisperResponse
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 
+# Whisper-status polling: start fast for small documents, back off for long OCR jobs
+POLL_INITIAL_INTERVAL = 0.5  # seconds
+POLL_MAX_INTERVAL = 10.0  # seconds
+POLL_MAX_WAIT = 200.0  # seconds
+
+# Upper bound on the (pre-jitter) wait between API retries
+RETRY_MAX_BACKOFF = 30  # seconds
+
+
 class LLMWhispererError(Exception):
     """Base exception for LLMWhisperer client errors."""
 
     pass
 
 
+# Shared across client instances so keep-alive connections (and the TLS session)
+# to the LLMWhisperer API are reused instead of re-established per call
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 class LLMWhispererClient:
     """Async HTTP client for LLMWhisperer API."""
 
@@ -41,7 +84,7 @@ class LLMWhispererClient:
             base_url: API base URL. Defaults to official Unstract URL
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
-            use_cache: Whether to use file caching
+            use_cache: Whether to use the shared file cache
         """
         self.api_key = api_key or settings.unstract_api_key
         self.base_url = base_url or self.BASE_URL
@@ -52,7 +95,10 @@ class LLMWhispererClient:
         if not self.api_key:
             raise LLMWhispererError("UNSTRACT_API_KEY is required")
 
-        self.cache = WhisperCache() if use_cache else None
+        # Same for every request; built once rather than per upload and poll
+        self._headers = {"unstract-key": self.api_key}
+
+        self.cache = get_whisper_cache() if use_cache else None
 
         logger.info(
             "LLMWhispererClient initialized",
@@ -76,7 +122,8 @@ class LLMWhispererClient:
         Args:
             file_path: Path to the PDF file
             processing_mode: Processing mode for extraction
-            force_reprocess: Force reprocessing even if cached
+            force_reprocess: Bypass the local cache. A result the API still holds for
+                the cached whisper_hash is fetched instead of re-uploading the PDF
             **kwargs: Additional parameters for WhisperRequest
 
         Returns:
@@ -87,50 +134,137 @@ class LLMWhispererClient:
         """
         file_path_str = str(file_path)
 
+        # A single stat both validates the file and feeds the cache fingerprint
+        try:
+            stat = await aiofiles.os.stat(file_path_str)
+        except FileNotFoundError as e:
+            raise LLMWhispererError(f"File not found: {file_path_str}") from e
+
+        if not self.cache:
+            return await self._whisper_uncached(file_path_str, processing_mode, **kwargs)
+
+        # Key the cache by content so renamed or copied PDFs don't trigger new API calls
+        fingerprint = await file_fingerprint(file_path_str, stat)
+
         # Check cache first
-        if self.cache and not force_reprocess:
-            cached = await self.cache.get(file_path_str, processing_mode)
-            if cached:
-                logger.info("Returning cached result", extra={"file_path": file_path_str})
-                return WhisperResponse(
-                    whisper_hash=cached.whisper_hash,
-                    extracted_text=cached.extracted_text,
-                    status_code=200,
-                    processing_time=0.0,
-                    page_count=cached.page_count,
+        cached = await self.cache.get(file_path_str, processing_mode, fingerprint)
+        if cached and not force_reprocess:
+            logger.info("Returning cached result", extra={"file_path": file_path_str})
+            # Fields were validated when the cache entry was loaded; skip re-validating
+            return WhisperResponse.model_construct(
+                whisper_hash=cached.whisper_hash,
+                extracted_text=cached.extracted_text,
+                status_code=200,
+                processing_time=0.0,
+                page_count=cached.page_count,
+            )
+
+        if cached:
+            # The API may still hold this file's result: fetching it by hash skips
+            # re-uploading the PDF. Any failure falls through to a full upload.
+            try:
+                return await self._retrieve(cached.whisper_hash)
+            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                logger.info(
+                    "Stored whisper result unavailable, re-uploading",
+                    extra={"file_path": file_path_str, "error": str(e)},
                 )
 
-        # Validate file exists
-        if not Path(file_path).exists():
-            raise LLMWhispererError(f"File not found: {file_path}")
+        # Concurrent callers for the same file and mode share one API call
+        return await self.cache.get_or_compute(
+            file_path_str,
+            processing_mode,
+            functools.partial(
+                self._whisper_uncached,
+                file_path_str,
+                processing_mode,
+                fingerprint=fingerprint,
+                **kwargs,
+            ),
+            fingerprint,
+        )
+
+    async def whisper_many(
+        self,
+        file_paths: list[str | Path],
+        processing_mode: ProcessingMode = ProcessingMode.TEXT,
+        concurrency: int = 8,
+        **kwargs,
+    ) -> list[WhisperResponse | BaseException]:
+        """Extract text from several PDFs concurrently.
+
+        Up to ``concurrency`` files are in flight at once over the shared
+        connection pool. One failing file does not cancel the others.
+
+        Args:
+            file_paths: Paths to the PDF files
+            processing_mode: Processing mode for extraction
+            concurrency: Maximum number of files processed at the same time
+            **kwargs: Additional parameters for whisper()
+
+        Returns:
+            One entry per file, in input order: its WhisperResponse, or the
+            exception raised while processing it
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _whisper_one(file_path: str | Path) -> WhisperResponse:
+            async with semaphore:
+                return await self.whisper(file_path, processing_mode, **kwargs)
 
+        return await asyncio.gather(
+            *(_whisper_one(file_path) for file_path in file_paths), return_exceptions=True
+        )
+
+    async def _whisper_uncached(
+        self,
+        file_path: str,
+        processing_mode: ProcessingMode,
+        fingerprint: str | None = None,
+        **kwargs,
+    ) -> WhisperResponse:
+        """Call the API for a file and store the result in the cache.
+
+        Args:
+            file_path: Path to the PDF file
+            processing_mode: Processing mode for extraction
+            fingerprint: Content fingerprint to cache the result under
+            **kwargs: Additional parameters for WhisperRequest
+
+        Returns:
+            WhisperResponse with extracted text
+
+        Raises:
+            LLMWhispererError: If API call fails
+        """
         # Create request
         request = WhisperRequest(
-            file_path=file_path_str,
+            file_path=file_path,
             processing_mode=processing_mode,
             **kwargs,
         )
 
         # Call API with retries
-        start_time = time.time()
+        start_time = time.monotonic()
         response = await self._call_api_with_retry(request)
-        processing_time = time.time() - start_time
+        processing_time = time.monotonic() - start_time
 
         # Cache the result
         if self.cache:
             await self.cache.set(
-                file_path=file_path_str,
+                file_path=file_path,
                 processing_mode=processing_mode,
                 whisper_hash=response.whisper_hash,
                 extracted_text=response.extracted_text,
                 page_count=response.page_count,
+                fingerprint=fingerprint,
             )
 
         response.processing_time = processing_time
         logger.info(
             "Whisper completed",
             extra={
-                "file_path": file_path_str,
+                "file_path": file_path,
                 "processing_time": round(processing_time, 2),
                 "text_length": len(response.extracted_text),
                 "page_count": response.page_count,
@@ -149,9 +283,9 @@ class LLMWhispererClient:
             WhisperResponse from API
 
         Raises:
-            LLMWhispererError: If all retries fail
+            LLMWhispererError: If all retries fail or the request is not retryable
         """
-        last_error = None
+        last_error: Exception | None = None
 
         for attempt in range(self.max_retries):
             try:
@@ -166,7 +300,7 @@ class LLMWhispererClient:
 
                 # Exponential backoff for server errors
                 if attempt < self.max_retries - 1:
-                    wait_time = 2**attempt
+                    wait_time = min(2**attempt, RETRY_MAX_BACKOFF)
                     logger.warning(
                         "API call failed, retrying",
                         extra={
@@ -176,12 +310,13 @@ class LLMWhispererClient:
                             "status_code": e.response.status_code,
                         },
                     )
-                    await httpx.AsyncClient().aclose()  # Clean up
-                    time.sleep(wait_time)
-            except Exception as e:
+                    await asyncio.sleep(wait_time * (0.5 + random.random()))  # Jittered
+            except httpx.TransportError as e:
+                # Connection failures and timeouts are retried; anything else (a missing
+                # file, a failed whisper job) won't succeed on retry and propagates as is
                 last_error = e
                 if attempt < self.max_retries - 1:
-                    wait_time = 2**attempt
+                    wait_time = min(2**attempt, RETRY_MAX_BACKOFF)
                     logger.warning(
                         "API call failed, retrying",
                         extra={
@@ -191,7 +326,7 @@ class LLMWhispererClient:
                             "error": str(e),
                         },
                     )
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time * (0.5 + random.random()))  # Jittered
 
         # All retries failed
         raise LLMWhispererError(f"All {self.max_retries} API call attempts failed") from last_error
@@ -209,81 +344,111 @@ class LLMWhispererClient:
             httpx.HTTPStatusError: If API returns error status
             LLMWhispererError: If file cannot be read
         """
-        # Read file
+        # Open file; httpx streams it from disk in chunks instead of buffering it whole
         try:
-            with open(request.file_path, "rb") as f:
-                file_content = f.read()
+            file_obj = await asyncio.to_thread(open, request.file_path, "rb")
         except Exception as e:
             raise LLMWhispererError(f"Failed to read file: {request.file_path}") from e
 
         # Prepare request with correct LLMWhisperer API parameter names
         url = f"{self.base_url}/whisper"
-        headers = {"unstract-key": self.api_key}
-        files = {"file": (Path(request.file_path).name, file_content, "application/pdf")}
+        headers = self._headers
+        files = {"file": (os.path.basename(request.file_path), file_obj, "application/pdf")}
         data = {
-            "mode": request.processing_mode.value,  # API uses 'mode' not 'processing_mode'
+            # API uses 'mode' not 'processing_mode'. Keep .value: httpx form-encodes a
+            # (str, Enum) member via str(), which gives "ProcessingMode.TEXT"
+            "mode": request.processing_mode.value,
             "output_mode": "layout_preserving",  # Always preserve layout for tables
             "page_seperator": request.page_separator,  # Note: API uses 'seperator' (typo)
-            "force_text_processing": str(request.force_text_processing).lower(),
+            "force_text_processing": request.force_text_processing,  # httpx sends "true"/"false"
         }
 
         if request.pages_to_extract:
             data["pages_to_extract"] = request.pages_to_extract
 
-        # Make API call and poll for result
-        async with httpx.AsyncClient(timeout=self.timeout) as http_client:
-            # Submit whisper job
-            response = await http_client.post(url, headers=headers, files=files, data=data)
-            response.raise_for_status()
+        # Make API call and poll for result over the shared connection pool
+        http_client = get_http_client()
 
-            result = response.json()
-            whisper_hash = result.get("whisper_hash")
-
-            if not whisper_hash:
-                raise LLMWhispererError("No whisper_hash in API response")
+        # Submit whisper job
+        try:
+            response = await http_client.post(
+                url, headers=headers, files=files, data=data, timeout=self.timeout
+            )
+        finally:
+            file_obj.close()
+        response.raise_for_status()
+
+        result = response.json()
+        whisper_hash = result.get("whisper_hash")
+
+        if not whisper_hash:
+            raise LLMWhispererError("No whisper_hash in API response")
+
+        logger.debug(f"Whisper job submitted: {whisper_hash}")
+
+        # Poll for completion (similar to SDK's wait_for_completion=True). Each poll is a
+        # short request, so no connection is held open while the document is processed.
+        status_url = f"{self.base_url}/whisper-status"
+        poll_interval = POLL_INITIAL_INTERVAL
+        elapsed = 0.0
+
+        while elapsed < POLL_MAX_WAIT:
+            await asyncio.sleep(poll_interval)
+            elapsed += poll_interval
+            poll_interval = min(poll_interval * 2, POLL_MAX_INTERVAL)
+
+            # Check status
+            status_response = await http_client.get(
+                status_url,
+                headers=headers,
+                params={"whisper_hash": whisper_hash},
+                timeout=self.timeout,
+            )
+            status_response.raise_for_status()
+            status_data = status_response.json()
 
-            logger.debug(f"Whisper job submitted: {whisper_hash}")
+            status = status_data.get("status")
+            logger.debug(f"Whisper status: {status} (elapsed: {elapsed:g}s)")
 
-            # Poll for completion (similar to SDK's wait_for_completion=True)
-            status_url = f"{self.base_url}/whisper-status"
-            retrieve_url = f"{self.base_url}/whisper-retrieve"
-            max_wait = 200  # seconds
-            poll_interval = 2  # seconds
-            elapsed = 0
+            if status == "processed":
+                return await self._retrieve(whisper_hash)
+            elif status == "failed":
+                raise LLMWhispererError(f"Whisper job failed: {status_data.get('message')}")
 
-            while elapsed < max_wait:
-                await asyncio.sleep(poll_interval)
-                elapsed += poll_interval
+        raise LLMWhispererError(f"Whisper timeout after {POLL_MAX_WAIT:g}s")
 
-                # Check status
-                status_response = await http_client.get(
-                    status_url, headers=headers, params={"whisper_hash": whisper_hash}
-                )
-                status_response.raise_for_status()
-                status_data = status_response.json()
+    async def _retrieve(self, whisper_hash: str) -> WhisperResponse:
+        """Fetch the extracted text of a processed whisper job.
 
-                status = status_data.get("status")
-                logger.debug(f"Whisper status: {status} (elapsed: {elapsed}s)")
+        Args:
+            whisper_hash: Hash returned when the job was submitted
 
-                if status == "processed":
-                    # Retrieve result
-                    retrieve_response = await http_client.get(
-                        retrieve_url, headers=headers, params={"whisper_hash": whisper_hash}
-                    )
-                    retrieve_response.raise_for_status()
-                    extract_data = retrieve_response.json()
-
-                    return WhisperResponse(
-                        whisper_hash=whisper_hash,
-                        extracted_text=extract_data.get("extracted_text", ""),
-                        status_code=200,
-                        processing_time=0.0,  # Will be set by caller
-                        page_count=extract_data.get("page_count"),
-                    )
-                elif status == "failed":
-                    raise LLMWhispererError(f"Whisper job failed: {status_data.get('message')}")
+        Returns:
+            WhisperResponse from API
 
-            raise LLMWhispererError(f"Whisper timeout after {max_wait}s")
+        Raises:
+            httpx.HTTPStatusError: If API returns error status
+        """
+        retrieve_response = await get_http_client().get(
+            f"{self.base_url}/whisper-retrieve",
+            headers=self._headers,
+            params={"whisper_hash": whisper_hash},
+            timeout=self.timeout,
+        )
+        retrieve_response.raise_for_status()
+        # The body carries the full extracted text: parse it with pydantic-core
+        # rather than the stdlib json module behind response.json()
+        extract_data = from_json(retrieve_response.content)
+
+        # Built from our own field mapping of the parsed reply; skip re-validating
+        # the (possibly multi-megabyte) extracted text
+        return WhisperResponse.model_construct(
+            whisper_hash=whisper_hash,
+            extracted_text=extract_data.get("extracted_text", ""),
+            status_code=200,
+            processing_time=0.0,  # Will be set by caller
+            page_count=extract_data.get("page_count"),
+        )
 
     async def clear_cache(
         self, file_path: str | None = None, processing_mode: ProcessingMode | None = None
@@ -301,4 +466,10 @@ class LLMWhispererClient:
             logger.warning("Cache not enabled")
             return 0
 
-        return await self.cache.clear(file_path, processing_mode)
+        fingerprint = None
+        if file_path and processing_mode:
+            # Entries are keyed by content; a deleted file can only be cleared by path
+            with contextlib.suppress(FileNotFoundError):
+                fingerprint = await file_fingerprint(file_path)
+
+        return await self.cache.clear(file_path, processing_mode, fingerprint)
@@ -56,6 +56,7 @@ class CachedWhisperResult(BaseModel):
     whisper_hash: str
     extracted_text: str
     file_path: str
+    fingerprint: str | None = None
     cached_at: datetime
     processing_mode: ProcessingMode
     page_count: int | None = None
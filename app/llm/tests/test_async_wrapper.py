@@ -0,0 +1,54 @@
+"""Tests for the async LLMWhisperer SDK wrapper."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from app.llm.async_wrapper import AsyncLLMWhispererClient
+
+
+@pytest.fixture
+def client():
+    """Create a wrapper around a mocked sync SDK client."""
+    with patch("app.llm.async_wrapper.LLMWhispererClientV2"):
+        return AsyncLLMWhispererClient()
+
+
+@pytest.mark.asyncio
+async def test_whisper_runs_on_dedicated_pool(client):
+    """Test SDK calls run on the shared llmwhisperer thread pool."""
+    threads = []
+
+    def fake_whisper(**kwargs):
+        threads.append(threading.current_thread().name)
+        return {"whisper_hash": "abc123", **kwargs}
+
+    client.client.whisper.side_effect = fake_whisper
+
+    result = await client.whisper("test.pdf", pages_to_extract="1,2")
+
+    assert result["file_path"] == "test.pdf"
+    assert result["pages_to_extract"] == "1,2"
+    assert threads[0].startswith("llmwhisperer")
+
+
+@pytest.mark.asyncio
+async def test_whisper_binds_defaults_and_overrides(client):
+    """Test pre-bound SDK defaults are sent, and caller overrides win."""
+    client.client.whisper.side_effect = lambda **kwargs: kwargs
+
+    default = await client.whisper("test.pdf")
+    override = await client.whisper("test.pdf", mode="text", wait_timeout=30)
+
+    assert default["mode"] == "form"
+    assert default["wait_timeout"] == 200
+    assert override["mode"] == "text"
+    assert override["wait_timeout"] == 30
+    assert override["output_mode"] == "layout_preserving"
+
+
+def test_instances_share_executor():
+    """Test every wrapper reuses one pool instead of creating threads per instance."""
+    with patch("app.llm.async_wrapper.LLMWhispererClientV2"):
+        assert AsyncLLMWhispererClient()._executor is AsyncLLMWhispererClient()._executor
@@ -1,13 +1,20 @@
 """Tests for LLMWhisperer client."""
 
+import asyncio
+import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from app.llm.cache import WhisperCache
-from app.llm.clients import LLMWhispererClient, LLMWhispererError
-from app.llm.schemas import ProcessingMode, WhisperResponse
+from app.llm.cache import WhisperCache, _compute_key, file_fingerprint
+from app.llm.clients import (
+    LLMWhispererClient,
+    LLMWhispererError,
+    close_http_client,
+    get_http_client,
+)
+from app.llm.schemas import CachedWhisperResult, ProcessingMode, WhisperResponse
 
 
 @pytest.fixture
@@ -27,21 +34,23 @@ def test_pdf_file(tmp_path):
     return pdf_file
 
 
+@pytest.fixture(autouse=True)
+def whisper_cache(tmp_path, monkeypatch):
+    """Give each test its own shared cache in a temporary directory."""
+    cache = WhisperCache(cache_dir=tmp_path / "whisper_cache")
+    monkeypatch.setattr("app.llm.cache._whisper_cache", cache)
+    return cache
+
+
 @pytest.fixture
-async def client(mock_settings, tmp_path):
-    """Create a test client with temporary cache."""
-    cache_dir = tmp_path / "cache"
-    client = LLMWhispererClient(
+async def client(mock_settings, whisper_cache):
+    """Create a test client using the temporary shared cache."""
+    return LLMWhispererClient(
         api_key="test_api_key",
         timeout=10.0,
         max_retries=3,
         use_cache=True,
     )
-    # Override cache directory
-    if client.cache:
-        client.cache.cache_dir = cache_dir
-        cache_dir.mkdir(parents=True, exist_ok=True)
-    return client
 
 
 class TestLLMWhispererClient:
@@ -70,12 +79,37 @@ class TestLLMWhispererClient:
         assert client.max_retries == 5
         assert client.cache is None
 
+    @pytest.mark.asyncio
+    async def test_http_client_shared_until_closed(self):
+        """Test clients share one pooled HTTP client until shutdown closes it."""
+        http_client = get_http_client()
+        assert get_http_client() is http_client
+
+        await close_http_client()
+
+        assert http_client.is_closed
+        assert get_http_client() is not http_client
+        await close_http_client()
+
     @pytest.mark.asyncio
     async def test_whisper_file_not_found(self, client):
         """Test whisper with non-existent file."""
         with pytest.raises(LLMWhispererError, match="File not found"):
             await client.whisper("/nonexistent/file.pdf")
 
+    @pytest.mark.asyncio
+    async def test_whisper_file_not_found_without_cache(self, mock_settings):
+        """Test missing files are rejected before any API call when caching is off."""
+        client = LLMWhispererClient(api_key="test_key", use_cache=False)
+
+        with (
+            patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+            pytest.raises(LLMWhispererError, match="File not found"),
+        ):
+            await client.whisper("/nonexistent/file.pdf")
+
+        mock_post.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_whisper_success(self, client, test_pdf_file):
         """Test successful whisper call."""
@@ -103,6 +137,200 @@ class TestLLMWhispererClient:
             call_kwargs = mock_post.call_args.kwargs
             assert call_kwargs["headers"]["unstract-key"] == "test_api_key"
 
+    @pytest.mark.asyncio
+    async def test_whisper_streams_upload(self, client, test_pdf_file):
+        """Test the PDF is uploaded from an open file handle that is closed afterwards."""
+        submit_response = MagicMock()
+        submit_response.json.return_value = {"whisper_hash": "abc123"}
+        status_response = MagicMock()
+        status_response.json.return_value = {"status": "processed"}
+        retrieve_response = MagicMock()
+        retrieve_response.content = b'{"extracted_text": "Streamed", "page_count": 1}'
+
+        with (
+            patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+            patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get,
+            patch("app.llm.clients.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_post.return_value = submit_response
+            mock_get.side_effect = [status_response, retrieve_response]
+
+            result = await client.whisper(test_pdf_file)
+
+            assert result.extracted_text == "Streamed"
+            name, upload, content_type = mock_post.call_args.kwargs["files"]["file"]
+            assert name == test_pdf_file.name
+            assert content_type == "application/pdf"
+            assert not isinstance(upload, bytes)
+            assert upload.closed
+
+    @pytest.mark.asyncio
+    async def test_whisper_polls_with_backoff(self, client, test_pdf_file):
+        """Test whisper-status is polled with exponentially growing, capped intervals."""
+        submit_response = MagicMock()
+        submit_response.json.return_value = {"whisper_hash": "abc123"}
+        processing_response = MagicMock()
+        processing_response.json.return_value = {"status": "processing"}
+        status_response = MagicMock()
+        status_response.json.return_value = {"status": "processed"}
+        retrieve_response = MagicMock()
+        retrieve_response.content = b'{"extracted_text": "Done", "page_count": 1}'
+
+        with (
+            patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+            patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get,
+            patch("app.llm.clients.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_post.return_value = submit_response
+            mock_get.side_effect = [processing_response] * 6 + [status_response, retrieve_response]
+
+            result = await client.whisper(test_pdf_file)
+
+        assert result.extracted_text == "Done"
+        waits = [call.args[0] for call in mock_sleep.await_args_list]
+        assert waits == [0.5, 1.0, 2.0, 4.0, 8.0, 10.0, 10.0]
+
+    @pytest.mark.asyncio
+    async def test_whisper_form_fields(self, client, test_pdf_file):
+        """Test the mode and flags are form-encoded as the API expects."""
+        submit_response = MagicMock()
+        submit_response.json.return_value = {"whisper_hash": "abc123"}
+        status_response = MagicMock()
+        status_response.json.return_value = {"status": "processed"}
+        retrieve_response = MagicMock()
+        retrieve_response.content = b'{"extracted_text": "Form", "page_count": 1}'
+
+        with (
+            patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+            patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get,
+            patch("app.llm.clients.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_post.return_value = submit_response
+            mock_get.side_effect = [status_response, retrieve_response]
+
+            await client.whisper(test_pdf_file, processing_mode=ProcessingMode.HIGH_QUALITY)
+
+        body = httpx.Request("POST", "https://test", data=mock_post.call_args.kwargs["data"]).read()
+        fields = dict(pair.split("=") for pair in body.decode().split("&"))
+        assert fields["mode"] == "high_quality"
+        assert fields["force_text_processing"] == "false"
+
+    @pytest.mark.asyncio
+    async def test_whisper_copy_uses_cache(self, client, test_pdf_file):
+        """Test a renamed copy of an already processed PDF is served from the cache."""
+        submit_response = MagicMock()
+        submit_response.json.return_value = {"whisper_hash": "abc123"}
+        status_response = MagicMock()
+        status_response.json.return_value = {"status": "processed"}
+        retrieve_response = MagicMock()
+        retrieve_response.content = b'{"extracted_text": "Same bytes", "page_count": 1}'
+        copy = test_pdf_file.with_name("renamed.pdf")
+        copy.write_bytes(test_pdf_file.read_bytes())
+
+        with (
+            patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+            patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get,
+            patch("app.llm.clients.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_post.return_value = submit_response
+            mock_get.side_effect = [status_response, retrieve_response]
+
+            await client.whisper(test_pdf_file)
+            result = await client.whisper(copy)
+
+            assert mock_post.call_count == 1
+            assert result.extracted_text == "Same bytes"
+
+    @pytest.mark.asyncio
+    async def test_whisper_many_bounded(self, client, tmp_path):
+        """Test batch whispering runs at most `concurrency` files at once, in input order."""
+        paths = [tmp_path / f"doc{i}.pdf" for i in range(5)]
+        in_flight = 0
+        peak = 0
+
+        async def fake_whisper(file_path, processing_mode, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if file_path.name == "doc3.pdf":
+                raise LLMWhispererError("boom")
+            return file_path.name
+
+        with patch.object(client, "whisper", side_effect=fake_whisper):
+            results = await client.whisper_many(paths, concurrency=2)
+
+        assert peak == 2
+        assert results[:3] == ["doc0.pdf", "doc1.pdf", "doc2.pdf"]
+        assert isinstance(results[3], LLMWhispererError)
+        assert results[4] == "doc4.pdf"
+
+    @pytest.mark.asyncio
+    async def test_whisper_cache_hit_response(self, client, test_pdf_file):
+        """Test a cache hit is returned as a complete WhisperResponse without an API call."""
+        await client.cache.set(
+            str(test_pdf_file),
+            ProcessingMode.TEXT,
+            "abc123",
+            "Cached text",
+            page_count=2,
+            fingerprint=await file_fingerprint(str(test_pdf_file)),
+        )
+
+        with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+            result = await client.whisper(test_pdf_file)
+
+        mock_post.assert_not_called()
+        assert result.model_dump() == {
+            "whisper_hash": "abc123",
+            "extracted_text": "Cached text",
+            "status_code": 200,
+            "processing_time": 0.0,
+            "page_count": 2,
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stored", [True, False], ids=["retrieved", "reuploaded"])
+    async def test_whisper_force_reprocess_retrieves_by_hash(self, client, test_pdf_file, stored):
+        """Test force_reprocess fetches a still-stored result before re-uploading the PDF."""
+        await client.cache.set(
+            str(test_pdf_file),
+            ProcessingMode.TEXT,
+            "old123",
+            "Cached text",
+            fingerprint=await file_fingerprint(str(test_pdf_file)),
+        )
+        submit_response = MagicMock()
+        submit_response.json.return_value = {"whisper_hash": "new456"}
+        status_response = MagicMock()
+        status_response.json.return_value = {"status": "processed"}
+        retrieve_response = MagicMock()
+        retrieve_response.content = b'{"extracted_text": "Fresh text", "page_count": 1}'
+        missing_response = MagicMock()
+        missing_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "404", request=MagicMock(), response=MagicMock(status_code=404)
+        )
+
+        with (
+            patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+            patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get,
+            patch("app.llm.clients.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_post.return_value = submit_response
+            mock_get.side_effect = (
+                [retrieve_response]
+                if stored
+                else [missing_response, status_response, retrieve_response]
+            )
+
+            result = await client.whisper(test_pdf_file, force_reprocess=True)
+
+        assert result.extracted_text == "Fresh text"
+        assert mock_get.call_args_list[0].kwargs["params"] == {"whisper_hash": "old123"}
+        assert mock_post.call_count == (0 if stored else 1)
+        assert result.whisper_hash == ("old123" if stored else "new456")
+
     @pytest.mark.asyncio
     async def test_whisper_with_cache(self, client, test_pdf_file):
         """Test that second call uses cache."""
@@ -183,16 +411,73 @@ class TestLLMWhispererClient:
                 "500", request=MagicMock(), response=mock_response
             )
 
-            # Mock time.sleep to avoid actual waiting
+            # Mock asyncio.sleep to avoid actual waiting
             with (
-                patch("time.sleep"),
+                patch("app.llm.clients.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
                 pytest.raises(LLMWhispererError, match="All 3 API call attempts failed"),
             ):
                 await client.whisper(test_pdf_file)
 
-            # Should retry 3 times
+            # Should retry 3 times, backing off (with jitter) without blocking the loop
+            assert mock_post.call_count == 3
+            waits = [call.args[0] for call in mock_sleep.await_args_list]
+            assert len(waits) == 2
+            assert 0.5 <= waits[0] < 1.5
+            assert 1.0 <= waits[1] < 3.0
+
+    @pytest.mark.asyncio
+    async def test_whisper_retry_on_transport_error(self, client, test_pdf_file):
+        """Test connection errors are retried."""
+        with (
+            patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+            patch("app.llm.clients.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_post.side_effect = httpx.ConnectError("Connection refused")
+
+            with pytest.raises(LLMWhispererError, match="All 3 API call attempts failed"):
+                await client.whisper(test_pdf_file)
+
             assert mock_post.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_whisper_retry_backoff_capped(self, mock_settings, test_pdf_file):
+        """Test the retry backoff stops growing at RETRY_MAX_BACKOFF."""
+        client = LLMWhispererClient(api_key="test_key", max_retries=8, use_cache=False)
+
+        with (
+            patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+            patch("app.llm.clients.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("app.llm.clients.random.random", return_value=0.5),
+        ):
+            mock_post.side_effect = httpx.ConnectError("Connection refused")
+
+            with pytest.raises(LLMWhispererError, match="All 8 API call attempts failed"):
+                await client.whisper(test_pdf_file)
+
+        waits = [call.args[0] for call in mock_sleep.await_args_list]
+        assert waits == [1, 2, 4, 8, 16, 30, 30]
+
+    @pytest.mark.asyncio
+    async def test_whisper_job_failure_not_retried(self, client, test_pdf_file):
+        """Test a failed whisper job is reported without retrying the upload."""
+        submit_response = MagicMock()
+        submit_response.json.return_value = {"whisper_hash": "abc123"}
+        status_response = MagicMock()
+        status_response.json.return_value = {"status": "failed", "message": "Corrupt PDF"}
+
+        with (
+            patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post,
+            patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get,
+            patch("app.llm.clients.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_post.return_value = submit_response
+            mock_get.return_value = status_response
+
+            with pytest.raises(LLMWhispererError, match="Corrupt PDF"):
+                await client.whisper(test_pdf_file)
+
+            assert mock_post.call_count == 1
+
     @pytest.mark.asyncio
     async def test_whisper_with_processing_mode(self, client, test_pdf_file):
         """Test whisper with different processing modes."""
@@ -259,6 +544,46 @@ class TestLLMWhispererClient:
             await client.whisper(test_pdf_file)
             assert mock_post.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_clients_share_in_flight_call(self, mock_settings, test_pdf_file):
+        """Test separate clients (one per request) share a single API call for one PDF."""
+        release = asyncio.Event()
+        response = WhisperResponse(
+            whisper_hash="abc123", extracted_text="Shared", status_code=200, processing_time=0.0
+        )
+
+        async def slow_whisper(*args, **kwargs):
+            await release.wait()
+            return response
+
+        first, second = (LLMWhispererClient(api_key="test_key") for _ in range(2))
+        assert first.cache is second.cache
+
+        with patch.object(
+            LLMWhispererClient, "_whisper_uncached", side_effect=slow_whisper
+        ) as mock_uncached:
+            tasks = [asyncio.create_task(c.whisper(test_pdf_file)) for c in (first, second)]
+            await asyncio.sleep(0.01)
+            release.set()
+
+            assert await asyncio.gather(*tasks) == [response, response]
+            mock_uncached.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_clients_share_memory_entries(self, mock_settings, test_pdf_file):
+        """Test a result cached by one client is served to another from memory."""
+        first, second = (LLMWhispererClient(api_key="test_key") for _ in range(2))
+        fingerprint = await file_fingerprint(str(test_pdf_file))
+        await first.cache.set(
+            str(test_pdf_file), ProcessingMode.TEXT, "abc123", "Hot", fingerprint=fingerprint
+        )
+
+        with patch("app.llm.cache.aiofiles.open") as mock_open:
+            result = await second.whisper(test_pdf_file)
+
+        mock_open.assert_not_called()
+        assert result.extracted_text == "Hot"
+
     @pytest.mark.asyncio
     async def test_client_without_cache(self, test_pdf_file):
         """Test client with caching disabled."""
@@ -281,6 +606,68 @@ class TestWhisperCache:
         cache_dir.mkdir()
         return WhisperCache(cache_dir=cache_dir)
 
+    def test_cache_key_memoized(self, cache):
+        """Test cache keys are stable per (file, mode) and computed once."""
+        _compute_key.cache_clear()
+
+        key = cache._get_cache_key("test.pdf", ProcessingMode.TEXT)
+
+        assert cache._get_cache_key("test.pdf", ProcessingMode.TEXT) == key
+        assert cache._get_cache_key("test.pdf", ProcessingMode.FORM) != key
+        assert _compute_key.cache_info().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_file_fingerprint_by_content(self, tmp_path):
+        """Test fingerprints depend on file content, not on the path."""
+        first = tmp_path / "a.pdf"
+        second = tmp_path / "b.pdf"
+        other = tmp_path / "c.pdf"
+        first.write_bytes(b"%PDF-1.4 same")
+        second.write_bytes(b"%PDF-1.4 same")
+        other.write_bytes(b"%PDF-1.4 different")
+
+        fingerprint = await file_fingerprint(str(first))
+
+        assert fingerprint.startswith(f"{len(b'%PDF-1.4 same')}-")
+        assert await file_fingerprint(str(second)) == fingerprint
+        assert await file_fingerprint(str(other)) != fingerprint
+
+    @pytest.mark.asyncio
+    async def test_file_fingerprint_memoized(self, tmp_path):
+        """Test an unchanged file is fingerprinted once, then served from memory."""
+        pdf = tmp_path / "a.pdf"
+        pdf.write_bytes(b"%PDF-1.4 hot")
+        fingerprint = await file_fingerprint(str(pdf))
+
+        with patch("app.llm.cache.asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
+            assert await file_fingerprint(str(pdf)) == fingerprint
+            mock_thread.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_file_fingerprint_detects_changes(self, tmp_path):
+        """Test rewriting a file in place, even at the same size, changes its fingerprint."""
+        pdf = tmp_path / "a.pdf"
+        pdf.write_bytes(b"%PDF-1.4 v1")
+        original = await file_fingerprint(str(pdf))
+
+        pdf.write_bytes(b"%PDF-1.4 v2")
+        stat = pdf.stat()
+        os.utime(pdf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert await file_fingerprint(str(pdf)) != original
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_fingerprint(self, cache):
+        """Test entries stored with a fingerprint are found from any path."""
+        await cache.set("a.pdf", ProcessingMode.TEXT, "abc123", "Test text", fingerprint="13-ff")
+        cache._mem.clear()
+
+        result = await cache.get("b.pdf", ProcessingMode.TEXT, fingerprint="13-ff")
+
+        assert result.whisper_hash == "abc123"
+        assert result.fingerprint == "13-ff"
+        assert await cache.get("a.pdf", ProcessingMode.TEXT) is None
+
     @pytest.mark.asyncio
     async def test_cache_miss(self, cache):
         """Test cache miss returns None."""
@@ -367,3 +754,132 @@ class TestWhisperCache:
         result2 = await cache.get("test2.pdf", ProcessingMode.TEXT)
         assert result1 is None
         assert result2 is not None
+
+    @pytest.mark.asyncio
+    async def test_clear_missing_entry(self, cache):
+        """Test clearing an entry that was never cached."""
+        cleared = await cache.clear("missing.pdf", ProcessingMode.TEXT)
+        assert cleared == 0
+
+    @pytest.mark.asyncio
+    async def test_memory_hit_skips_disk(self, cache):
+        """Test recently used entries are served from memory."""
+        await cache.set("test.pdf", ProcessingMode.TEXT, "abc123", "Test text")
+
+        # Remove the file behind the cache's back; memory still answers
+        for cache_file in cache.cache_dir.glob("*.json"):
+            cache_file.unlink()
+
+        result = await cache.get("test.pdf", ProcessingMode.TEXT)
+        assert result is not None
+        assert result.whisper_hash == "abc123"
+
+    @pytest.mark.asyncio
+    async def test_memory_evicts_least_recent(self, tmp_path):
+        """Test the in-memory layer is bounded and falls back to disk."""
+        cache = WhisperCache(cache_dir=tmp_path, memory_entries=1)
+        await cache.set("test1.pdf", ProcessingMode.TEXT, "hash1", "text1")
+        await cache.set("test2.pdf", ProcessingMode.TEXT, "hash2", "text2")
+
+        assert list(cache._mem) == [cache._get_cache_key("test2.pdf", ProcessingMode.TEXT)]
+
+        result = await cache.get("test1.pdf", ProcessingMode.TEXT)
+        assert result.whisper_hash == "hash1"
+
+    @pytest.mark.asyncio
+    async def test_reads_indented_cache_file(self, tmp_path):
+        """Test files written compactly and older pretty-printed files both load."""
+        writer = WhisperCache(cache_dir=tmp_path)
+        await writer.set("test.pdf", ProcessingMode.TEXT, "abc123", "Test text")
+        cache_file = next(tmp_path.glob("*.json"))
+        assert b"\n" not in cache_file.read_bytes()
+
+        legacy = CachedWhisperResult.model_validate_json(cache_file.read_bytes())
+        cache_file.write_text(legacy.model_dump_json(indent=2), encoding="utf-8")
+
+        result = await WhisperCache(cache_dir=tmp_path).get("test.pdf", ProcessingMode.TEXT)
+        assert result == legacy
+
+    @pytest.mark.asyncio
+    async def test_large_entries_compressed(self, cache):
+        """Test large entries are stored compressed and read back intact."""
+        text = "Revenue 1,234 5,678\n" * 2000
+        await cache.set("big.pdf", ProcessingMode.TEXT, "big", text)
+        await cache.set("small.pdf", ProcessingMode.TEXT, "small", "Short text")
+        cache._mem.clear()
+
+        big_file = cache._get_cache_file_path(cache._get_cache_key("big.pdf", ProcessingMode.TEXT))
+        small_file = cache._get_cache_file_path(
+            cache._get_cache_key("small.pdf", ProcessingMode.TEXT)
+        )
+        assert big_file.stat().st_size < len(text) // 4
+        assert small_file.read_bytes().startswith(b"{")
+        assert (await cache.get("big.pdf", ProcessingMode.TEXT)).extracted_text == text
+        assert (await cache.get("small.pdf", ProcessingMode.TEXT)).extracted_text == "Short text"
+
+    @pytest.mark.asyncio
+    async def test_get_or_compute_single_flight(self, cache):
+        """Test concurrent callers for one key share a single computation."""
+        release = asyncio.Event()
+        calls = []
+
+        async def factory():
+            calls.append(1)
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(cache.get_or_compute("test.pdf", ProcessingMode.TEXT, factory))
+        second = asyncio.create_task(cache.get_or_compute("test.pdf", ProcessingMode.TEXT, factory))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(first, second) == ["result", "result"]
+        assert len(calls) == 1
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_get_or_compute_shares_errors(self, cache):
+        """Test a failed computation is raised to every waiting caller."""
+        release = asyncio.Event()
+
+        async def failing():
+            await release.wait()
+            raise LLMWhispererError("boom")
+
+        tasks = [
+            asyncio.create_task(cache.get_or_compute("test.pdf", ProcessingMode.TEXT, failing))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, LLMWhispererError) for r in results)
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_get_or_compute_owner_cancelled(self, cache):
+        """Test cancelling the owner makes a waiter retry instead of cancelling it."""
+        started = asyncio.Event()
+        calls = []
+
+        async def blocked():
+            calls.append("owner")
+            started.set()
+            await asyncio.Event().wait()
+
+        async def factory():
+            calls.append("waiter")
+            return "result"
+
+        owner = asyncio.create_task(cache.get_or_compute("test.pdf", ProcessingMode.TEXT, blocked))
+        await started.wait()
+        waiter = asyncio.create_task(cache.get_or_compute("test.pdf", ProcessingMode.TEXT, factory))
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        assert await waiter == "result"
+        assert calls == ["owner", "waiter"]
+        assert cache._inflight == {}
@@ -14,6 +14,10 @@ To run the application:
     Production:
         uv run uvicorn app.main:app --host 0.0.0.0 --port 8123 --workers 4
 
+    uvicorn[standard] installs uvloop and httptools (except on Windows), and
+    uvicorn's default --loop auto / --http auto select them when present, so
+    no uvloop.install() or extra flags are needed.
+
 Access the API documentation:
     Swagger UI: http://localhost:8123/docs
     ReDoc: http://localhost:8123/redoc
@@ -44,6 +48,14 @@ from app.detection import router as detection_router
 from app.extraction import router as extraction_router
 from app.jobs import router as jobs_router
 from app.jobs.worker import get_worker
+from app.llm.clients import close_http_client
+from app.notifications.queue import start_email_workers, stop_email_workers
+from app.notifications.service import (
+    close_email_service,
+    get_email_service,
+    load_email_templates,
+)
+from app.shared.responses import CoreJSONResponse
 from app.statements import router as statements_router
 
 # Initialize settings and logger
@@ -60,12 +72,15 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     Startup:
         - Initialize database connection
         - Start background worker for job processing
+        - Start email workers draining the outgoing email queue
         - Run migrations (future)
         - Warm up caches (future)
         - Connect to external services (future)
 
     Shutdown:
         - Stop background worker
+        - Close the shared LLMWhisperer HTTP client
+        - Drain the email queue and close the pooled SMTP connections
         - Close database connections
         - Flush logs
         - Clean up resources
@@ -86,25 +101,39 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
         },
     )
 
+    # Independent startup steps run concurrently, so startup takes as long as the
+    # slowest step rather than their sum. Add cache warmups or service pings here.
+    # (The SMTP warmup and template loading log their own failures.)
+    db_result, _, _ = await asyncio.gather(
+        init_db(),
+        get_email_service().warmup(),
+        asyncio.to_thread(load_email_templates),
+        return_exceptions=True,
+    )
+
     # Initialize database
-    try:
-        await init_db()
-        logger.info("Database initialized successfully")
-    except Exception as e:
+    if isinstance(db_result, Exception):
         logger.error(
             "Failed to initialize database",
-            extra={"error": str(e)},
-            exc_info=True,
+            extra={"error": str(db_result)},
+            exc_info=db_result,
         )
         # Don't prevent startup if DB is unavailable
         # Health checks will report the issue
         logger.warning("Continuing without database connection")
+    elif isinstance(db_result, BaseException):
+        raise db_result
+    else:
+        logger.info("Database initialized successfully")
 
     # Start background worker
     worker = get_worker()
     worker_task = asyncio.create_task(worker.start())
     logger.info("Background worker started")
 
+    # Start email workers: one per pooled SMTP connection
+    start_email_workers(get_email_service().send_email, settings.smtp_max_concurrency)
+
     yield  # Application runs here
 
     # Shutdown
@@ -122,6 +151,29 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
             exc_info=True,
         )
 
+    # Close pooled LLMWhisperer API connections
+    try:
+        await close_http_client()
+        logger.info("HTTP client closed")
+    except Exception as e:
+        logger.error(
+            "Error closing HTTP client",
+            extra={"error": str(e)},
+            exc_info=True,
+        )
+
+    # Deliver queued emails, then close the pooled SMTP connections
+    try:
+        await stop_email_workers()
+        await close_email_service()
+        logger.info("Email service closed")
+    except Exception as e:
+        logger.error(
+            "Error closing email service",
+            extra={"error": str(e)},
+            exc_info=True,
+        )
+
     # Close database connections
     try:
         await close_db()
@@ -142,6 +194,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=CoreJSONResponse,
     lifespan=lifespan,
 )
 
@@ -1,6 +1,10 @@
 """Email notifications module."""
 
-from app.notifications.notifications import send_job_completion_email, send_welcome_email
+from app.notifications.notifications import (
+    send_job_completion_email,
+    send_job_completion_emails,
+    send_welcome_email,
+)
 from app.notifications.service import EmailService, EmailServiceError, get_email_service
 
 __all__ = [
@@ -10,5 +14,6 @@ __all__ = [
     "get_email_service",
     # Notification helpers
     "send_job_completion_email",
+    "send_job_completion_emails",
     "send_welcome_email",
 ]
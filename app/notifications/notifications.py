@@ -1,12 +1,52 @@
 """Notification helpers for sending specific types of emails."""
 
+import asyncio
+import functools
+import logging
+import re
+from email.utils import parseaddr
+from types import MappingProxyType
+from typing import Any
+
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.notifications.service import get_email_service
 
 logger = get_logger(__name__)
+# Underlying stdlib logger (structlog wraps it), for cheap level checks on hot paths
+_std_logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Template context shared by every notification email
+_BASE_CTX = MappingProxyType({"app_name": settings.app_name, "app_url": settings.app_url})
+
+_WELCOME_SUBJECT = f"Welcome to {settings.app_name}!"
+
+# Cheap local sanity check so malformed recipients never reach the SMTP server
+_VALID_ADDR = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+@functools.lru_cache(maxsize=16)
+def _title(status: str) -> str:
+    """Title-case a job status for a subject line (few distinct statuses)."""
+    return status.title()
+
+
+def _recipient_address(user_email: str) -> str | None:
+    """Extract the bare address from a recipient, or None if it is not a valid address.
+
+    Args:
+        user_email: Recipient, either ``user@example.com`` or ``Name <user@example.com>``
+
+    Returns:
+        Email address, or None (logged) if it is malformed
+    """
+    _, addr = parseaddr(user_email)
+    if not _VALID_ADDR.fullmatch(addr):
+        logger.warning("Invalid email recipient", extra={"user_email": user_email})
+        return None
+    return addr
+
 
 async def send_job_completion_email(
     user_email: str,
@@ -29,7 +69,8 @@ async def send_job_completion_email(
         error: Error message (if failed)
 
     Returns:
-        True if email sent successfully, False otherwise
+        True if email sent successfully, False otherwise (including for an
+        invalid recipient address)
 
     Example:
         await send_job_completion_email(
@@ -41,38 +82,70 @@ async def send_job_completion_email(
             result={"extraction_job_id": 456}
         )
     """
+    addr = _recipient_address(user_email)
+    if addr is None:
+        return False
+
     email_service = get_email_service()
 
-    subject = f"Job #{job_id} - {status.title()}"
+    subject = f"Job #{job_id} - {_title(status)}"
 
     context = {
+        **_BASE_CTX,
         "job_id": job_id,
         "task_name": task_name,
         "status": status,
         "processing_time": round(processing_time, 2) if processing_time else None,
         "result": result,
         "error": error,
-        "app_name": settings.app_name,
-        "app_url": "http://localhost:8123",  # TODO: Get from config
     }
 
-    logger.info(
-        "Sending job completion email",
-        extra={
-            "user_email": user_email,
-            "job_id": job_id,
-            "status": status,
-        },
-    )
+    # Skip building the log record on every completion when INFO is filtered out
+    if _std_logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Sending job completion email",
+            extra={
+                "user_email": user_email,
+                "job_id": job_id,
+                "status": status,
+            },
+        )
 
     return await email_service.send_template_email(
-        to_email=user_email,
+        to_email=addr,
         subject=subject,
         template_name="job_complete",
         **context,
     )
 
 
+async def send_job_completion_emails(jobs: list[dict[str, Any]]) -> list[bool | BaseException]:
+    """Send job completion emails for a batch of jobs concurrently.
+
+    Sends overlap up to ``settings.smtp_max_concurrency`` at a time (the size
+    of the email service's SMTP connection pool) instead of waiting on each
+    SMTP round-trip in turn.
+
+    Args:
+        jobs: Keyword arguments for send_job_completion_email(), one dict per email
+
+    Returns:
+        One entry per job, in input order: whether the email was sent, or the
+        exception raised while sending it
+
+    Example:
+        await send_job_completion_emails([
+            {"user_email": "a@example.com", "job_id": 1, "task_name": "extract_pdf",
+             "status": "completed"},
+            {"user_email": "b@example.com", "job_id": 2, "task_name": "extract_pdf",
+             "status": "failed", "error": "File not found"},
+        ])
+    """
+    return await asyncio.gather(
+        *(send_job_completion_email(**job) for job in jobs), return_exceptions=True
+    )
+
+
 async def send_welcome_email(
     user_email: str,
     user_name: str | None = None,
@@ -84,7 +157,8 @@ async def send_welcome_email(
         user_name: User's name or username (optional)
 
     Returns:
-        True if email sent successfully, False otherwise
+        True if email sent successfully, False otherwise (including for an
+        invalid recipient address)
 
     Example:
         await send_welcome_email(
@@ -92,28 +166,31 @@ async def send_welcome_email(
             user_name="John Doe"
         )
     """
+    addr = _recipient_address(user_email)
+    if addr is None:
+        return False
+
     email_service = get_email_service()
 
-    subject = f"Welcome to {settings.app_name}!"
+    subject = _WELCOME_SUBJECT
 
-    # Use email as name if name not provided
-    if not user_name:
-        user_name = user_email.split("@")[0]
+    # Use the address's local part as name if name not provided
+    user_name = user_name or addr.partition("@")[0]
 
     context = {
+        **_BASE_CTX,
         "user_name": user_name,
-        "user_email": user_email,
-        "app_name": settings.app_name,
-        "app_url": "http://localhost:8123",  # TODO: Get from config
+        "user_email": addr,
     }
 
-    logger.info(
-        "Sending welcome email",
-        extra={"user_email": user_email},
-    )
+    if _std_logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Sending welcome email",
+            extra={"user_email": user_email},
+        )
 
     return await email_service.send_template_email(
-        to_email=user_email,
+        to_email=addr,
         subject=subject,
         template_name="welcome",
         **context,
@@ -0,0 +1,113 @@
+"""In-process queue for outgoing email, drained by background workers.
+
+Request handlers and job tasks enqueue rendered emails and return immediately
+instead of waiting on the SMTP server; workers started from the application
+lifespan deliver them over the email service's connection pool.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Bound on queued emails; producers wait (backpressure) once it is reached
+EMAIL_QUEUE_MAXSIZE = 10_000
+
+EmailSender = Callable[[str, str, str, str | None], Awaitable[bool]]
+
+
+@dataclass(frozen=True, slots=True)
+class EmailJob:
+    """A rendered email waiting to be sent."""
+
+    to_email: str
+    subject: str
+    html_body: str
+    text_body: str | None = None
+
+
+_queue: asyncio.Queue[EmailJob] | None = None
+_workers: list[asyncio.Task[None]] = []
+
+
+async def enqueue_email(job: EmailJob) -> bool:
+    """Queue an email for background delivery.
+
+    Args:
+        job: Rendered email
+
+    Returns:
+        True if queued, False if no workers are running (the caller should send
+        the email itself)
+    """
+    if _queue is None:
+        return False
+
+    await _queue.put(job)
+    return True
+
+
+async def _email_worker(queue: asyncio.Queue[EmailJob], send: EmailSender) -> None:
+    """Deliver queued emails until cancelled.
+
+    Args:
+        queue: Queue to drain
+        send: Coroutine function sending one email
+    """
+    while True:
+        job = await queue.get()
+        try:
+            await send(job.to_email, job.subject, job.html_body, job.text_body)
+        except Exception as e:
+            logger.error(
+                "Queued email failed",
+                extra={"to": job.to_email, "subject": job.subject, "error": str(e)},
+                exc_info=True,
+            )
+        finally:
+            queue.task_done()
+
+
+def start_email_workers(send: EmailSender, count: int) -> None:
+    """Start background workers draining the email queue.
+
+    Args:
+        send: Coroutine function sending one email (e.g. EmailService.send_email)
+        count: Number of concurrent workers
+    """
+    global _queue
+    if _queue is not None:
+        return
+
+    _queue = asyncio.Queue(maxsize=EMAIL_QUEUE_MAXSIZE)
+    _workers.extend(asyncio.create_task(_email_worker(_queue, send)) for _ in range(count))
+    logger.info("Email workers started", extra={"workers": count})
+
+
+async def stop_email_workers(timeout: float = 10.0) -> None:
+    """Stop the email workers, first giving queued emails time to be sent.
+
+    Args:
+        timeout: Seconds to wait for the queue to drain before cancelling
+    """
+    global _queue
+    if _queue is None:
+        return
+
+    # Stop accepting new emails; late callers fall back to sending inline
+    queue, _queue = _queue, None
+    with contextlib.suppress(TimeoutError):
+        async with asyncio.timeout(timeout):
+            await queue.join()
+
+    if not queue.empty():
+        logger.warning("Email queue not drained at shutdown", extra={"dropped": queue.qsize()})
+
+    for worker in _workers:
+        worker.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
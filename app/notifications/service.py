@@ -1,26 +1,167 @@
 """Email notification service."""
 
+import asyncio
+import contextlib
+import logging
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email import policy
+from email.message import EmailMessage
+from html.parser import HTMLParser
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+)
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.notifications.queue import EmailJob, enqueue_email
 
 logger = get_logger(__name__)
+# Underlying stdlib logger (structlog wraps it), for cheap level checks on hot paths
+_std_logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Messages are built under the policy they are sent with (RFC 5322, CRLF line
+# endings), so serializing them needs no per-message policy override
+_EMAIL_POLICY = policy.SMTP
+
+# Socket timeout for SMTP connections, so a stalled server can't hang a pool slot
+SMTP_TIMEOUT = 30.0
+
 # Configure Jinja2 environment for email templates
 TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+
+def _bytecode_cache() -> BytecodeCache | None:
+    """Get an on-disk cache of compiled templates, reused across process restarts.
+
+    Returns:
+        Bytecode cache under ``{cache_dir}/jinja``, or None if the directory
+        cannot be created (templates are then compiled at every startup)
+    """
+    cache_dir = Path(settings.cache_dir) / "jinja"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(str(cache_dir))
+
+
+def _autoescape(template_name: str | None) -> bool:
+    """Escape HTML templates (and templates built from strings), not the .txt ones."""
+    return template_name is None or template_name.endswith(".html")
+
+
+# The bytecode cache is attached by load_email_templates() at startup, so importing
+# this module never writes to disk
 jinja_env = Environment(
     loader=FileSystemLoader(TEMPLATES_DIR),
-    autoescape=select_autoescape(["html", "xml"]),
+    autoescape=_autoescape,
+    # Templates ship with the code: never re-stat them or evict compiled ones
+    auto_reload=False,
+    cache_size=-1,
 )
 
 
+def _precompile_templates() -> dict[str, tuple[Template, Template | None]]:
+    """Compile every email template once, pairing each HTML template with its text version.
+
+    Returns:
+        Mapping of template name (without extension) to (html_template, text_template),
+        where text_template is None if no ``.txt`` version exists
+    """
+    templates = {}
+    for html_path in TEMPLATES_DIR.glob("*.html"):
+        text_path = html_path.with_suffix(".txt")
+        templates[html_path.stem] = (
+            jinja_env.get_template(html_path.name),
+            jinja_env.get_template(text_path.name) if text_path.exists() else None,
+        )
+    return templates
+
+
+# Compiled once, at startup or on first render, so rendering never touches the filesystem
+_TEMPLATE_CACHE: dict[str, tuple[Template, Template | None]] = {}
+
+
+def _templates() -> dict[str, tuple[Template, Template | None]]:
+    """Get the compiled email templates, compiling them on first use."""
+    if not _TEMPLATE_CACHE:
+        _TEMPLATE_CACHE.update(_precompile_templates())
+    return _TEMPLATE_CACHE
+
+
+def load_email_templates() -> None:
+    """Compile the email templates through the on-disk bytecode cache (called on startup).
+
+    Failures are logged, not raised: templates are then compiled on first render.
+    """
+    if _TEMPLATE_CACHE:
+        return
+
+    try:
+        jinja_env.bytecode_cache = _bytecode_cache()
+        _templates()
+    except Exception as e:
+        logger.warning("Failed to load email templates at startup", extra={"error": str(e)})
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the text of an HTML document in one pass, skipping non-content elements."""
+
+    _SKIP_TAGS = frozenset({"head", "style", "script"})
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, _attrs: list[tuple[str, str | None]]) -> None:
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+class _TokenBucket:
+    """Async token bucket: bursts of up to ``burst`` acquisitions, then ``rate`` per second.
+
+    Implemented as a virtual schedule (GCRA): each acquisition reserves the next
+    slot, so concurrent callers are spaced out fairly without a lock.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Sustained acquisitions per second
+            burst: Acquisitions allowed back-to-back when the bucket is full
+        """
+        self._interval = 1.0 / rate
+        self._tolerance = (burst - 1) * self._interval
+        self._next_slot = 0.0  # Theoretical time of the next acquisition (loop clock)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        now = asyncio.get_running_loop().time()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self._interval
+        delay = slot - self._tolerance - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
 class EmailServiceError(Exception):
     """Email service errors."""
 
@@ -42,6 +183,24 @@ class EmailService:
         self.enabled = settings.email_enabled
         self.from_email = settings.email_from
 
+        # Settings are fixed after startup: read the SMTP config once, not per send
+        self._host = settings.smtp_host
+        self._port = settings.smtp_port
+        self._user = settings.smtp_user
+        self._password = settings.smtp_password
+
+        # Smooths bursts (e.g. a batch of job completions) to the provider's rate limit
+        self._bucket = _TokenBucket(rate=settings.smtp_rate_per_sec, burst=settings.smtp_burst)
+
+        # Pool of SMTP connections kept open across sends, one slot per allowed
+        # concurrent send (None until connected). LIFO so sequential sends keep
+        # reusing the warmest connection; each send has exclusive use of its slot
+        # (smtplib connections are not thread-safe).
+        self._pool_size = settings.smtp_max_concurrency
+        self._pool: asyncio.LifoQueue[smtplib.SMTP | None] = asyncio.LifoQueue()
+        for _ in range(self._pool_size):
+            self._pool.put_nowait(None)
+
         if not self.enabled:
             logger.info("Email service disabled (email_enabled=False)")
 
@@ -58,7 +217,7 @@ class EmailService:
             to_email: Recipient email address
             subject: Email subject line
             html_body: HTML email body
-            text_body: Plain text email body (optional, falls back to stripping HTML)
+            text_body: Plain text email body (optional; without it the email is HTML-only)
 
         Returns:
             True if email sent successfully, False otherwise
@@ -67,47 +226,50 @@ class EmailService:
             EmailServiceError: If email sending fails critically
         """
         if not self.enabled:
-            logger.debug(
-                "Email not sent (disabled)",
-                extra={
-                    "to": to_email,
-                    "subject": subject,
-                },
-            )
+            if _std_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Email not sent (disabled)",
+                    extra={
+                        "to": to_email,
+                        "subject": subject,
+                    },
+                )
             return False
 
+        await self._bucket.acquire()
+
         try:
-            # Create message
-            message = MIMEMultipart("alternative")
+            # Create message: multipart/alternative only when there are two bodies
+            message = EmailMessage(policy=_EMAIL_POLICY)
             message["Subject"] = subject
             message["From"] = self.from_email
             message["To"] = to_email
-
-            # Add plain text version
             if text_body:
-                text_part = MIMEText(text_body, "plain")
-                message.attach(text_part)
-
-            # Add HTML version
-            html_part = MIMEText(html_body, "html")
-            message.attach(html_part)
-
-            # Send email via SMTP
-            with smtplib.SMTP(settings.smtp_host, settings.smtp_port) as server:
-                server.starttls()
-
-                if settings.smtp_user and settings.smtp_password:
-                    server.login(settings.smtp_user, settings.smtp_password)
-
-                server.send_message(message)
-
-            logger.info(
-                "Email sent successfully",
-                extra={
-                    "to": to_email,
-                    "subject": subject,
-                },
-            )
+                message.set_content(text_body)
+                message.add_alternative(html_body, subtype="html")
+            else:
+                message.set_content(html_body, subtype="html")
+            # Serialized once here; sendmail() skips send_message()'s re-flatten and header parse
+            raw = message.as_bytes()
+
+            # smtplib blocks for the whole SMTP exchange: run it off the event loop
+            conn = await self._pool.get()
+            try:
+                conn = await asyncio.to_thread(self._send_smtp, conn, to_email, raw)
+            except BaseException:
+                conn = None  # Closed by _send_smtp, or still in use by the cancelled thread
+                raise
+            finally:
+                self._pool.put_nowait(conn)
+
+            if _std_logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Email sent successfully",
+                    extra={
+                        "to": to_email,
+                        "subject": subject,
+                    },
+                )
 
             return True
 
@@ -124,6 +286,97 @@ class EmailService:
             # Don't raise exception - email failures shouldn't break the app
             return False
 
+    def _connect(self) -> smtplib.SMTP:
+        """Open an SMTP connection, upgrade it to TLS and log in (blocking).
+
+        Returns:
+            Connected SMTP client
+        """
+        server = smtplib.SMTP(self._host, self._port, timeout=SMTP_TIMEOUT)
+        try:
+            server.starttls()
+
+            if self._user and self._password:
+                server.login(self._user, self._password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _send_smtp(self, conn: smtplib.SMTP | None, to_email: str, raw: bytes) -> smtplib.SMTP:
+        """Send a message over a pooled SMTP connection (blocking).
+
+        Connects if the slot is empty, so the TCP, TLS and AUTH handshakes happen
+        once per pooled connection rather than per email. If the server has
+        dropped an idle connection, reconnects and retries once.
+
+        Args:
+            conn: Pooled connection, or None to open a new one
+            to_email: Recipient email address
+            raw: Serialized email message
+
+        Returns:
+            Connection to return to the pool
+        """
+        for attempt in range(2):
+            if conn is None:
+                conn = self._connect()
+
+            try:
+                conn.sendmail(self.from_email, [to_email], raw)
+                return conn
+            except smtplib.SMTPServerDisconnected:
+                conn = None
+                if attempt:
+                    raise
+            except Exception:
+                # Unknown connection state: the slot gets a fresh connection next time
+                conn.close()
+                raise
+
+        raise AssertionError("unreachable: the second attempt returns or raises")
+
+    async def warmup(self) -> None:
+        """Open every pooled SMTP connection ahead of the first email (called on startup).
+
+        Moves the TCP, TLS and AUTH handshakes out of the first sends. Failures are
+        logged, not raised: an unconnected slot connects on first use instead.
+        """
+        if not self.enabled:
+            return
+
+        slots: list[smtplib.SMTP | None] = [await self._pool.get() for _ in range(self._pool_size)]
+        try:
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self._connect) for conn in slots if conn is None),
+                return_exceptions=True,
+            )
+            opened: list[smtplib.SMTP] = [r for r in results if not isinstance(r, BaseException)]
+            errors = [r for r in results if isinstance(r, BaseException)]
+            if errors:
+                logger.warning(
+                    "Failed to open SMTP connections at startup",
+                    extra={"failed": len(errors), "error": str(errors[0])},
+                )
+
+            connected = [conn for conn in slots if conn is not None] + opened
+            slots = [*connected, *[None] * (self._pool_size - len(connected))]
+        finally:
+            for conn in slots:
+                self._pool.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close all pooled SMTP connections, waiting for in-flight sends to finish."""
+        conns = [await self._pool.get() for _ in range(self._pool_size)]
+        try:
+            for conn in conns:
+                if conn is not None:
+                    with contextlib.suppress(smtplib.SMTPException, OSError):
+                        await asyncio.to_thread(conn.quit)
+        finally:
+            for _ in conns:
+                self._pool.put_nowait(None)
+
     def render_template(self, template_name: str, **context) -> tuple[str, str]:
         """Render email template with context.
 
@@ -135,7 +388,7 @@ class EmailService:
             Tuple of (html_body, text_body)
 
         Raises:
-            EmailServiceError: If template rendering fails
+            EmailServiceError: If the template does not exist or rendering fails
 
         Example:
             html, text = email_service.render_template(
@@ -144,17 +397,22 @@ class EmailService:
                 job_id=123
             )
         """
+        # Templates are compiled up front: an unknown name is a plain dict miss,
+        # never a loader lookup or TemplateNotFound
+        templates = _templates().get(template_name)
+        if templates is None:
+            logger.error("Unknown email template", extra={"template": template_name})
+            raise EmailServiceError(f"Unknown email template: {template_name}")
+        html_template, text_template = templates
+
         try:
             # Render HTML version
-            html_template = jinja_env.get_template(f"{template_name}.html")
             html_body = html_template.render(**context)
 
             # Render text version (fallback to simple text if doesn't exist)
-            try:
-                text_template = jinja_env.get_template(f"{template_name}.txt")
+            if text_template is not None:
                 text_body = text_template.render(**context)
-            except Exception:
-                # If text template doesn't exist, create simple text version
+            else:
                 text_body = self._html_to_text(html_body)
 
             return html_body, text_body
@@ -179,7 +437,9 @@ class EmailService:
     ) -> bool:
         """Render template and send email.
 
-        Convenience method that combines template rendering and sending.
+        Convenience method that combines template rendering and sending. When the
+        background email workers are running, the rendered email is queued and
+        this returns without waiting on the SMTP server; otherwise it is sent inline.
 
         Args:
             to_email: Recipient email address
@@ -188,7 +448,7 @@ class EmailService:
             **context: Template variables
 
         Returns:
-            True if email sent successfully, False otherwise
+            True if email was queued or sent successfully, False otherwise
 
         Example:
             await email_service.send_template_email(
@@ -201,6 +461,10 @@ class EmailService:
         """
         try:
             html_body, text_body = self.render_template(template_name, **context)
+            if self.enabled and await enqueue_email(
+                EmailJob(to_email, subject, html_body, text_body)
+            ):
+                return True
             return await self.send_email(to_email, subject, html_body, text_body)
 
         except EmailServiceError as e:
@@ -225,20 +489,17 @@ class EmailService:
         Returns:
             Plain text version (HTML tags stripped)
         """
-        # Simple HTML to text conversion
+        # Single tokenizer pass; entities are decoded (&amp; -> &) along the way.
         # For production, consider using html2text library
-        import re
+        parser = _TextExtractor()
+        parser.feed(html)
+        parser.close()
+        return " ".join("".join(parser.parts).split())
 
-        text = re.sub("<head.*?>.*?</head>", "", html, flags=re.DOTALL)
-        text = re.sub("<style.*?>.*?</style>", "", text, flags=re.DOTALL)
-        text = re.sub("<script.*?>.*?</script>", "", text, flags=re.DOTALL)
-        text = re.sub("<[^<]+?>", "", text)
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
 
-
-# Global email service instance
-_email_service: EmailService | None = None
+# Global email service instance, created at import: construction is cheap and
+# binding it once avoids a check-then-set race between threads
+_email_service = EmailService()
 
 
 def get_email_service() -> EmailService:
@@ -247,7 +508,9 @@ def get_email_service() -> EmailService:
     Returns:
         Email service singleton
     """
-    global _email_service
-    if _email_service is None:
-        _email_service = EmailService()
     return _email_service
+
+
+async def close_email_service() -> None:
+    """Close the global email service's SMTP connection (called on application shutdown)."""
+    await _email_service.close()
@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from app.core.config import get_settings
+
 
 class TestJobCompletionEmail:
     """Test job completion notification email."""
@@ -32,7 +34,8 @@ class TestJobCompletionEmail:
             call_kwargs = mock_service.send_template_email.call_args.kwargs
 
             assert call_kwargs["to_email"] == "user@example.com"
-            assert "Job #123" in call_kwargs["subject"]
+            assert call_kwargs["subject"] == "Job #123 - Completed"
+            assert call_kwargs["app_url"] == get_settings().app_url
             assert call_kwargs["template_name"] == "job_complete"
             assert call_kwargs["job_id"] == 123
             assert call_kwargs["status"] == "completed"
@@ -85,6 +88,40 @@ class TestJobCompletionEmail:
             assert call_kwargs["processing_time"] == 123.46
 
 
+class TestJobCompletionEmails:
+    """Test batch job completion emails."""
+
+    @pytest.mark.asyncio
+    async def test_send_job_completion_emails(self):
+        """Test each job gets its own email and failures are returned, not raised."""
+        from app.notifications.notifications import send_job_completion_emails
+
+        with patch("app.notifications.notifications.get_email_service") as mock_get:
+            mock_service = AsyncMock()
+            mock_service.send_template_email.side_effect = [True, RuntimeError("boom"), False]
+            mock_get.return_value = mock_service
+
+            jobs = [
+                {
+                    "user_email": f"user{i}@example.com",
+                    "job_id": i,
+                    "task_name": "extract_pdf",
+                    "status": "completed",
+                }
+                for i in range(3)
+            ]
+
+            results = await send_job_completion_emails(jobs)
+
+            assert results[0] is True
+            assert isinstance(results[1], RuntimeError)
+            assert results[2] is False
+            sent_to = [
+                c.kwargs["to_email"] for c in mock_service.send_template_email.call_args_list
+            ]
+            assert sent_to == ["user0@example.com", "user1@example.com", "user2@example.com"]
+
+
 class TestWelcomeEmail:
     """Test welcome email."""
 
@@ -148,3 +185,49 @@ class TestWelcomeEmail:
             )
 
             assert result is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "user_email", ["not-an-email", "user@localhost", "a@b@example.com", ""]
+    )
+    async def test_send_welcome_email_invalid_recipient(self, user_email):
+        """Test malformed addresses are rejected before the email service is used."""
+        from app.notifications.notifications import send_welcome_email
+
+        with patch("app.notifications.notifications.get_email_service") as mock_get:
+            result = await send_welcome_email(user_email=user_email)
+
+            assert result is False
+            mock_get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_send_welcome_email_display_name(self):
+        """Test a "Name <address>" recipient is sent to the bare address."""
+        from app.notifications.notifications import send_welcome_email
+
+        with patch("app.notifications.notifications.get_email_service") as mock_get:
+            mock_service = AsyncMock()
+            mock_service.send_template_email.return_value = True
+            mock_get.return_value = mock_service
+
+            await send_welcome_email(user_email="Jane Doe <jane@example.com>")
+
+            call_kwargs = mock_service.send_template_email.call_args.kwargs
+            assert call_kwargs["to_email"] == "jane@example.com"
+            assert call_kwargs["user_name"] == "jane"
+
+    @pytest.mark.asyncio
+    async def test_send_welcome_email_skips_filtered_log(self):
+        """Test the INFO log record is not built when INFO is disabled."""
+        from app.notifications import notifications
+
+        with (
+            patch("app.notifications.notifications.get_email_service") as mock_get,
+            patch.object(notifications, "logger") as mock_logger,
+            patch.object(notifications._std_logger, "isEnabledFor", return_value=False),
+        ):
+            mock_get.return_value = AsyncMock()
+
+            await notifications.send_welcome_email(user_email="test@example.com")
+
+            mock_logger.info.assert_not_called()
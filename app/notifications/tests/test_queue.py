@@ -0,0 +1,102 @@
+"""Tests for the outgoing email queue."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.notifications.queue import (
+    EmailJob,
+    enqueue_email,
+    start_email_workers,
+    stop_email_workers,
+)
+from app.notifications.service import EmailService
+
+
+@pytest.fixture
+async def sender():
+    """Run email workers around a mock sender, stopping them afterwards."""
+    send = AsyncMock(return_value=True)
+    start_email_workers(send, count=2)
+    yield send
+    await stop_email_workers()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_without_workers():
+    """Test enqueueing is refused when no workers are running."""
+    assert await enqueue_email(EmailJob("user@example.com", "Subject", "<p>Hi</p>")) is False
+
+
+@pytest.mark.asyncio
+async def test_workers_deliver_queued_emails(sender):
+    """Test queued emails are handed to the sender by the workers."""
+    for i in range(3):
+        assert await enqueue_email(EmailJob(f"user{i}@example.com", "Subject", "<p>Hi</p>", "Hi"))
+
+    await stop_email_workers()
+
+    assert sorted(c.args[0] for c in sender.await_args_list) == [
+        "user0@example.com",
+        "user1@example.com",
+        "user2@example.com",
+    ]
+    assert sender.await_args_list[0].args[1:] == ("Subject", "<p>Hi</p>", "Hi")
+
+
+@pytest.mark.asyncio
+async def test_worker_survives_sender_errors(sender):
+    """Test a failing send is logged and the worker keeps draining the queue."""
+    sender.side_effect = [RuntimeError("SMTP down"), True]
+
+    await enqueue_email(EmailJob("first@example.com", "Subject", "<p>Hi</p>"))
+    await enqueue_email(EmailJob("second@example.com", "Subject", "<p>Hi</p>"))
+    await stop_email_workers()
+
+    assert sender.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_then_refuses(sender):
+    """Test stopping waits for the queue, then new emails are no longer queued."""
+    release = asyncio.Event()
+
+    async def slow_send(*args):
+        await release.wait()
+        return True
+
+    sender.side_effect = slow_send
+    await enqueue_email(EmailJob("user@example.com", "Subject", "<p>Hi</p>"))
+    stopping = asyncio.create_task(stop_email_workers())
+    await asyncio.sleep(0)
+    release.set()
+    await stopping
+
+    sender.assert_awaited_once()
+    assert await enqueue_email(EmailJob("late@example.com", "Subject", "<p>Hi</p>")) is False
+
+
+@pytest.mark.asyncio
+async def test_send_template_email_queues(sender):
+    """Test templated emails are queued instead of sent inline while workers run."""
+    with patch("app.notifications.service.settings") as mock_settings:
+        mock_settings.email_enabled = True
+        service = EmailService()
+
+    with patch.object(service, "send_email", new_callable=AsyncMock) as mock_send:
+        result = await service.send_template_email(
+            to_email="user@example.com",
+            subject="Welcome",
+            template_name="welcome",
+            user_name="Ann",
+            user_email="user@example.com",
+            app_name="Test App",
+        )
+
+        assert result is True
+        mock_send.assert_not_called()
+
+    await stop_email_workers()
+    sender.assert_awaited_once()
+    assert sender.await_args.args[0] == "user@example.com"
@@ -1,9 +1,13 @@
 """Tests for email service."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import email.policy
+import smtplib
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.notifications import service as service_mod
 from app.notifications.service import EmailService, EmailServiceError
 
 
@@ -55,6 +59,8 @@ class TestEmailService:
         with patch("app.notifications.service.settings") as mock_settings:
             mock_settings.email_enabled = True
             mock_settings.email_from = "sender@example.com"
+            mock_settings.smtp_rate_per_sec = 100.0
+            mock_settings.smtp_burst = 10
             mock_settings.smtp_host = "smtp.example.com"
             mock_settings.smtp_port = 587
             mock_settings.smtp_user = "user"
@@ -63,8 +69,7 @@ class TestEmailService:
             service = EmailService()
 
             with patch("app.notifications.service.smtplib.SMTP") as mock_smtp:
-                mock_server = MagicMock()
-                mock_smtp.return_value.__enter__.return_value = mock_server
+                mock_server = mock_smtp.return_value
 
                 result = await service.send_email(
                     to_email="recipient@example.com",
@@ -76,7 +81,182 @@ class TestEmailService:
                 assert result is True
                 mock_server.starttls.assert_called_once()
                 mock_server.login.assert_called_once_with("user", "pass")
-                mock_server.send_message.assert_called_once()
+                mock_server.sendmail.assert_called_once()
+
+    @pytest.fixture
+    def smtp_service(self):
+        """Enabled email service with smtplib.SMTP mocked out."""
+        with (
+            patch("app.notifications.service.settings") as mock_settings,
+            patch("app.notifications.service.smtplib.SMTP") as mock_smtp,
+        ):
+            mock_settings.email_enabled = True
+            mock_settings.email_from = "sender@example.com"
+            mock_settings.smtp_rate_per_sec = 100.0
+            mock_settings.smtp_burst = 10
+            mock_settings.smtp_user = "user"
+            mock_settings.smtp_password = "pass"
+            mock_settings.smtp_max_concurrency = 2
+            yield EmailService(), mock_smtp
+
+    @pytest.mark.asyncio
+    async def test_send_email_reuses_connection(self, smtp_service):
+        """Test consecutive emails share one connection, handshake and login."""
+        service, mock_smtp = smtp_service
+
+        for _ in range(3):
+            assert await service.send_email("recipient@example.com", "Test", "<p>Test</p>")
+
+        mock_smtp.assert_called_once()
+        mock_smtp.return_value.starttls.assert_called_once()
+        mock_smtp.return_value.login.assert_called_once()
+        assert mock_smtp.return_value.sendmail.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_send_email_message_structure(self, smtp_service):
+        """Test HTML-only emails are a single part, and text+HTML are multipart/alternative."""
+        service, mock_smtp = smtp_service
+        sendmail = mock_smtp.return_value.sendmail
+
+        await service.send_email("recipient@example.com", "HTML only", "<p>Hi</p>")
+        await service.send_email("recipient@example.com", "Both", "<p>Hi</p>", "Hi")
+
+        assert sendmail.call_args.args[:2] == ("sender@example.com", ["recipient@example.com"])
+        html_only, both = (
+            email.message_from_bytes(c.args[2], policy=email.policy.SMTP)
+            for c in sendmail.call_args_list
+        )
+        assert html_only.get_content_type() == "text/html"
+        assert html_only["Subject"] == "HTML only"
+        assert both.get_content_type() == "multipart/alternative"
+        assert [p.get_content_type() for p in both.get_payload()] == ["text/plain", "text/html"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_bounded_by_pool(self, smtp_service):
+        """Test concurrent emails open at most smtp_max_concurrency connections."""
+        service, mock_smtp = smtp_service
+        mock_smtp.side_effect = lambda *args, **kwargs: MagicMock()
+
+        results = await asyncio.gather(
+            *(service.send_email(f"user{i}@example.com", "Test", "<p>Test</p>") for i in range(6))
+        )
+
+        assert all(results)
+        assert mock_smtp.call_count <= 2
+
+    @pytest.mark.asyncio
+    async def test_send_email_reconnects_after_disconnect(self, smtp_service):
+        """Test a connection dropped by the server is replaced and the send retried."""
+        service, mock_smtp = smtp_service
+        stale, fresh = MagicMock(), MagicMock()
+        stale.sendmail.side_effect = [None, smtplib.SMTPServerDisconnected()]
+        mock_smtp.side_effect = [stale, fresh]
+
+        assert await service.send_email("recipient@example.com", "First", "<p>1</p>")
+        assert await service.send_email("recipient@example.com", "Second", "<p>2</p>")
+
+        assert mock_smtp.call_count == 2
+        fresh.sendmail.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_send_email_error_drops_connection(self, smtp_service):
+        """Test a failed send discards the connection so the next send reconnects."""
+        service, mock_smtp = smtp_service
+        mock_smtp.return_value.sendmail.side_effect = [smtplib.SMTPDataError(554, b"no"), None]
+
+        assert await service.send_email("recipient@example.com", "Test", "<p>Test</p>") is False
+        assert await service.send_email("recipient@example.com", "Test", "<p>Test</p>") is True
+
+        assert mock_smtp.call_count == 2
+        mock_smtp.return_value.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_close_quits_connection(self, smtp_service):
+        """Test close() ends the open SMTP session and is safe to repeat."""
+        service, mock_smtp = smtp_service
+        await service.send_email("recipient@example.com", "Test", "<p>Test</p>")
+
+        await service.close()
+        await service.close()
+
+        mock_smtp.return_value.quit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_warmup_opens_pool(self, smtp_service):
+        """Test warmup connects every pool slot so sends skip the handshake."""
+        service, mock_smtp = smtp_service
+        mock_smtp.side_effect = lambda *args, **kwargs: MagicMock()
+
+        await service.warmup()
+        assert mock_smtp.call_count == 2
+
+        await asyncio.gather(
+            *(service.send_email(f"user{i}@example.com", "Test", "<p>Test</p>") for i in range(4))
+        )
+        assert mock_smtp.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_warmup_failure_connects_on_first_send(self, smtp_service):
+        """Test a failed warmup is not raised and the slots connect when first used."""
+        service, mock_smtp = smtp_service
+        mock_smtp.side_effect = [OSError("refused"), OSError("refused"), MagicMock()]
+
+        await service.warmup()
+
+        assert await service.send_email("recipient@example.com", "Test", "<p>Test</p>")
+        assert mock_smtp.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_allows_burst_then_paces(self):
+        """Test the rate limiter lets a burst through, then spaces acquisitions."""
+        bucket = service_mod._TokenBucket(rate=2.0, burst=3)
+
+        with patch("app.notifications.service.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            for _ in range(5):
+                await bucket.acquire()
+
+        delays = [c.args[0] for c in mock_sleep.await_args_list]
+        assert len(delays) == 2
+        assert delays[0] == pytest.approx(0.5, abs=0.05)
+        assert delays[1] == pytest.approx(1.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_send_email_rate_limited(self, smtp_service):
+        """Test each send takes a token from the rate limiter."""
+        service, _ = smtp_service
+
+        with patch.object(service._bucket, "acquire", new_callable=AsyncMock) as mock_acquire:
+            await service.send_email("recipient@example.com", "Test", "<p>Test</p>")
+            await service.send_email("recipient@example.com", "Test", "<p>Test</p>")
+
+        assert mock_acquire.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_send_email_off_event_loop(self):
+        """Test the blocking SMTP exchange runs in a worker thread."""
+        with patch("app.notifications.service.settings") as mock_settings:
+            mock_settings.email_enabled = True
+            mock_settings.email_from = "sender@example.com"
+            mock_settings.smtp_rate_per_sec = 100.0
+            mock_settings.smtp_burst = 10
+
+            service = EmailService()
+
+            with patch(
+                "app.notifications.service.asyncio.to_thread", new_callable=AsyncMock
+            ) as mock_to_thread:
+                result = await service.send_email(
+                    to_email="recipient@example.com",
+                    subject="Test",
+                    html_body="<p>Test</p>",
+                )
+
+                assert result is True
+                func, conn, to_email, raw = mock_to_thread.await_args.args
+                assert func == service._send_smtp
+                assert conn is None  # First send: the pooled slot is not yet connected
+                assert to_email == "recipient@example.com"
+                assert b"To: recipient@example.com\r\n" in raw
 
     @pytest.mark.asyncio
     async def test_send_email_failure(self):
@@ -84,6 +264,8 @@ class TestEmailService:
         with patch("app.notifications.service.settings") as mock_settings:
             mock_settings.email_enabled = True
             mock_settings.email_from = "sender@example.com"
+            mock_settings.smtp_rate_per_sec = 100.0
+            mock_settings.smtp_burst = 10
             mock_settings.smtp_host = "smtp.example.com"
             mock_settings.smtp_port = 587
 
@@ -118,11 +300,60 @@ class TestEmailService:
         assert "123" in text
         assert "completed" in text.lower()
 
+    def test_render_template_precompiled(self):
+        """Test rendering reuses the compiled templates, not the template loader."""
+        service = EmailService()
+        service.render_template("welcome", user_name="Bob", app_name="Test App")
+
+        with patch.object(service_mod.jinja_env, "get_template", side_effect=AssertionError):
+            html, text = service.render_template(
+                "welcome", user_name="Ann", user_email="ann@example.com", app_name="Test App"
+            )
+
+        assert "Ann" in html
+        assert "Ann" in text
+
+    def test_render_template_text_fallback(self):
+        """Test templates without a text version fall back to stripped HTML."""
+        service = EmailService()
+        html_only = service_mod.jinja_env.from_string("<p>Hello <b>{{ name }}</b></p>")
+
+        with patch.dict(service_mod._TEMPLATE_CACHE, {"html_only": (html_only, None)}):
+            html, text = service.render_template("html_only", name="Ann")
+
+        assert html == "<p>Hello <b>Ann</b></p>"
+        assert text == "Hello Ann"
+
+    def test_render_template_escapes_html_only(self):
+        """Test values are HTML-escaped in the HTML body but not in the text body."""
+        service = EmailService()
+
+        html, text = service.render_template(
+            "welcome", user_name="Tom & Jerry", user_email="tj@example.com", app_name="Test App"
+        )
+
+        assert "Tom &amp; Jerry" in html
+        assert "Tom & Jerry" in text
+
+    def test_bytecode_cache_dir(self, tmp_path):
+        """Test compiled templates are cached under cache_dir, or not at all if it is unusable."""
+        with patch("app.notifications.service.settings") as mock_settings:
+            mock_settings.cache_dir = str(tmp_path)
+            assert service_mod._bytecode_cache().directory == str(tmp_path / "jinja")
+
+            (tmp_path / "file").touch()
+            mock_settings.cache_dir = str(tmp_path / "file")
+            assert service_mod._bytecode_cache() is None
+
+    def test_import_writes_no_bytecode_cache(self):
+        """Test templates are not compiled through the bytecode cache until startup."""
+        assert service_mod.jinja_env.bytecode_cache is None
+
     def test_render_template_missing(self):
         """Test rendering non-existent template raises error."""
         service = EmailService()
 
-        with pytest.raises(EmailServiceError, match="Failed to render template"):
+        with pytest.raises(EmailServiceError, match="Unknown email template"):
             service.render_template("nonexistent_template")
 
     def test_html_to_text(self):
@@ -146,12 +377,20 @@ class TestEmailService:
         assert ">" not in text
         assert "script" not in text
 
+    def test_html_to_text_skips_styles_and_decodes_entities(self):
+        """Test style blocks are dropped and HTML entities become plain characters."""
+        html = "<style>p { color: red; }</style><p>Profit &amp; Loss</p>\n<p>Q1&nbsp;2024</p>"
+
+        assert EmailService._html_to_text(html) == "Profit & Loss Q1 2024"
+
     @pytest.mark.asyncio
     async def test_send_template_email_success(self):
         """Test sending templated email."""
         with patch("app.notifications.service.settings") as mock_settings:
             mock_settings.email_enabled = True
             mock_settings.email_from = "sender@example.com"
+            mock_settings.smtp_rate_per_sec = 100.0
+            mock_settings.smtp_burst = 10
             mock_settings.smtp_host = "smtp.example.com"
             mock_settings.smtp_port = 587
             mock_settings.smtp_user = None
@@ -160,8 +399,7 @@ class TestEmailService:
             service = EmailService()
 
             with patch("app.notifications.service.smtplib.SMTP") as mock_smtp:
-                mock_server = MagicMock()
-                mock_smtp.return_value.__enter__.return_value = mock_server
+                mock_server = mock_smtp.return_value
 
                 result = await service.send_template_email(
                     to_email="user@example.com",
@@ -175,7 +413,7 @@ class TestEmailService:
                 )
 
                 assert result is True
-                mock_server.send_message.assert_called_once()
+                mock_server.sendmail.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_send_template_email_bad_template(self):
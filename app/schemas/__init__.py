@@ -11,14 +11,17 @@ from .base_schema import (
     ExcelColumnMapping,
     ExcelLayoutConfig,
     FinancialStatementType,
+    FinancialStatementTypeStr,
     HierarchicalLineItem,
     MetadataInfo,
     SimpleLineItem,
 )
 from .income_statement_schema import IncomeStatementLineItem, IncomeStatementSchema
+from .statements import FinancialStatementSchema
 
 __all__ = [
     "FinancialStatementType",
+    "FinancialStatementTypeStr",
     "BaseFinancialSchema",
     "BaseLineItem",
     "SimpleLineItem",
@@ -29,4 +32,5 @@ __all__ = [
     "ColumnHeader",
     "IncomeStatementSchema",
     "IncomeStatementLineItem",
+    "FinancialStatementSchema",
 ]
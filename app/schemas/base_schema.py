@@ -3,10 +3,12 @@ Base schema classes and common fields for financial statement processing.
 All specific financial statement schemas should inherit from these base classes.
 """
 
+from contextvars import ContextVar
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from typing import Any, Literal, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ModelWrapValidatorHandler, model_validator
 
 
 class FinancialStatementType(str, Enum):
@@ -19,10 +21,33 @@ class FinancialStatementType(str, Enum):
     COMPREHENSIVE_INCOME = "comprehensive_income"
     UNKNOWN = "unknown"
 
+    @classmethod
+    def from_str(cls, value: str) -> "FinancialStatementType":
+        """Get the member for a schema's document_type string."""
+        return cls(value)
+
+
+# FinancialStatementType values as a Literal, for schema fields: pydantic-core
+# validates a Literal with a set lookup instead of calling into the Enum
+FinancialStatementTypeStr = Literal[
+    "income_statement",
+    "balance_sheet",
+    "shareholders_equity",
+    "cash_flow",
+    "comprehensive_income",
+    "unknown",
+]
+
+
+# Models below with defer_build=True are rarely validated: their validators are
+# built on first use instead of at import, keeping them out of startup time.
+
 
 class ExcelColumnMapping(BaseModel):
     """Defines how a column should appear in Excel."""
 
+    model_config = ConfigDict(defer_build=True)
+
     excel_column_index: int = Field(description="Excel column position (1=A, 2=B, etc.)")
     main_header: str = Field(description="Main column header text")
     sub_header: str | None = Field(description="Sub-header text", default="")
@@ -38,6 +63,8 @@ class ExcelColumnMapping(BaseModel):
 class ExcelLayoutConfig(BaseModel):
     """Defines Excel layout configuration for a financial statement."""
 
+    model_config = ConfigDict(defer_build=True)
+
     header_rows: list[str] = Field(description="Header rows (company name, doc title, units, etc.)")
     column_mappings: list[ExcelColumnMapping] = Field(
         description="Column definitions and formatting"
@@ -50,12 +77,35 @@ class ExcelLayoutConfig(BaseModel):
     data_start_row: int = Field(description="Excel row where data starts", default=1)
 
 
+@lru_cache(maxsize=256)
+def _default_layout_config(
+    company_name: str, document_title: str, units_note: str | None
+) -> ExcelLayoutConfig:
+    """Build the default Excel layout, cached per distinct header inputs.
+
+    The returned config is shared between callers and must not be mutated.
+    Built with model_construct(): the inputs are already validated.
+    """
+    header_rows = [company_name, document_title]
+    if units_note:
+        header_rows.append(units_note)
+
+    return ExcelLayoutConfig.model_construct(
+        header_rows=header_rows,
+        column_mappings=[],
+        has_multi_level_headers=False,
+        units_note_position="top",
+        table_start_row=len(header_rows) + 2,
+        data_start_row=len(header_rows) + 3,
+    )
+
+
 class BaseFinancialSchema(BaseModel):
     """Base schema that all financial statements inherit from."""
 
     company_name: str = Field(description="Name of the company")
     document_title: str = Field(description="Title of the financial statement")
-    document_type: FinancialStatementType = Field(description="Type of financial statement")
+    document_type: FinancialStatementTypeStr = Field(description="Type of financial statement")
     reporting_periods: list[str] = Field(description="Time periods covered (years, quarters, etc.)")
     units_note: str | None = Field(
         description="Units note (e.g., 'In millions, except per share data')", default=""
@@ -64,30 +114,37 @@ class BaseFinancialSchema(BaseModel):
         description="Summary of account consolidations for transparency", default=None
     )
 
-    class Config:
-        """Pydantic config."""
+    model_config = ConfigDict(
+        use_enum_values=True,
+        extra="allow",  # Allow extra fields for consolidation metadata
+    )
+
+    @classmethod
+    def from_json_bytes(cls, data: bytes | str) -> Self:
+        """Parse and validate a statement from JSON.
 
-        use_enum_values = True
-        extra = "allow"  # Allow extra fields for consolidation metadata
+        Prefer this over ``model_validate(json.loads(data))``: pydantic-core parses
+        the JSON straight into the validators without building Python dicts first.
+
+        Args:
+            data: JSON document
+
+        Returns:
+            Validated statement
+
+        Raises:
+            ValidationError: If the JSON is malformed or doesn't match the schema
+        """
+        return cls.model_validate_json(data)
 
     def get_excel_layout_config(self) -> ExcelLayoutConfig:
         """
         Generate Excel layout configuration from schema data.
         Each schema should override this method for specific formatting.
+        The returned config is cached and shared: treat it as read-only.
         """
         # Default implementation for simple schemas
-        header_rows = [self.company_name, self.document_title]
-        if self.units_note:
-            header_rows.append(self.units_note)
-
-        return ExcelLayoutConfig(
-            header_rows=header_rows,
-            column_mappings=[],
-            has_multi_level_headers=False,
-            units_note_position="top",
-            table_start_row=len(header_rows) + 2,
-            data_start_row=len(header_rows) + 3,
-        )
+        return _default_layout_config(self.company_name, self.document_title, self.units_note)
 
 
 class BaseLineItem(BaseModel):
@@ -109,22 +166,46 @@ class SimpleLineItem(BaseLineItem):
     values: dict[str, str] = Field(description="Values for each reporting period")
 
 
+# Deepest allowed HierarchicalLineItem nesting, bounding recursive validation cost
+MAX_LINE_ITEM_DEPTH = 16
+
+# Nesting level of the HierarchicalLineItem currently being validated
+_line_item_depth: ContextVar[int] = ContextVar("line_item_depth", default=0)
+
+
 class HierarchicalLineItem(BaseLineItem):
     """Hierarchical line item for Balance Sheet with sub-accounts."""
 
+    model_config = ConfigDict(defer_build=True)
+
     values: dict[str, str] = Field(description="Values for each reporting period")
+    # Self-reference is resolved when the class is created; no model_rebuild() needed
     sub_items: list["HierarchicalLineItem"] | None = Field(
-        description="Sub-items under this account", default=[]
+        description="Sub-items under this account", default=None
     )
 
+    @model_validator(mode="wrap")
+    @classmethod
+    def limit_depth(
+        cls, data: Any, handler: ModelWrapValidatorHandler["HierarchicalLineItem"]
+    ) -> "HierarchicalLineItem":
+        """Reject sub-item trees nested deeper than MAX_LINE_ITEM_DEPTH."""
+        depth = _line_item_depth.get()
+        if depth >= MAX_LINE_ITEM_DEPTH:
+            raise ValueError(f"Line items nested deeper than {MAX_LINE_ITEM_DEPTH} levels")
 
-# Enable forward references for self-referencing models
-HierarchicalLineItem.model_rebuild()
+        token = _line_item_depth.set(depth + 1)
+        try:
+            return handler(data)
+        finally:
+            _line_item_depth.reset(token)
 
 
 class ColumnHeader(BaseModel):
     """Represents a column header in complex table structures."""
 
+    model_config = ConfigDict(defer_build=True)
+
     main_header: str = Field(description="Main column header")
     sub_header: str | None = Field(description="Sub-header under the main header", default="")
     position: int = Field(description="Column position (0-based)")
@@ -133,7 +214,11 @@ class ColumnHeader(BaseModel):
 class MetadataInfo(BaseModel):
     """Extraction metadata."""
 
+    model_config = ConfigDict(defer_build=True)
+
     extraction_method: str = Field(description="Method used for extraction")
     extraction_timestamp: str = Field(description="When the extraction was performed")
     schema_version: str = Field(description="Version of the schema used", default="1.0")
-    processing_notes: list[str] = Field(description="Any processing notes or warnings", default=[])
+    processing_notes: list[str] = Field(
+        description="Any processing notes or warnings", default_factory=list
+    )
@@ -7,7 +7,10 @@ This schema handles income statements with straightforward structure:
 - Consistent column structure across all rows
 """
 
-from pydantic import Field
+from functools import lru_cache
+from typing import Any, Literal
+
+from pydantic import Field, TypeAdapter
 
 from .base_schema import (
     BaseFinancialSchema,
@@ -29,6 +32,63 @@ class IncomeStatementLineItem(SimpleLineItem):
     )
     calculation_formula: str | None = Field(description="Formula if this is calculated", default="")
 
+    @property
+    def account_name_lower(self) -> str:
+        """Lowercased account name for keyword matching."""
+        return self.account_name.lower()
+
+
+# Shared validator for batches of raw line items. Building a TypeAdapter compiles
+# a validator, so reuse this one rather than creating adapters per request.
+LINE_ITEMS_ADAPTER = TypeAdapter(list[IncomeStatementLineItem])
+
+
+@lru_cache(maxsize=256)
+def _income_statement_layout_config(
+    company_name: str,
+    document_title: str,
+    units_note: str | None,
+    reporting_periods: tuple[str, ...],
+) -> ExcelLayoutConfig:
+    """Build the income statement Excel layout, cached per distinct header inputs.
+
+    The returned config is shared between callers and must not be mutated.
+    Models are built with model_construct(): every input is already a validated
+    schema field or a constant, so re-validating them would be wasted work.
+    """
+    # Build header rows
+    header_rows = [company_name, document_title]
+    if units_note:
+        header_rows.append(units_note)
+
+    # Build column mappings from reporting periods
+    excel_mappings = []
+    for i, period in enumerate(reporting_periods):
+        excel_mappings.append(
+            ExcelColumnMapping.model_construct(
+                excel_column_index=i + 2,  # Start from column B
+                main_header=period,
+                sub_header="",
+                span_columns=1,
+                data_type="currency",
+                merge_with_next=False,
+            )
+        )
+
+    # Calculate table positioning
+    header_count = len(header_rows)
+    table_start_row = header_count + 2
+    data_start_row = table_start_row + 1
+
+    return ExcelLayoutConfig.model_construct(
+        header_rows=header_rows,
+        column_mappings=excel_mappings,
+        has_multi_level_headers=False,
+        units_note_position="top",
+        table_start_row=table_start_row,
+        data_start_row=data_start_row,
+    )
+
 
 class IncomeStatementSchema(BaseFinancialSchema):
     """
@@ -44,7 +104,10 @@ class IncomeStatementSchema(BaseFinancialSchema):
     Net income                  $ 2,796     $ 4,141    $ 3,047
     """
 
-    document_type: FinancialStatementType = Field(default=FinancialStatementType.INCOME_STATEMENT)
+    # Literal tag, so statement unions can dispatch on it (see schemas.statements)
+    document_type: Literal["income_statement"] = Field(
+        default=FinancialStatementType.INCOME_STATEMENT.value
+    )
 
     line_items: list[IncomeStatementLineItem] = Field(
         description="All line items in the income statement"
@@ -52,61 +115,54 @@ class IncomeStatementSchema(BaseFinancialSchema):
 
     # Key financial metrics (automatically extracted)
     revenue_items: list[IncomeStatementLineItem] = Field(
-        description="Revenue-related line items", default=[]
+        description="Revenue-related line items", default_factory=list
     )
 
     expense_items: list[IncomeStatementLineItem] = Field(
-        description="Expense-related line items", default=[]
+        description="Expense-related line items", default_factory=list
     )
 
     net_income_items: list[IncomeStatementLineItem] = Field(
-        description="Net income and profit-related items", default=[]
+        description="Net income and profit-related items", default_factory=list
     )
 
+    @staticmethod
+    def validate_line_items(rows: list[dict[str, Any]]) -> list[IncomeStatementLineItem]:
+        """Validate a batch of raw line items in one call.
+
+        Args:
+            rows: Line item dicts (e.g. rows extracted from a document)
+
+        Returns:
+            Validated line items
+
+        Raises:
+            ValidationError: If any row doesn't match IncomeStatementLineItem
+        """
+        return LINE_ITEMS_ADAPTER.validate_python(rows)
+
     def get_revenue_total(self, period: str) -> str | None:
         """Get total revenue for a specific period."""
         for item in self.revenue_items:
-            if "revenue" in item.account_name.lower() and not item.is_calculated:
+            if "revenue" in item.account_name_lower and not item.is_calculated:
                 return item.values.get(period)
         return None
 
     def get_net_income(self, period: str) -> str | None:
         """Get net income for a specific period."""
         for item in self.net_income_items:
-            if "net income" in item.account_name.lower():
+            if "net income" in item.account_name_lower:
                 return item.values.get(period)
         return None
 
     def get_excel_layout_config(self) -> ExcelLayoutConfig:
-        """Generate Excel layout configuration for income statement."""
-        # Build header rows
-        header_rows = [self.company_name, self.document_title]
-        if self.units_note:
-            header_rows.append(self.units_note)
-
-        # Build column mappings from reporting periods
-        excel_mappings = []
-        for i, period in enumerate(self.reporting_periods):
-            excel_mappings.append(
-                ExcelColumnMapping(
-                    excel_column_index=i + 2,  # Start from column B
-                    main_header=period,
-                    sub_header="",
-                    span_columns=1,
-                    data_type="currency",
-                )
-            )
-
-        # Calculate table positioning
-        header_count = len(header_rows)
-        table_start_row = header_count + 2
-        data_start_row = table_start_row + 1
-
-        return ExcelLayoutConfig(
-            header_rows=header_rows,
-            column_mappings=excel_mappings,
-            has_multi_level_headers=False,
-            units_note_position="top",
-            table_start_row=table_start_row,
-            data_start_row=data_start_row,
+        """Generate Excel layout configuration for income statement.
+
+        The returned config is cached and shared: treat it as read-only.
+        """
+        return _income_statement_layout_config(
+            self.company_name,
+            self.document_title,
+            self.units_note,
+            tuple(self.reporting_periods),
         )
@@ -0,0 +1,22 @@
+"""
+Union of all concrete financial statement schemas.
+
+Use FinancialStatementSchema wherever a statement of any type is validated
+(request bodies, stored extraction results). The union is tagged on
+document_type, so pydantic picks the schema from the tag in one step instead
+of trying each schema in turn. Every schema added to it must declare
+document_type as a Literal of its FinancialStatementType value.
+"""
+
+from typing import Annotated
+
+from pydantic import Field
+
+from .income_statement_schema import IncomeStatementSchema
+
+FinancialStatementSchema = Annotated[
+    # A single schema is still validated as a tagged union; extend with
+    # `IncomeStatementSchema | BalanceSheetSchema | ...` as schemas are added
+    IncomeStatementSchema,
+    Field(discriminator="document_type"),
+]
@@ -0,0 +1 @@
+"""Tests for financial statement schemas."""
@@ -0,0 +1,39 @@
+"""Tests for base financial schema classes."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas import HierarchicalLineItem
+from app.schemas.base_schema import MAX_LINE_ITEM_DEPTH
+
+
+def nested_item(depth: int) -> dict:
+    """Build line item input nested ``depth`` levels deep."""
+    item = {"account_name": "Leaf", "values": {"2024": "1"}}
+    for level in range(depth - 1):
+        item = {"account_name": f"Level {level}", "values": {}, "sub_items": [item]}
+    return item
+
+
+class TestHierarchicalLineItem:
+    """Test hierarchical line items."""
+
+    def test_sub_items_default(self):
+        """Test items without sub-items default to None rather than a shared list."""
+        assert HierarchicalLineItem(account_name="Cash", values={}).sub_items is None
+
+    def test_nested_items(self):
+        """Test sub-items are validated as line items at every level."""
+        item = HierarchicalLineItem.model_validate(nested_item(3))
+
+        assert item.sub_items[0].sub_items[0].account_name == "Leaf"
+
+    def test_max_depth(self):
+        """Test trees up to MAX_LINE_ITEM_DEPTH levels validate and deeper ones are rejected."""
+        HierarchicalLineItem.model_validate(nested_item(MAX_LINE_ITEM_DEPTH))
+
+        with pytest.raises(ValidationError, match="nested deeper than"):
+            HierarchicalLineItem.model_validate(nested_item(MAX_LINE_ITEM_DEPTH + 1))
+
+        # The depth count is reset after a failed validation
+        HierarchicalLineItem.model_validate(nested_item(2))
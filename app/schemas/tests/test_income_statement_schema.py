@@ -0,0 +1,196 @@
+"""Tests for the income statement schema."""
+
+from typing import get_args
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas import (
+    BaseFinancialSchema,
+    ExcelLayoutConfig,
+    FinancialStatementType,
+    FinancialStatementTypeStr,
+    IncomeStatementLineItem,
+    IncomeStatementSchema,
+)
+
+
+def make_statement(**overrides) -> IncomeStatementSchema:
+    """Build a small income statement, with optional field overrides."""
+    revenue = IncomeStatementLineItem(
+        account_name="Total revenue",
+        values={"2024": "10,918", "2023": "11,716"},
+        account_category="revenue",
+    )
+    net_income = IncomeStatementLineItem(
+        account_name="Net income",
+        values={"2024": "2,796", "2023": "4,141"},
+        account_category="income",
+    )
+    fields = {
+        "company_name": "Acme Corp",
+        "document_title": "Consolidated Statements of Income",
+        "reporting_periods": ["2024", "2023"],
+        "units_note": "In millions",
+        "line_items": [revenue, net_income],
+        "revenue_items": [revenue],
+        "net_income_items": [net_income],
+    }
+    fields.update(overrides)
+    return IncomeStatementSchema(**fields)
+
+
+class TestExcelLayoutConfig:
+    """Test Excel layout generation."""
+
+    def test_layout_config(self):
+        """Test headers, one currency column per period, and table positions."""
+        layout = make_statement().get_excel_layout_config()
+
+        assert layout.header_rows == [
+            "Acme Corp",
+            "Consolidated Statements of Income",
+            "In millions",
+        ]
+        assert [m.main_header for m in layout.column_mappings] == ["2024", "2023"]
+        assert [m.excel_column_index for m in layout.column_mappings] == [2, 3]
+        assert all(m.data_type == "currency" for m in layout.column_mappings)
+        assert (layout.table_start_row, layout.data_start_row) == (5, 6)
+
+    def test_layout_config_matches_validated(self):
+        """Test the unvalidated (model_construct) layout equals a fully validated one."""
+        layout = make_statement().get_excel_layout_config()
+
+        assert ExcelLayoutConfig.model_validate(layout.model_dump()) == layout
+
+    def test_layout_config_cached_per_inputs(self):
+        """Test statements with the same headers and periods share one layout."""
+        first = make_statement().get_excel_layout_config()
+
+        assert make_statement().get_excel_layout_config() is first
+        other = make_statement(reporting_periods=["2024"]).get_excel_layout_config()
+        assert other is not first
+        assert len(other.column_mappings) == 1
+
+    def test_default_layout_config(self):
+        """Test the base schema layout has header rows and no column mappings."""
+        statement = BaseFinancialSchema(
+            company_name="Acme Corp",
+            document_title="Balance Sheet",
+            document_type="balance_sheet",
+            reporting_periods=["2024"],
+        )
+
+        layout = statement.get_excel_layout_config()
+
+        assert layout.header_rows == ["Acme Corp", "Balance Sheet"]
+        assert layout.column_mappings == []
+        assert statement.get_excel_layout_config() is layout
+
+
+class TestMetricLookups:
+    """Test revenue and net income lookups."""
+
+    @pytest.mark.parametrize(
+        ("period", "revenue", "net_income"),
+        [("2024", "10,918", "2,796"), ("2023", "11,716", "4,141"), ("2022", None, None)],
+    )
+    def test_lookups(self, period, revenue, net_income):
+        """Test totals are looked up by period, None for unknown periods."""
+        statement = make_statement()
+
+        assert statement.get_revenue_total(period) == revenue
+        assert statement.get_net_income(period) == net_income
+
+    def test_default_item_lists_not_shared(self):
+        """Test omitted item lists are fresh per statement."""
+        first = make_statement()
+        first.expense_items.append(first.line_items[0])
+
+        assert make_statement().expense_items == []
+
+
+class TestSchemaConfig:
+    """Test model configuration inherited from BaseFinancialSchema."""
+
+    def test_enum_values_and_extra_fields(self):
+        """Test document_type is stored as its value and extra metadata is kept."""
+        statement = make_statement(consolidation_source="hybrid")
+
+        assert statement.document_type == "income_statement"
+        assert statement.model_dump()["consolidation_source"] == "hybrid"
+
+    def test_document_type_literal_matches_enum(self):
+        """Test the document_type Literal accepts exactly the FinancialStatementType values."""
+        assert set(get_args(FinancialStatementTypeStr)) == {t.value for t in FinancialStatementType}
+
+    def test_document_type_validated(self):
+        """Test document_type is a plain string and unknown types are rejected."""
+        statement = make_statement(document_type="income_statement")
+
+        assert type(statement.document_type) is str
+        assert FinancialStatementType.from_str(statement.document_type) is (
+            FinancialStatementType.INCOME_STATEMENT
+        )
+        with pytest.raises(ValidationError):
+            make_statement(document_type="profit_and_loss")
+
+
+class TestFromJsonBytes:
+    """Test parsing statements from JSON."""
+
+    def test_round_trip(self):
+        """Test a statement serialized to JSON parses back to an equal statement."""
+        statement = make_statement()
+
+        parsed = IncomeStatementSchema.from_json_bytes(statement.model_dump_json().encode())
+
+        assert isinstance(parsed, IncomeStatementSchema)
+        assert parsed == statement
+        assert parsed.get_revenue_total("2024") == "10,918"
+
+    def test_invalid_json(self):
+        """Test malformed JSON raises a validation error."""
+        with pytest.raises(ValidationError):
+            IncomeStatementSchema.from_json_bytes(b'{"company_name": ')
+
+
+class TestValidateLineItems:
+    """Test batch line item validation."""
+
+    def test_validate_line_items(self):
+        """Test raw rows are validated into line items in order."""
+        items = IncomeStatementSchema.validate_line_items(
+            [
+                {"account_name": "Revenue", "values": {"2024": "10"}},
+                {"account_name": "Net income", "values": {}, "is_calculated": True},
+            ]
+        )
+
+        assert [type(i) for i in items] == [IncomeStatementLineItem] * 2
+        assert [i.account_name for i in items] == ["Revenue", "Net income"]
+        assert items[1].is_calculated is True
+
+    def test_validate_line_items_invalid_row(self):
+        """Test a malformed row fails validation with its index in the error."""
+        with pytest.raises(ValidationError, match=r"1\.values"):
+            IncomeStatementSchema.validate_line_items(
+                [{"account_name": "Revenue", "values": {}}, {"account_name": "Cost"}]
+            )
+
+
+class TestLineItem:
+    """Test income statement line items."""
+
+    def test_account_name_lower(self):
+        """Test the lowercase name is kept out of dumps and follows renames and copies."""
+        item = IncomeStatementLineItem(account_name="Net Income", values={})
+
+        assert item.account_name_lower == "net income"
+        assert "account_name_lower" not in item.model_dump()
+
+        item.account_name = "Total Revenue"
+        assert item.account_name_lower == "total revenue"
+
+        copied = item.model_copy(update={"account_name": "Net income"})
+        assert copied.account_name_lower == "net income"
@@ -0,0 +1,33 @@
+"""Tests for the financial statement union."""
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from app.schemas import FinancialStatementSchema, IncomeStatementSchema
+
+statements_adapter = TypeAdapter(list[FinancialStatementSchema])
+
+
+def statement_data(document_type: str) -> dict:
+    """Build minimal statement input of the given type."""
+    return {
+        "company_name": "Acme Corp",
+        "document_title": "Statement",
+        "document_type": document_type,
+        "reporting_periods": ["2024"],
+        "line_items": [],
+    }
+
+
+def test_dispatches_on_document_type():
+    """Test statements are validated as the schema matching their document_type."""
+    (statement,) = statements_adapter.validate_python([statement_data("income_statement")])
+
+    assert isinstance(statement, IncomeStatementSchema)
+
+
+@pytest.mark.parametrize("document_type", ["balance_sheet", "profit_and_loss"])
+def test_rejects_unsupported_document_type(document_type):
+    """Test statements without a matching schema fail on the tag alone."""
+    with pytest.raises(ValidationError, match="union_tag_invalid"):
+        statements_adapter.validate_python([statement_data(document_type)])
@@ -0,0 +1,63 @@
+"""Response classes for API routes.
+
+This module provides:
+- EnvelopeResponse: encodes a response schema straight to JSON bytes
+- CoreJSONResponse: the app's default response class, encoding with pydantic-core
+
+Example:
+    from app.shared.responses import EnvelopeResponse
+    from app.shared.schemas import DataResponse
+
+    @router.get("/items/{item_id}", response_model=DataResponse, response_class=EnvelopeResponse)
+    async def get_item(item_id: int) -> EnvelopeResponse:
+        return EnvelopeResponse(DataResponse(data=ItemSchema.model_validate(item)))
+"""
+
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+
+class EnvelopeResponse(JSONResponse):
+    """JSON response rendered from a Pydantic envelope with pydantic-core.
+
+    Returning a Response instance skips FastAPI's response_model validation and
+    ``jsonable_encoder`` pass; the envelope is serialized once, in Rust, directly
+    to bytes. Keep ``response_model`` on the route so OpenAPI docs still describe
+    the envelope.
+    """
+
+    def render(self, content: BaseModel) -> bytes:
+        """Serialize the envelope to JSON bytes.
+
+        Args:
+            content: Response envelope (e.g. DataResponse)
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return to_json(content)
+
+
+class CoreJSONResponse(JSONResponse):
+    """JSON response encoded with pydantic-core instead of the stdlib json module.
+
+    Used as the app's ``default_response_class``: routes that return plain
+    data (after FastAPI's ``jsonable_encoder`` pass) are serialized in Rust,
+    which matters for large text bodies. Output matches Starlette's compact,
+    non-ASCII-escaping JSONResponse, except that NaN/Infinity become ``null``
+    instead of raising.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the content to JSON bytes.
+
+        Args:
+            content: JSON-compatible response content
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return to_json(content, inf_nan_mode="null")
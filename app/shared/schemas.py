@@ -16,9 +16,12 @@ Example:
 """
 
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.shared.models import utcnow
+
 
 class BaseSchema(BaseModel):
     """Base Pydantic schema with common configuration.
@@ -140,11 +143,25 @@ class BaseResponse(BaseSchema):
     success: bool = Field(default=True, description="Whether the operation was successful")
     message: str | None = Field(default=None, description="Optional message about the operation")
     timestamp: datetime = Field(
-        default_factory=datetime.now,
-        description="When the response was generated",
+        default_factory=utcnow,
+        description="When the response was generated (UTC)",
     )
 
 
+class DataResponse(BaseResponse):
+    """Response envelope carrying a payload in ``data``.
+
+    ``data`` may hold schema instances directly; they are serialized by
+    pydantic-core when the envelope is encoded, so routes don't need to
+    ``model_dump()`` them first.
+
+    Example:
+        return EnvelopeResponse(DataResponse(data=JobSchema.model_validate(job)))
+    """
+
+    data: Any = Field(default=None, description="Response payload")
+
+
 class ErrorResponse(BaseSchema):
     """Standard error response schema.
 
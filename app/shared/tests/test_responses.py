@@ -0,0 +1,56 @@
+"""Tests for shared response classes."""
+
+import json
+from datetime import UTC, datetime
+
+from starlette.responses import JSONResponse
+
+from app.shared.responses import CoreJSONResponse, EnvelopeResponse
+from app.shared.schemas import BaseSchema, DataResponse
+
+
+class SamplePayload(BaseSchema):
+    """Sample payload schema nested in the envelope."""
+
+    id: int
+    created_at: datetime
+
+
+def test_envelope_response_serializes_nested_schema():
+    """Test nested schemas in data are encoded without model_dump().
+
+    Verifies:
+    - Content type is JSON
+    - Envelope fields and nested payload are present
+    - Datetimes are encoded as ISO strings
+    """
+    payload = SamplePayload(id=1, created_at=datetime(2025, 1, 1, tzinfo=UTC))
+    response = EnvelopeResponse(DataResponse(message="ok", data=[payload]))
+
+    body = json.loads(response.body)
+
+    assert response.media_type == "application/json"
+    assert body["success"] is True
+    assert body["message"] == "ok"
+    assert body["data"] == [{"id": 1, "created_at": "2025-01-01T00:00:00Z"}]
+
+
+def test_envelope_response_status_code():
+    """Test status code is passed through to the response."""
+    response = EnvelopeResponse(DataResponse(), status_code=201)
+
+    assert response.status_code == 201
+    assert json.loads(response.body)["data"] is None
+
+
+def test_core_json_response_matches_starlette():
+    """Test the default response class encodes like Starlette's JSONResponse.
+
+    Verifies:
+    - Compact separators and unescaped non-ASCII text match JSONResponse
+    - Non-finite floats are encoded as null
+    """
+    content = {"text": "Résumé — Q1", "items": [1, 2.5, None, True]}
+
+    assert CoreJSONResponse(content).body == JSONResponse(content).body
+    assert json.loads(CoreJSONResponse({"ratio": float("nan")}).body) == {"ratio": None}
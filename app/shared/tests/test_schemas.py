@@ -17,6 +17,7 @@ from sqlalchemy.orm import Mapped, mapped_column
 from app.core.database import Base
 from app.shared.models import TimestampMixin
 from app.shared.schemas import (
+    BaseResponse,
     BaseSchema,
     ErrorResponse,
     PaginationParams,
@@ -169,6 +170,19 @@ def test_error_response_schema():
     assert error_dict["error_code"] == "USER_NOT_FOUND"
 
 
+def test_base_response_timestamp_is_utc():
+    """Test BaseResponse timestamps are timezone-aware UTC.
+
+    Verifies:
+    - timestamp defaults to an aware datetime in UTC
+    - JSON output carries the UTC offset
+    """
+    response = BaseResponse()
+
+    assert response.timestamp.tzinfo is UTC
+    assert response.model_dump_json().endswith('Z"}')
+
+
 def test_base_schema_validation_on_assignment():
     """Test that BaseSchema validates fields on assignment.
 
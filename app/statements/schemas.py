@@ -196,7 +196,7 @@ class StatementSchema(BaseModel):
 class StatementWithLineItems(StatementSchema):
     """Schema for statement with line items."""
 
-    line_items: list[LineItemSchema] = []
+    line_items: list[LineItemSchema] = Field(default_factory=list)
 
     model_config = {"from_attributes": True}
 